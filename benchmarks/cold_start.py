@@ -0,0 +1,320 @@
+"""Import-time and cold-start benchmarks for the Glean Agent Toolkit.
+
+Every scenario runs in a fresh interpreter so that module caches don't hide
+import cost. Wall-clock time is measured inside the subprocess around the
+statement under test, and one extra run under ``-X importtime`` attributes the
+cost to individual modules.
+
+Usage:
+    python benchmarks/cold_start.py
+    python benchmarks/cold_start.py --repeat 7 --top 15
+    python benchmarks/cold_start.py --budget toolkit=200 --budget convert:openai=1500
+    python benchmarks/cold_start.py --json results.json
+
+Budgets are read from ``cold_start_budgets.json`` next to this script unless
+``--budgets`` points elsewhere; ``--budget`` overrides individual entries. The
+process exits with status 1 when a scenario's median exceeds its budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+import textwrap
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_BUDGETS_PATH = pathlib.Path(__file__).with_name("cold_start_budgets.json")
+
+ADAPTERS = ("openai", "langchain", "crewai", "adk")
+
+_SKIP_EXIT_CODE = 3
+_START_MARKER = "--- cold-start: timing ---"
+
+_TIMER = textwrap.dedent(
+    """\
+    import sys, time
+    {setup}
+    print({marker!r}, file=sys.stderr, flush=True)
+    _start = time.perf_counter()
+    try:
+        {statement}
+    except ImportError as exc:
+        print(f"skipped: {{exc}}", file=sys.stderr)
+        sys.exit({skip})
+    print(f"elapsed_ms={{(time.perf_counter() - _start) * 1000:.3f}}")
+    """
+)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A cold-start scenario.
+
+    Attributes:
+        name: Scenario name, used to look up its budget
+        statement: Statement whose wall-clock time is measured
+        setup: Statement run before timing starts
+    """
+
+    name: str
+    statement: str
+    setup: str = ""
+
+
+@dataclass(frozen=True)
+class ModuleCost:
+    """Import cost of one module, as reported by ``-X importtime``.
+
+    Attributes:
+        name: Fully qualified module name
+        self_us: Time spent importing the module itself in microseconds
+        cumulative_us: Time including the module's own imports in microseconds
+    """
+
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class ScenarioResult:
+    """Timing results for one scenario.
+
+    Attributes:
+        name: Scenario name
+        samples_ms: Wall-clock samples in milliseconds
+        budget_ms: Budget in milliseconds, if any
+        skipped: Reason the scenario was skipped, if it was
+        modules: Modules imported by the scenario, slowest first
+    """
+
+    name: str
+    samples_ms: list[float] = field(default_factory=list)
+    budget_ms: float | None = None
+    skipped: str | None = None
+    modules: list[ModuleCost] = field(default_factory=list)
+
+    @property
+    def median_ms(self) -> float | None:
+        """Median wall-clock time in milliseconds."""
+        return statistics.median(self.samples_ms) if self.samples_ms else None
+
+    @property
+    def over_budget(self) -> bool:
+        """Whether the median exceeds the budget."""
+        median = self.median_ms
+        return self.budget_ms is not None and median is not None and median > self.budget_ms
+
+    def to_dict(self, top: int) -> dict[str, Any]:
+        """Serialize the result.
+
+        Args:
+            top: Number of modules to include
+
+        Returns:
+            JSON-serializable result
+        """
+        return {
+            "name": self.name,
+            "median_ms": self.median_ms,
+            "samples_ms": self.samples_ms,
+            "budget_ms": self.budget_ms,
+            "over_budget": self.over_budget,
+            "skipped": self.skipped,
+            "modules": [
+                {"name": m.name, "self_us": m.self_us, "cumulative_us": m.cumulative_us}
+                for m in self.modules[:top]
+            ],
+        }
+
+
+SCENARIOS: list[Scenario] = [
+    Scenario("toolkit", "import glean.agent_toolkit"),
+    Scenario("tools", "import glean.agent_toolkit.tools"),
+    Scenario("tool:glean_search", "from glean.agent_toolkit.tools import glean_search"),
+    *(
+        Scenario(
+            f"convert:{adapter}",
+            f"glean_search.as_{adapter}_tool()",
+            setup="from glean.agent_toolkit.tools import glean_search",
+        )
+        for adapter in ADAPTERS
+    ),
+]
+
+
+def parse_importtime(stderr: str) -> list[ModuleCost]:
+    """Parse the ``-X importtime`` lines emitted after the timing marker.
+
+    Args:
+        stderr: The interpreter's stderr
+
+    Returns:
+        Imported modules, ordered by self time, slowest first
+    """
+    _, _, timed = stderr.partition(_START_MARKER)
+    modules: list[ModuleCost] = []
+    for line in timed.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            continue  # column header
+        modules.append(ModuleCost(name.strip(), int(self_us), int(cumulative_us)))
+    return sorted(modules, key=lambda m: m.self_us, reverse=True)
+
+
+def run_once(scenario: Scenario, importtime: bool = False) -> tuple[float | None, str]:
+    """Run a scenario in a fresh interpreter.
+
+    Args:
+        scenario: The scenario to run
+        importtime: Whether to enable ``-X importtime``
+
+    Returns:
+        The elapsed milliseconds (``None`` if the scenario was skipped) and stderr
+
+    Raises:
+        RuntimeError: If the scenario fails
+    """
+    code = _TIMER.format(
+        setup=scenario.setup,
+        statement=scenario.statement,
+        marker=_START_MARKER,
+        skip=_SKIP_EXIT_CODE,
+    )
+    cmd = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", code]
+    proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+
+    if proc.returncode == _SKIP_EXIT_CODE:
+        return None, proc.stderr
+    if proc.returncode != 0:
+        raise RuntimeError(f"Scenario {scenario.name!r} failed:\n{proc.stderr}")
+
+    for line in proc.stdout.splitlines():
+        if line.startswith("elapsed_ms="):
+            return float(line.removeprefix("elapsed_ms=")), proc.stderr
+    raise RuntimeError(f"Scenario {scenario.name!r} produced no timing:\n{proc.stdout}")
+
+
+def run_scenario(scenario: Scenario, repeat: int, budget_ms: float | None) -> ScenarioResult:
+    """Run a scenario ``repeat`` times plus once under ``-X importtime``.
+
+    Args:
+        scenario: The scenario to run
+        repeat: Number of timed runs
+        budget_ms: Budget for the median, if any
+
+    Returns:
+        The scenario's results
+    """
+    result = ScenarioResult(scenario.name, budget_ms=budget_ms)
+    for _ in range(repeat):
+        elapsed, stderr = run_once(scenario)
+        if elapsed is None:
+            result.skipped = stderr.strip().splitlines()[-1].removeprefix("skipped: ")
+            return result
+        result.samples_ms.append(elapsed)
+
+    _, stderr = run_once(scenario, importtime=True)
+    result.modules = parse_importtime(stderr)
+    return result
+
+
+def load_budgets(path: pathlib.Path | None, overrides: list[str]) -> dict[str, float]:
+    """Load budgets from a JSON file and apply ``name=ms`` overrides.
+
+    Args:
+        path: JSON file mapping scenario names to milliseconds, if any
+        overrides: ``name=ms`` strings
+
+    Returns:
+        Budgets in milliseconds keyed by scenario name
+
+    Raises:
+        ValueError: If an override is malformed
+    """
+    budgets: dict[str, float] = {}
+    if path is not None and path.exists():
+        budgets.update({name: float(ms) for name, ms in json.loads(path.read_text()).items()})
+    for override in overrides:
+        name, sep, ms = override.partition("=")
+        if not sep:
+            raise ValueError(f"Budget override must look like name=ms, got {override!r}")
+        budgets[name] = float(ms)
+    return budgets
+
+
+def format_report(results: list[ScenarioResult], top: int) -> str:
+    """Format results as a human-readable report.
+
+    Args:
+        results: Scenario results
+        top: Number of modules to list per scenario
+
+    Returns:
+        The report
+    """
+    lines = [f"{'scenario':<20} {'median ms':>10} {'budget ms':>10}  status"]
+    for result in results:
+        budget = f"{result.budget_ms:.0f}" if result.budget_ms is not None else "-"
+        if result.skipped is not None:
+            lines.append(f"{result.name:<20} {'-':>10} {budget:>10}  skipped ({result.skipped})")
+            continue
+        status = "OVER BUDGET" if result.over_budget else "ok"
+        lines.append(f"{result.name:<20} {result.median_ms:>10.1f} {budget:>10}  {status}")
+
+    for result in results:
+        if not result.modules:
+            continue
+        lines.append("")
+        lines.append(f"{result.name}: slowest imports (self / cumulative ms)")
+        for module in result.modules[:top]:
+            self_ms, cumulative_ms = module.self_us / 1000, module.cumulative_us / 1000
+            lines.append(f"  {self_ms:>8.1f} {cumulative_ms:>8.1f}  {module.name}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the cold-start benchmarks.
+
+    Args:
+        argv: Command-line arguments
+
+    Returns:
+        Process exit status
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per scenario")
+    parser.add_argument("--top", type=int, default=10, help="modules to report per scenario")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        default=[],
+        help="only run the named scenario (repeatable)",
+    )
+    parser.add_argument("--budgets", type=pathlib.Path, default=DEFAULT_BUDGETS_PATH)
+    parser.add_argument(
+        "--budget", action="append", default=[], metavar="NAME=MS", help="override a budget"
+    )
+    parser.add_argument("--json", type=pathlib.Path, help="also write results as JSON")
+    args = parser.parse_args(argv)
+
+    budgets = load_budgets(args.budgets, args.budget)
+    scenarios = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+    results = [run_scenario(s, args.repeat, budgets.get(s.name)) for s in scenarios]
+
+    print(format_report(results, args.top))
+    if args.json is not None:
+        args.json.write_text(json.dumps([r.to_dict(args.top) for r in results], indent=2))
+
+    return 1 if any(r.over_budget for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+"""Micro-benchmarks for the decorator, registry and adapter hot paths.
+
+Each benchmark times a small operation in-process with :mod:`timeit`: the
+number of calls per sample is calibrated to take about 0.2 s, and the fastest
+of ``--repeat`` samples is reported per call, since it is the sample least
+disturbed by the rest of the machine.
+
+Usage:
+    python benchmarks/micro.py
+    python benchmarks/micro.py --benchmark registry:get --repeat 9
+    python benchmarks/micro.py --save baseline.json
+    python benchmarks/micro.py --compare baseline.json --threshold 0.2
+
+To compare two commits, save a baseline on the first and compare against it
+on the second. ``--compare`` exits with status 1 when a benchmark is slower
+than its baseline by more than ``--threshold``. Adapter benchmarks are skipped
+when their framework isn't installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel
+
+from glean.agent_toolkit.decorators import tool_spec
+from glean.agent_toolkit.registry import Registry
+from glean.agent_toolkit.spec import ToolSpec
+
+ADAPTERS = ("openai", "langchain", "crewai", "adk")
+
+DEFAULT_THRESHOLD = 0.25
+
+# Registry size for the lookup and listing benchmarks; larger than any real
+# toolkit so that per-tool costs show up.
+REGISTRY_SIZE = 100
+
+
+class _Result(BaseModel):
+    """Output model of the benchmark tool."""
+
+    title: str
+    score: float
+
+
+def _search(query: str, limit: int = 10, exact: bool = False) -> _Result:
+    """Stand-in tool implementation with a typical signature."""
+    return _Result(title=query, score=limit)
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A micro-benchmark.
+
+    Attributes:
+        name: Benchmark name, used to match baselines
+        prepare: Builds the statement to time; may raise ImportError to skip
+    """
+
+    name: str
+    prepare: Callable[[], Callable[[], object]]
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing results for one benchmark.
+
+    Attributes:
+        name: Benchmark name
+        samples_ns: Nanoseconds per call for each sample
+        skipped: Reason the benchmark was skipped, if it was
+        baseline_ns: Nanoseconds per call in the baseline, if compared
+    """
+
+    name: str
+    samples_ns: list[float] = field(default_factory=list)
+    skipped: str | None = None
+    baseline_ns: float | None = None
+
+    @property
+    def best_ns(self) -> float | None:
+        """Fastest sample in nanoseconds per call."""
+        return min(self.samples_ns) if self.samples_ns else None
+
+    @property
+    def median_ns(self) -> float | None:
+        """Median sample in nanoseconds per call."""
+        return statistics.median(self.samples_ns) if self.samples_ns else None
+
+    @property
+    def change(self) -> float | None:
+        """Relative change of the fastest sample against the baseline."""
+        if self.baseline_ns is None or self.best_ns is None or self.baseline_ns <= 0:
+            return None
+        return self.best_ns / self.baseline_ns - 1
+
+    def regressed(self, threshold: float) -> bool:
+        """Whether the benchmark is slower than its baseline by more than ``threshold``.
+
+        Args:
+            threshold: Allowed relative slowdown, e.g. 0.25 for 25%
+
+        Returns:
+            True if the benchmark regressed
+        """
+        change = self.change
+        return change is not None and change > threshold
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the result.
+
+        Returns:
+            JSON-serializable result
+        """
+        return {
+            "name": self.name,
+            "best_ns": self.best_ns,
+            "median_ns": self.median_ns,
+            "samples_ns": self.samples_ns,
+            "skipped": self.skipped,
+        }
+
+
+def _decorate() -> Callable[[], object]:
+    decorate = tool_spec(name="bench_search", description="Search.", output_model=_Result)
+    return lambda: decorate(_search)
+
+
+def _call_raw() -> Callable[[], object]:
+    return lambda: _search("q", limit=5)
+
+
+def _call_wrapper() -> Callable[[], object]:
+    wrapped = tool_spec(name="bench_search", description="Search.")(_search)
+    return lambda: wrapped("q", limit=5)
+
+
+def _call_wrapper_timeout() -> Callable[[], object]:
+    wrapped = tool_spec(name="bench_search", description="Search.", timeout=30)(_search)
+    return lambda: wrapped("q", limit=5)
+
+
+def _spec(name: str) -> ToolSpec:
+    wrapped = tool_spec(name=name, description="Search.", output_model=_Result)(_search)
+    return wrapped.tool_spec
+
+
+def _filled_registry() -> Registry:
+    registry = Registry()
+    template = _spec("bench_search")
+    for index in range(REGISTRY_SIZE):
+        registry.register(
+            ToolSpec(
+                name=f"tool_{index}",
+                description=template.description,
+                function=template.function,
+                input_schema=template.input_schema,
+                output_schema=template.output_schema,
+            )
+        )
+    return registry
+
+
+def _registry_register() -> Callable[[], object]:
+    registry = _filled_registry()
+    spec = _spec("bench_search")
+    return lambda: registry.register(spec)
+
+
+def _registry_get() -> Callable[[], object]:
+    registry = _filled_registry()
+    name = f"tool_{REGISTRY_SIZE // 2}"
+    return lambda: registry.get(name)
+
+
+def _registry_get_missing() -> Callable[[], object]:
+    registry = _filled_registry()
+    return lambda: registry.get("missing")
+
+
+def _registry_list() -> Callable[[], object]:
+    registry = _filled_registry()
+    return registry.list
+
+
+def _to_tool(adapter: str) -> Callable[[], Callable[[], object]]:
+    def prepare() -> Callable[[], object]:
+        from glean.agent_toolkit.adapters import (
+            ADKAdapter,
+            CrewAIAdapter,
+            LangChainAdapter,
+            OpenAIAdapter,
+        )
+
+        adapter_class = {
+            "openai": OpenAIAdapter,
+            "langchain": LangChainAdapter,
+            "crewai": CrewAIAdapter,
+            "adk": ADKAdapter,
+        }[adapter]
+        # Construction raises ImportError when the framework is missing.
+        return adapter_class(_spec("bench_search")).to_tool
+
+    return prepare
+
+
+BENCHMARKS: list[Benchmark] = [
+    Benchmark("decorate", _decorate),
+    Benchmark("call:raw", _call_raw),
+    Benchmark("call:wrapper", _call_wrapper),
+    Benchmark("call:wrapper+timeout", _call_wrapper_timeout),
+    Benchmark("registry:register", _registry_register),
+    Benchmark("registry:get", _registry_get),
+    Benchmark("registry:get-missing", _registry_get_missing),
+    Benchmark("registry:list", _registry_list),
+    *(Benchmark(f"to_tool:{adapter}", _to_tool(adapter)) for adapter in ADAPTERS),
+]
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int) -> BenchmarkResult:
+    """Time a benchmark.
+
+    Args:
+        benchmark: The benchmark to run
+        repeat: Number of samples
+
+    Returns:
+        The benchmark's results
+    """
+    result = BenchmarkResult(benchmark.name)
+    try:
+        statement = benchmark.prepare()
+    except ImportError as exc:
+        result.skipped = str(exc).split(". ")[0]
+        return result
+
+    timer = timeit.Timer(statement)
+    number, _ = timer.autorange()
+    number = max(1, number)
+    result.samples_ns = [
+        elapsed / number * 1e9 for elapsed in timer.repeat(repeat=repeat, number=number)
+    ]
+    return result
+
+
+def load_baseline(path: pathlib.Path) -> dict[str, float]:
+    """Load the per-call times saved with ``--save``.
+
+    Args:
+        path: The baseline file
+
+    Returns:
+        Nanoseconds per call keyed by benchmark name
+    """
+    data = json.loads(path.read_text())
+    return {
+        entry["name"]: entry["best_ns"]
+        for entry in data["results"]
+        if entry.get("best_ns") is not None
+    }
+
+
+def format_report(results: list[BenchmarkResult], threshold: float) -> str:
+    """Format results as a human-readable report.
+
+    Args:
+        results: Benchmark results
+        threshold: Allowed relative slowdown against the baseline
+
+    Returns:
+        The report
+    """
+    lines = [f"{'benchmark':<24} {'best':>12} {'median':>12} {'baseline':>12}  status"]
+    for result in results:
+        if result.best_ns is None or result.median_ns is None:
+            lines.append(
+                f"{result.name:<24} {'-':>12} {'-':>12} {'-':>12}  skipped ({result.skipped})"
+            )
+            continue
+        baseline = _format_ns(result.baseline_ns) if result.baseline_ns is not None else "-"
+        change = result.change
+        if change is None:
+            status = ""
+        elif result.regressed(threshold):
+            status = f"REGRESSED {change:+.0%}"
+        else:
+            status = f"ok {change:+.0%}"
+        lines.append(
+            f"{result.name:<24} {_format_ns(result.best_ns):>12} "
+            f"{_format_ns(result.median_ns):>12} {baseline:>12}  {status}"
+        )
+    return "\n".join(lines)
+
+
+def _format_ns(ns: float) -> str:
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f} ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.2f} us"
+    return f"{ns:.0f} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the micro-benchmarks.
+
+    Args:
+        argv: Command-line arguments
+
+    Returns:
+        Process exit status
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="samples per benchmark")
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        default=[],
+        help="only run the named benchmark (repeatable)",
+    )
+    parser.add_argument("--save", type=pathlib.Path, help="write results as a baseline")
+    parser.add_argument("--compare", type=pathlib.Path, help="compare against a saved baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative slowdown that counts as a regression (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    benchmarks = [b for b in BENCHMARKS if not args.benchmark or b.name in args.benchmark]
+    results = [run_benchmark(b, args.repeat) for b in benchmarks]
+
+    if args.compare is not None:
+        baseline = load_baseline(args.compare)
+        for result in results:
+            result.baseline_ns = baseline.get(result.name)
+
+    print(format_report(results, args.threshold))
+    if args.save is not None:
+        payload = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": [r.to_dict() for r in results],
+        }
+        args.save.write_text(json.dumps(payload, indent=2))
+
+    return 1 if any(r.regressed(args.threshold) for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,37 @@
-"""Adapters for converting tool specifications to framework-specific formats."""
+"""Adapters for converting tool specifications to framework-specific formats.
 
-from pydantic import BaseModel
+Adapter modules are imported on first attribute access, so that importing this
+package doesn't pull in every agent framework.
+"""
 
-from glean.agent_toolkit.adapters.adk import ADKAdapter
-from glean.agent_toolkit.adapters.base import BaseAdapter
-from glean.agent_toolkit.adapters.crewai import CrewAIAdapter
-from glean.agent_toolkit.adapters.langchain import LangChainAdapter
-from glean.agent_toolkit.adapters.openai import (
-    OpenAIAdapter,
-    OpenAIFunctionDef,
-    OpenAIToolDef,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from glean.agent_toolkit.adapters.adk import ADKAdapter
+    from glean.agent_toolkit.adapters.base import BaseAdapter
+    from glean.agent_toolkit.adapters.crewai import CrewAIAdapter
+    from glean.agent_toolkit.adapters.langchain import LangChainAdapter
+    from glean.agent_toolkit.adapters.openai import (
+        OpenAIAdapter,
+        OpenAIFunctionDef,
+        OpenAIToolDef,
+    )
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "BaseAdapter": "glean.agent_toolkit.adapters.base",
+    "ADKAdapter": "glean.agent_toolkit.adapters.adk",
+    "CrewAIAdapter": "glean.agent_toolkit.adapters.crewai",
+    "LangChainAdapter": "glean.agent_toolkit.adapters.langchain",
+    "OpenAIAdapter": "glean.agent_toolkit.adapters.openai",
+    "OpenAIToolDef": "glean.agent_toolkit.adapters.openai",
+    "OpenAIFunctionDef": "glean.agent_toolkit.adapters.openai",
+    "BaseModel": "pydantic",
+}
+
+_SUBMODULES = frozenset({"adk", "base", "crewai", "langchain", "openai"})
 
 __all__ = [
     "BaseAdapter",
@@ -22,3 +43,36 @@ __all__ = [
     "OpenAIFunctionDef",
     "BaseModel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import adapter classes and modules on first access.
+
+    Args:
+        name: The attribute name
+
+    Returns:
+        The requested attribute
+
+    Raises:
+        AttributeError: If the attribute doesn't exist
+    """
+    if name in _SUBMODULES:
+        return import_module(f"{__name__}.{name}")
+
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including lazily imported ones.
+
+    Returns:
+        The attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
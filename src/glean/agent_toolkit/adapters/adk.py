@@ -3,7 +3,7 @@
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, TypeAlias
 
-from glean.agent_toolkit.adapters.base import BaseAdapter
+from glean.agent_toolkit.adapters.base import BaseAdapter, instrumented
 from glean.agent_toolkit.spec import ToolSpec
 
 if TYPE_CHECKING:
@@ -74,7 +74,9 @@ class ADKAdapter(BaseAdapter["AdkFunctionTool"]):
         if not func.__doc__:
             func.__doc__ = self.tool_spec.description
 
-        tool = _RuntimeAdkFunctionTool(func=func)  # type: ignore[arg-type]
+        tool = _RuntimeAdkFunctionTool(
+            func=instrumented(func, "adk", self.tool_spec.name)  # type: ignore[arg-type]
+        )
 
         setattr(tool, "schema", self.tool_spec.input_schema)
 
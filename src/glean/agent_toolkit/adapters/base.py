@@ -1,12 +1,31 @@
 """Base adapter class for converting tool specifications to framework-specific formats."""
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
 
+from glean.agent_toolkit.runtime.metrics import measured
+from glean.agent_toolkit.runtime.tracing import traced
 from glean.agent_toolkit.spec import ToolSpec
 
 T = TypeVar("T")
 
+CallableT = TypeVar("CallableT", bound=Callable[..., Any])
+
+
+def instrumented(func: CallableT, adapter: str, tool_name: str) -> CallableT:
+    """Wrap a tool function so that each invocation through an adapter is traced and measured.
+
+    Args:
+        func: The tool function, sync or async
+        adapter: The adapter name, e.g. ``langchain``
+        tool_name: The registered tool name
+
+    Returns:
+        The wrapped function, with the same name, docstring and signature
+    """
+    return traced(measured(func, adapter, tool_name), adapter, tool_name)
+
 
 class BaseAdapter(Generic[T], ABC):
     """Base adapter for converting ToolSpec to framework-specific formats."""
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, Union, cast
 
 from pydantic import BaseModel
 
-from glean.agent_toolkit.adapters.base import BaseAdapter
+from glean.agent_toolkit.adapters.base import BaseAdapter, instrumented
 from glean.agent_toolkit.spec import ToolSpec
 
 if TYPE_CHECKING:
@@ -140,7 +140,7 @@ class CrewAIAdapter(BaseAdapter[CrewAIToolType]):
         tool = GleanCrewAITool(
             name=self.tool_spec.name,
             description=self.tool_spec.description,
-            function=self.tool_spec.function,
+            function=instrumented(self.tool_spec.function, "crewai", self.tool_spec.name),
             args_schema=created_args_schema,
         )
 
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, TypeAlias, Union, cast
 
 from pydantic import BaseModel
 
-from glean.agent_toolkit.adapters.base import BaseAdapter
+from glean.agent_toolkit.adapters.base import BaseAdapter, instrumented
 from glean.agent_toolkit.spec import ToolSpec
 
 if TYPE_CHECKING:
@@ -90,7 +90,7 @@ class LangChainAdapter(BaseAdapter[LangChainToolType]):
         return ToolClass(
             name=self.tool_spec.name,
             description=self.tool_spec.description,
-            func=self.tool_spec.function,
+            func=instrumented(self.tool_spec.function, "langchain", self.tool_spec.name),
             args_schema=self._create_args_schema(),
         )
 
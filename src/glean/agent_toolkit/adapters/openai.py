@@ -1,10 +1,16 @@
 """OpenAI adapter for converting tool specifications."""
 
+import asyncio
+import contextvars
+import functools
+import inspect
 import json
-from collections.abc import Callable
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, TypeAlias, TypedDict, Union
 
-from glean.agent_toolkit.adapters.base import BaseAdapter
+from glean.agent_toolkit.adapters.base import BaseAdapter, instrumented
 from glean.agent_toolkit.spec import ToolSpec
 
 if TYPE_CHECKING:
@@ -38,6 +44,55 @@ except ImportError:  # pragma: no cover
     HAS_OPENAI = False
 
 
+DEFAULT_MAX_WORKERS = 16
+
+_executor: ThreadPoolExecutor | None = None
+_executor_max_workers = DEFAULT_MAX_WORKERS
+_executor_lock = threading.Lock()
+
+
+def configure_executor(max_workers: int) -> None:
+    """Set the size of the shared executor used to run synchronous tools.
+
+    The current executor, if any, is shut down after its pending calls finish.
+
+    Args:
+        max_workers: Maximum number of synchronous tool calls run concurrently
+
+    Raises:
+        ValueError: If ``max_workers`` is less than 1
+    """
+    global _executor, _executor_max_workers
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    with _executor_lock:
+        previous = _executor
+        _executor = None
+        _executor_max_workers = max_workers
+
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def get_executor() -> Executor:
+    """Get the shared, bounded executor used to run synchronous tools.
+
+    Returns:
+        The shared executor
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_executor_max_workers,
+                thread_name_prefix="glean-openai-tool",
+            )
+        return _executor
+
+
 OpenAIFunctionTool: TypeAlias = _RealOpenAIFunctionTool | _FallbackOpenAIFunctionTool
 
 
@@ -62,13 +117,15 @@ class OpenAIToolDef(TypedDict):
 class OpenAIAdapter(BaseAdapter[OpenAIToolType]):
     """Adapter for OpenAI tools."""
 
-    def __init__(self, tool_spec: ToolSpec) -> None:
+    def __init__(self, tool_spec: ToolSpec, executor: Executor | None = None) -> None:
         """Initialize the adapter.
 
         Args:
             tool_spec: The tool specification
+            executor: Executor for synchronous tools; defaults to the shared executor
         """
         super().__init__(tool_spec)
+        self.executor = executor
         if not HAS_OPENAI:
             raise ImportError(
                 "OpenAI package is required for OpenAI adapter. "
@@ -113,17 +170,30 @@ class OpenAIAdapter(BaseAdapter[OpenAIToolType]):
     def to_agents_tool(self) -> OpenAIFunctionTool:
         """Convert to OpenAI Agents SDK FunctionTool.
 
+        Native coroutine tools are awaited directly; synchronous tools run on a
+        bounded executor so that they don't block the Agents runner's event loop.
+
         Returns:
             An OpenAI Agents SDK FunctionTool
         """
-        original_func = self.tool_spec.function
+        name = self.tool_spec.name
+        original_func = instrumented(self.tool_spec.function, "openai", name)
+        async_func: Callable[..., Awaitable[Any]] | None = self.tool_spec.async_function
+        if async_func is not None:
+            async_func = instrumented(async_func, "openai", name)
+        elif inspect.iscoroutinefunction(original_func):
+            async_func = original_func
 
         async def on_invoke_tool(ctx: Any, input_str: str) -> Any:
             """Function that invokes the tool with parameters."""
             try:
                 params = json.loads(input_str) if input_str else {}
-                result = original_func(**params)
-                return result
+                if async_func is not None:
+                    return await async_func(**params)
+
+                loop = asyncio.get_running_loop()
+                call = functools.partial(contextvars.copy_context().run, original_func, **params)
+                return await loop.run_in_executor(self.executor or get_executor(), call)
             except Exception as e:
                 return f"Error executing tool: {str(e)}"
 
@@ -2,12 +2,13 @@
 
 import functools
 import inspect
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any, Protocol, TypedDict, TypeVar, cast
 
 from pydantic import BaseModel
 
 from glean.agent_toolkit.registry import get_registry
+from glean.agent_toolkit.runtime.deadline import deadline
 from glean.agent_toolkit.spec import ToolSpec
 
 
@@ -20,6 +21,7 @@ class InputSchema(TypedDict):
 
 
 CallableT = Callable[..., Any]
+AsyncCallableT = TypeVar("AsyncCallableT", bound=Callable[..., Awaitable[Any]])
 
 
 class ToolSpecFunction(Protocol):
@@ -59,6 +61,17 @@ class ToolSpecFunction(Protocol):
         """
         ...
 
+    def async_variant(self, func: AsyncCallableT) -> AsyncCallableT:
+        """Register a native coroutine implementation of the tool.
+
+        Args:
+            func: Coroutine function with the same parameters as the tool
+
+        Returns:
+            The coroutine function, bounded by the tool's timeout
+        """
+        ...
+
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Call the function.
 
@@ -74,11 +87,46 @@ class ToolSpecFunction(Protocol):
     __name__: str
 
 
+def _bounded(func: Callable[..., Any], spec: ToolSpec) -> Callable[..., Any]:
+    """Run ``func`` under a deadline of the spec's current timeout.
+
+    The timeout is read on every call, so it can be set or changed after the
+    tool is declared; calls made while it is None run without a deadline.
+
+    Args:
+        func: The tool implementation, sync or async
+        spec: The tool specification whose ``timeout`` bounds each call
+
+    Returns:
+        A function with the same signature as ``func``
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def bounded_async(*args: Any, **kwargs: Any) -> Any:
+            if spec.timeout is None:
+                return await func(*args, **kwargs)
+            with deadline(spec.timeout):
+                return await func(*args, **kwargs)
+
+        return bounded_async
+
+    @functools.wraps(func)
+    def bounded(*args: Any, **kwargs: Any) -> Any:
+        if spec.timeout is None:
+            return func(*args, **kwargs)
+        with deadline(spec.timeout):
+            return func(*args, **kwargs)
+
+    return bounded
+
+
 def tool_spec(
     name: str,
     description: str,
     output_model: type[BaseModel] | None = None,
     version: str | None = None,
+    timeout: float | None = None,
 ) -> Callable[[CallableT], ToolSpecFunction]:
     """Decorator for registering a function as a tool.
 
@@ -87,6 +135,11 @@ def tool_spec(
         description: Description of the tool
         output_model: Optional Pydantic model for the output
         version: Optional version string
+        timeout: Optional default time limit in seconds for each invocation.
+            Glean API calls made by the tool are bounded by it, or by the
+            caller's :func:`~glean.agent_toolkit.runtime.deadline.deadline` if
+            that leaves less time. It can be changed later through
+            ``tool_spec.timeout``.
 
     Returns:
         Decorated function with tool spec attached
@@ -183,7 +236,9 @@ def tool_spec(
                 if isinstance(output_model, type) and issubclass(output_model, BaseModel)
                 else None
             ),
+            timeout=timeout,
         )
+        func = tool_spec_obj.function = _bounded(func, tool_spec_obj)
 
         get_registry().register(tool_spec_obj)
 
@@ -260,10 +315,30 @@ def tool_spec(
 
             return adapter.to_tool()
 
+        def async_variant(async_func: AsyncCallableT) -> AsyncCallableT:
+            """Register a native coroutine implementation of the tool.
+
+            Args:
+                async_func: Coroutine function with the same parameters as the tool
+
+            Returns:
+                The coroutine function, bounded by the tool's timeout
+
+            Raises:
+                TypeError: If ``async_func`` is not a coroutine function
+            """
+            if not inspect.iscoroutinefunction(async_func):
+                raise TypeError(f"Async variant of '{name}' must be a coroutine function")
+
+            async_func = cast(AsyncCallableT, _bounded(async_func, tool_spec_obj))
+            tool_spec_obj.async_function = async_func
+            return async_func
+
         wrapper.as_openai_tool = as_openai_tool  # type: ignore
         wrapper.as_adk_tool = as_adk_tool  # type: ignore
         wrapper.as_langchain_tool = as_langchain_tool  # type: ignore
         wrapper.as_crewai_tool = as_crewai_tool  # type: ignore
+        wrapper.async_variant = async_variant  # type: ignore
         wrapper.tool_spec = tool_spec_obj  # type: ignore
 
         return cast(ToolSpecFunction, wrapper)
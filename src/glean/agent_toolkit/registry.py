@@ -1,5 +1,7 @@
 """Tool registry for managing and retrieving tool specifications."""
 
+from collections.abc import Callable
+
 from glean.agent_toolkit.spec import ToolSpec
 
 
@@ -9,6 +11,7 @@ class Registry:
     def __init__(self) -> None:
         """Initialize the registry."""
         self._tools: dict[str, ToolSpec] = {}
+        self._loaders: dict[str, Callable[[], object]] = {}
 
     def register(self, tool_spec: ToolSpec) -> None:
         """Register a tool specification.
@@ -17,6 +20,20 @@ class Registry:
             tool_spec: The tool specification to register
         """
         self._tools[tool_spec.name] = tool_spec
+        self._loaders.pop(tool_spec.name, None)
+
+    def register_lazy(self, name: str, loader: Callable[[], object]) -> None:
+        """Register a loader that registers a tool on first lookup.
+
+        The loader is expected to register a tool specification named ``name``,
+        typically by importing the module that defines it.
+
+        Args:
+            name: The name of the tool the loader provides
+            loader: Callable that registers the tool when invoked
+        """
+        if name not in self._tools:
+            self._loaders[name] = loader
 
     def get(self, name: str) -> ToolSpec | None:
         """Get a tool specification by name.
@@ -27,7 +44,11 @@ class Registry:
         Returns:
             The tool specification, or None if not found
         """
-        return self._tools.get(name)
+        tool_spec = self._tools.get(name)
+        if tool_spec is None and name in self._loaders:
+            self._load(name)
+            tool_spec = self._tools.get(name)
+        return tool_spec
 
     def list(self) -> list[ToolSpec]:
         """List all registered tool specifications.
@@ -35,8 +56,21 @@ class Registry:
         Returns:
             List of all registered tool specifications
         """
+        for name in list(self._loaders):
+            self._load(name)
         return list(self._tools.values())
 
+    def _load(self, name: str) -> None:
+        """Run the pending loader for a tool.
+
+        Args:
+            name: The name of the tool to load
+        """
+        loader = self._loaders.get(name)
+        if loader is not None:
+            loader()
+            self._loaders.pop(name, None)
+
 
 _REGISTRY = Registry()
 
@@ -0,0 +1,246 @@
+"""Runtime support for executing tools against the Glean API.
+
+Submodules are imported on first attribute access, so that the decorator can
+depend on lightweight pieces such as deadlines without importing the Glean
+API client.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from glean.agent_toolkit.runtime.breaker import (
+        BreakerPolicy,
+        CircuitBreaker,
+        CircuitBreakers,
+        CircuitState,
+        get_circuit_breakers,
+    )
+    from glean.agent_toolkit.runtime.cache import (
+        CachePolicy,
+        CacheStats,
+        ResultCache,
+        get_result_cache,
+    )
+    from glean.agent_toolkit.runtime.concurrency import (
+        AdaptiveLimiter,
+        ConcurrencyPolicy,
+        ConcurrencyStats,
+        get_concurrency_limiter,
+    )
+    from glean.agent_toolkit.runtime.credentials import (
+        Credentials,
+        current_credentials,
+        use_credentials,
+    )
+    from glean.agent_toolkit.runtime.deadline import (
+        DeadlineExceededError,
+        deadline,
+        remaining,
+    )
+    from glean.agent_toolkit.runtime.diskcache import SharedCacheStats, SQLiteCache
+    from glean.agent_toolkit.runtime.hedge import (
+        READ_ONLY_SEARCH_TOOLS,
+        HedgePolicy,
+        Hedger,
+        HedgeStats,
+        get_hedger,
+    )
+    from glean.agent_toolkit.runtime.keys import canonical_parameters, tool_call_key
+    from glean.agent_toolkit.runtime.metrics import (
+        HistogramSnapshot,
+        InMemorySink,
+        MetricsPolicy,
+        MetricsRecorder,
+        MetricsSink,
+        PrometheusSink,
+        StatsDSink,
+        ToolMetricsSnapshot,
+        get_metrics_recorder,
+        measured,
+    )
+    from glean.agent_toolkit.runtime.pool import (
+        ClientPool,
+        PoolLimits,
+        TransportConfig,
+        get_client_pool,
+    )
+    from glean.agent_toolkit.runtime.ratelimit import (
+        RateLimit,
+        RateLimiter,
+        RateLimitExceededError,
+        RateLimitPolicy,
+        RateLimitStats,
+        TokenBucket,
+        get_rate_limiter,
+    )
+    from glean.agent_toolkit.runtime.retry import (
+        Retrier,
+        RetryBudget,
+        RetryPolicy,
+        RetryStats,
+        get_retrier,
+    )
+    from glean.agent_toolkit.runtime.singleflight import SingleFlight, get_single_flight
+    from glean.agent_toolkit.runtime.tracing import (
+        ToolTracer,
+        TracingPolicy,
+        get_tool_tracer,
+        traced,
+    )
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "BreakerPolicy": "glean.agent_toolkit.runtime.breaker",
+    "CircuitBreaker": "glean.agent_toolkit.runtime.breaker",
+    "CircuitBreakers": "glean.agent_toolkit.runtime.breaker",
+    "CircuitState": "glean.agent_toolkit.runtime.breaker",
+    "get_circuit_breakers": "glean.agent_toolkit.runtime.breaker",
+    "CachePolicy": "glean.agent_toolkit.runtime.cache",
+    "CacheStats": "glean.agent_toolkit.runtime.cache",
+    "ResultCache": "glean.agent_toolkit.runtime.cache",
+    "get_result_cache": "glean.agent_toolkit.runtime.cache",
+    "AdaptiveLimiter": "glean.agent_toolkit.runtime.concurrency",
+    "ConcurrencyPolicy": "glean.agent_toolkit.runtime.concurrency",
+    "ConcurrencyStats": "glean.agent_toolkit.runtime.concurrency",
+    "get_concurrency_limiter": "glean.agent_toolkit.runtime.concurrency",
+    "Credentials": "glean.agent_toolkit.runtime.credentials",
+    "current_credentials": "glean.agent_toolkit.runtime.credentials",
+    "use_credentials": "glean.agent_toolkit.runtime.credentials",
+    "DeadlineExceededError": "glean.agent_toolkit.runtime.deadline",
+    "deadline": "glean.agent_toolkit.runtime.deadline",
+    "remaining": "glean.agent_toolkit.runtime.deadline",
+    "SQLiteCache": "glean.agent_toolkit.runtime.diskcache",
+    "SharedCacheStats": "glean.agent_toolkit.runtime.diskcache",
+    "READ_ONLY_SEARCH_TOOLS": "glean.agent_toolkit.runtime.hedge",
+    "HedgePolicy": "glean.agent_toolkit.runtime.hedge",
+    "HedgeStats": "glean.agent_toolkit.runtime.hedge",
+    "Hedger": "glean.agent_toolkit.runtime.hedge",
+    "get_hedger": "glean.agent_toolkit.runtime.hedge",
+    "canonical_parameters": "glean.agent_toolkit.runtime.keys",
+    "tool_call_key": "glean.agent_toolkit.runtime.keys",
+    "HistogramSnapshot": "glean.agent_toolkit.runtime.metrics",
+    "InMemorySink": "glean.agent_toolkit.runtime.metrics",
+    "MetricsPolicy": "glean.agent_toolkit.runtime.metrics",
+    "MetricsRecorder": "glean.agent_toolkit.runtime.metrics",
+    "MetricsSink": "glean.agent_toolkit.runtime.metrics",
+    "PrometheusSink": "glean.agent_toolkit.runtime.metrics",
+    "StatsDSink": "glean.agent_toolkit.runtime.metrics",
+    "ToolMetricsSnapshot": "glean.agent_toolkit.runtime.metrics",
+    "get_metrics_recorder": "glean.agent_toolkit.runtime.metrics",
+    "measured": "glean.agent_toolkit.runtime.metrics",
+    "ClientPool": "glean.agent_toolkit.runtime.pool",
+    "PoolLimits": "glean.agent_toolkit.runtime.pool",
+    "TransportConfig": "glean.agent_toolkit.runtime.pool",
+    "get_client_pool": "glean.agent_toolkit.runtime.pool",
+    "RateLimit": "glean.agent_toolkit.runtime.ratelimit",
+    "RateLimitExceededError": "glean.agent_toolkit.runtime.ratelimit",
+    "RateLimitPolicy": "glean.agent_toolkit.runtime.ratelimit",
+    "RateLimitStats": "glean.agent_toolkit.runtime.ratelimit",
+    "RateLimiter": "glean.agent_toolkit.runtime.ratelimit",
+    "TokenBucket": "glean.agent_toolkit.runtime.ratelimit",
+    "get_rate_limiter": "glean.agent_toolkit.runtime.ratelimit",
+    "Retrier": "glean.agent_toolkit.runtime.retry",
+    "RetryBudget": "glean.agent_toolkit.runtime.retry",
+    "RetryPolicy": "glean.agent_toolkit.runtime.retry",
+    "RetryStats": "glean.agent_toolkit.runtime.retry",
+    "get_retrier": "glean.agent_toolkit.runtime.retry",
+    "SingleFlight": "glean.agent_toolkit.runtime.singleflight",
+    "get_single_flight": "glean.agent_toolkit.runtime.singleflight",
+    "ToolTracer": "glean.agent_toolkit.runtime.tracing",
+    "TracingPolicy": "glean.agent_toolkit.runtime.tracing",
+    "get_tool_tracer": "glean.agent_toolkit.runtime.tracing",
+    "traced": "glean.agent_toolkit.runtime.tracing",
+}
+
+__all__ = [
+    "AdaptiveLimiter",
+    "BreakerPolicy",
+    "CachePolicy",
+    "CacheStats",
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "CircuitState",
+    "ClientPool",
+    "ConcurrencyPolicy",
+    "ConcurrencyStats",
+    "Credentials",
+    "DeadlineExceededError",
+    "HedgePolicy",
+    "HedgeStats",
+    "Hedger",
+    "HistogramSnapshot",
+    "InMemorySink",
+    "MetricsPolicy",
+    "MetricsRecorder",
+    "MetricsSink",
+    "PoolLimits",
+    "PrometheusSink",
+    "READ_ONLY_SEARCH_TOOLS",
+    "RateLimit",
+    "RateLimitExceededError",
+    "RateLimitPolicy",
+    "RateLimitStats",
+    "RateLimiter",
+    "ResultCache",
+    "Retrier",
+    "RetryBudget",
+    "RetryPolicy",
+    "RetryStats",
+    "SQLiteCache",
+    "SharedCacheStats",
+    "SingleFlight",
+    "StatsDSink",
+    "TokenBucket",
+    "ToolMetricsSnapshot",
+    "ToolTracer",
+    "TracingPolicy",
+    "TransportConfig",
+    "canonical_parameters",
+    "current_credentials",
+    "deadline",
+    "get_circuit_breakers",
+    "get_client_pool",
+    "get_concurrency_limiter",
+    "get_hedger",
+    "get_metrics_recorder",
+    "get_rate_limiter",
+    "get_result_cache",
+    "get_retrier",
+    "get_single_flight",
+    "get_tool_tracer",
+    "measured",
+    "remaining",
+    "tool_call_key",
+    "traced",
+    "use_credentials",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import runtime components on first access.
+
+    Args:
+        name: The attribute name
+
+    Returns:
+        The requested attribute
+
+    Raises:
+        AttributeError: If the attribute doesn't exist
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including lazily imported ones.
+
+    Returns:
+        The attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,248 @@
+"""Per-tool circuit breakers that fail fast while a backend tool is unhealthy."""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import httpx
+
+from glean.agent_toolkit.runtime.deadline import DeadlineExceededError
+from glean.agent_toolkit.runtime.ratelimit import RateLimitExceededError
+from glean.api_client.errors import GleanBaseError
+
+# Outcomes of calls that were abandoned before the backend answered; they say
+# nothing about the backend's health.
+_NOT_SENT = (DeadlineExceededError, RateLimitExceededError, asyncio.CancelledError)
+
+
+class CircuitState(str, enum.Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class BreakerPolicy:
+    """When circuit breakers open and how they recover.
+
+    Attributes:
+        failure_threshold: Consecutive failures that open the circuit; 0 disables breakers
+        recovery_timeout: Seconds an open circuit rejects calls before letting a probe through
+        half_open_max_calls: Concurrent probe calls allowed while half-open
+    """
+
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+
+
+def is_failure(exc: BaseException) -> bool:
+    """Whether an error indicates that the backend tool is unhealthy.
+
+    Server errors, rate limiting, timeouts and connection failures count;
+    client errors such as a bad request mean the backend answered and don't.
+
+    Args:
+        exc: The exception raised by the call
+
+    Returns:
+        True if the error counts against the circuit
+    """
+    if isinstance(exc, GleanBaseError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    if isinstance(exc, DeadlineExceededError):
+        return False
+    return isinstance(exc, TimeoutError | asyncio.TimeoutError | httpx.TransportError)
+
+
+class CircuitBreaker:
+    """Circuit breaker for one backend tool.
+
+    Closed circuits let calls through and count consecutive failures. Once the
+    threshold is reached the circuit opens and rejects calls until the recovery
+    timeout has passed; it then lets a limited number of probe calls through
+    (half-open) and closes on the first success or reopens on a failure.
+    """
+
+    def __init__(
+        self,
+        policy: BreakerPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            policy: The breaker policy
+            clock: Monotonic clock returning seconds
+        """
+        self.policy = policy or BreakerPolicy()
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state, moving an open circuit to half-open once it may recover."""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    @property
+    def rejected(self) -> int:
+        """Number of calls rejected while the circuit was open."""
+        return self._rejected
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through.
+
+        Returns:
+            The remaining recovery time, or 0 if the circuit isn't open
+        """
+        with self._lock:
+            if self._state is not CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.policy.recovery_timeout - self._clock())
+
+    def allow(self) -> bool:
+        """Ask to make a call.
+
+        Every allowed call must be followed by :meth:`record`.
+
+        Returns:
+            True if the call may proceed
+        """
+        if self.policy.failure_threshold <= 0:
+            return True
+
+        with self._lock:
+            self._maybe_half_open()
+            if self._state is CircuitState.CLOSED:
+                return True
+            if (
+                self._state is CircuitState.HALF_OPEN
+                and self._probes < self.policy.half_open_max_calls
+            ):
+                self._probes += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def record(self, exc: BaseException | None = None) -> None:
+        """Record the outcome of an allowed call.
+
+        Args:
+            exc: The exception the call raised, or None if it succeeded
+        """
+        if self.policy.failure_threshold <= 0:
+            return
+
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+
+            if exc is not None and is_failure(exc):
+                self._failures += 1
+                if (
+                    self._state is CircuitState.HALF_OPEN
+                    or self._failures >= self.policy.failure_threshold
+                ):
+                    self._state = CircuitState.OPEN
+                    self._opened_at = self._clock()
+            elif exc is None or not isinstance(exc, _NOT_SENT):
+                self._state = CircuitState.CLOSED
+                self._failures = 0
+
+    def _maybe_half_open(self) -> None:
+        """Move an open circuit to half-open after the recovery timeout. Lock must be held."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.policy.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+
+
+class CircuitBreakers:
+    """Circuit breakers keyed by Glean tool display name."""
+
+    def __init__(
+        self,
+        policy: BreakerPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the breakers.
+
+        Args:
+            policy: The policy applied to every breaker
+            clock: Monotonic clock returning seconds
+        """
+        self._policy = policy or BreakerPolicy()
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def policy(self) -> BreakerPolicy:
+        """The current breaker policy."""
+        return self._policy
+
+    def configure(self, policy: BreakerPolicy) -> None:
+        """Replace the breaker policy and close all circuits.
+
+        Args:
+            policy: The new breaker policy
+        """
+        with self._lock:
+            self._policy = policy
+            self._breakers.clear()
+
+    def get(self, tool_display_name: str) -> CircuitBreaker:
+        """Get the breaker for a tool, creating it if needed.
+
+        Args:
+            tool_display_name: The Glean tool display name
+
+        Returns:
+            The tool's circuit breaker
+        """
+        breaker = self._breakers.get(tool_display_name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(tool_display_name)
+                if breaker is None:
+                    breaker = CircuitBreaker(self._policy, self._clock)
+                    self._breakers[tool_display_name] = breaker
+        return breaker
+
+    def states(self) -> dict[str, CircuitState]:
+        """Get the state of every tool that has been called.
+
+        Returns:
+            Circuit states keyed by tool display name
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.state for name, breaker in breakers.items()}
+
+
+_CIRCUIT_BREAKERS = CircuitBreakers()
+
+
+def get_circuit_breakers() -> CircuitBreakers:
+    """Get the global circuit breakers used by the built-in tools.
+
+    Returns:
+        The global circuit breakers
+    """
+    return _CIRCUIT_BREAKERS
@@ -0,0 +1,526 @@
+"""In-process TTL + LRU cache for tool call results, optionally backed by a shared cache."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from glean.agent_toolkit.runtime.keys import payload_size
+
+if TYPE_CHECKING:
+    from glean.agent_toolkit.runtime.diskcache import SQLiteCache
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Which tool results are cached, for how long, and within what bounds.
+
+    Results are only cached for tools with a positive TTL, so the default
+    policy caches nothing.
+
+    A tool with a stale TTL uses stale-while-revalidate: once its TTL (the
+    soft TTL) has passed, the cached result is still served immediately and
+    refreshed in the background, until the stale TTL on top of it (together
+    the hard TTL) runs out and callers have to wait for the backend again.
+
+    Attributes:
+        ttls: TTL in seconds keyed by tool display name (e.g. ``"Glean Search"``)
+        default_ttl: TTL in seconds for tools without an entry in ``ttls``
+        max_entries: Maximum number of cached results
+        max_bytes: Maximum total estimated size of cached results
+        stale_ttls: Seconds past the TTL a result may be served stale, keyed by tool display name
+        default_stale_ttl: Stale TTL in seconds for tools without an entry in ``stale_ttls``
+        error_ttl: TTL in seconds for responses to calls that failed with a
+            deterministic error (e.g. an invalid parameter or a permission
+            denied), for any tool; None doesn't cache errors
+    """
+
+    ttls: Mapping[str, float] = field(default_factory=dict)
+    default_ttl: float | None = None
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    max_bytes: int = DEFAULT_MAX_BYTES
+    stale_ttls: Mapping[str, float] = field(default_factory=dict)
+    default_stale_ttl: float | None = None
+    error_ttl: float | None = None
+
+    def ttl_for(self, tool_display_name: str) -> float | None:
+        """Get the TTL for a tool.
+
+        Args:
+            tool_display_name: The Glean tool display name
+
+        Returns:
+            The TTL in seconds, or None if the tool's results aren't cached
+        """
+        ttl = self.ttls.get(tool_display_name, self.default_ttl)
+        return ttl if ttl is not None and ttl > 0 else None
+
+    def stale_ttl_for(self, tool_display_name: str) -> float:
+        """Get how long past its TTL a tool's result may be served stale.
+
+        Args:
+            tool_display_name: The Glean tool display name
+
+        Returns:
+            The stale TTL in seconds, 0 if stale results aren't served
+        """
+        stale_ttl = self.stale_ttls.get(tool_display_name, self.default_stale_ttl)
+        return stale_ttl if stale_ttl is not None and stale_ttl > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache counters.
+
+    Attributes:
+        hits: Lookups answered from the cache, including from the shared cache
+        shared_hits: Lookups missed in process but answered from the shared cache
+        stale_hits: Lookups answered with a result past its TTL
+        negative_hits: Calls answered with a cached error response
+        misses: Lookups that found no live entry
+        evictions: Entries removed to stay within the size bounds
+        expirations: Entries removed because their TTL elapsed
+        entries: Current number of entries
+        bytes: Current total estimated size of entries
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+    shared_hits: int = 0
+    stale_hits: int = 0
+    negative_hits: int = 0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    stale_at: float
+    expires_at: float
+
+
+class ResultCache:
+    """Thread-safe TTL + LRU cache of tool results.
+
+    Keys are built with :func:`~glean.agent_toolkit.runtime.keys.tool_call_key`.
+    Cached values are shared between callers and must not be mutated.
+
+    With a shared cache, such as a :class:`~glean.agent_toolkit.runtime.diskcache.SQLiteCache`
+    that several worker processes open, local misses fall through to it and
+    writes, invalidations and clears go to both.
+    """
+
+    def __init__(
+        self,
+        policy: CachePolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        shared: SQLiteCache | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            policy: The cache policy; the default caches nothing
+            clock: Monotonic clock returning seconds
+            shared: Cache shared with other processes, consulted on local misses
+        """
+        self._policy = policy or CachePolicy()
+        self._clock = clock
+        self._shared = shared
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._shared_hits = 0
+        self._stale_hits = 0
+        self._negative_hits = 0
+        self._errors: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self._misses = 0
+        self._refreshing: set[str] = set()
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.Lock()
+
+    @property
+    def policy(self) -> CachePolicy:
+        """The current cache policy."""
+        return self._policy
+
+    @property
+    def shared(self) -> SQLiteCache | None:
+        """The cache shared with other processes, if any."""
+        return self._shared
+
+    def configure(self, policy: CachePolicy, shared: SQLiteCache | None = None) -> None:
+        """Replace the cache policy and drop all results cached in process.
+
+        Results in the shared cache are kept, since other processes may rely on them.
+
+        Args:
+            policy: The new cache policy
+            shared: Cache shared with other processes; None caches in process only
+        """
+        with self._lock:
+            self._policy = policy
+            self._shared = shared
+            self._entries.clear()
+            self._errors.clear()
+            self._bytes = 0
+
+    def caches(self, tool_display_name: str) -> bool:
+        """Whether results of a tool are cached under the current policy.
+
+        Args:
+            tool_display_name: The Glean tool display name
+
+        Returns:
+            True if the tool has a positive TTL
+        """
+        return self._policy.ttl_for(tool_display_name) is not None
+
+    def get(self, key: str, tool_display_name: str | None = None) -> Any | None:
+        """Get a live cached result, fresh or stale.
+
+        Args:
+            key: The tool call key
+            tool_display_name: The Glean tool display name, see :meth:`lookup`
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        found = self.lookup(key, tool_display_name)
+        return None if found is None else found[0]
+
+    def lookup(self, key: str, tool_display_name: str | None = None) -> tuple[Any, bool] | None:
+        """Get a live cached result and whether it's stale.
+
+        Args:
+            key: The tool call key
+            tool_display_name: The Glean tool display name, used to pick the
+                stale TTL of a result loaded from the shared cache
+
+        Returns:
+            The cached result and True if it's past its TTL and should be
+            refreshed, or None on a miss
+        """
+        found, shared = self._lookup_local(key)
+        if shared is None:
+            return found
+        return self._store_shared(key, tool_display_name, shared.get(key))
+
+    async def lookup_async(
+        self, key: str, tool_display_name: str | None = None
+    ) -> tuple[Any, bool] | None:
+        """Get a live cached result and whether it's stale, without blocking the event loop.
+
+        Like :meth:`lookup`, but the shared cache, which may wait for another
+        process's lock, is read in a worker thread.
+
+        Args:
+            key: The tool call key
+            tool_display_name: The Glean tool display name, see :meth:`lookup`
+
+        Returns:
+            The cached result and whether it's stale, or None on a miss
+        """
+        found, shared = self._lookup_local(key)
+        if shared is None:
+            return found
+        return self._store_shared(key, tool_display_name, await asyncio.to_thread(shared.get, key))
+
+    def _lookup_local(self, key: str) -> tuple[tuple[Any, bool] | None, SQLiteCache | None]:
+        """Look a result up in process.
+
+        Returns:
+            The result of the lookup, and the shared cache if it should be consulted next
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self._clock():
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return self._hit(entry), None
+            if self._shared is None:
+                self._misses += 1
+            return None, self._shared
+
+    def _store_shared(
+        self,
+        key: str,
+        tool_display_name: str | None,
+        found: tuple[Any, float] | None,
+    ) -> tuple[Any, bool] | None:
+        """Keep a result found in the shared cache in process too."""
+        with self._lock:
+            if found is None:
+                self._misses += 1
+                return None
+            value, ttl = found
+            self._shared_hits += 1
+            stale_ttl = (
+                0.0 if tool_display_name is None else self._policy.stale_ttl_for(tool_display_name)
+            )
+            entry = self._store(key, value, payload_size(value), ttl, min(ttl, stale_ttl))
+            return self._hit(entry)
+
+    def put(self, key: str, tool_display_name: str, value: Any) -> bool:
+        """Cache a tool result.
+
+        Args:
+            key: The tool call key
+            tool_display_name: The Glean tool display name, used to pick the TTL
+            value: The tool result
+
+        Returns:
+            True if the result was cached
+        """
+        stored = self._put_local(key, tool_display_name, value)
+        if stored is None:
+            return False
+        shared, hard_ttl = stored
+        if shared is not None:
+            shared.put(key, value, hard_ttl)
+        return True
+
+    async def put_async(self, key: str, tool_display_name: str, value: Any) -> bool:
+        """Cache a tool result without blocking the event loop.
+
+        Like :meth:`put`, but the shared cache, which may wait for another
+        process's lock, is written in a worker thread.
+
+        Args:
+            key: The tool call key
+            tool_display_name: The Glean tool display name, used to pick the TTL
+            value: The tool result
+
+        Returns:
+            True if the result was cached
+        """
+        stored = self._put_local(key, tool_display_name, value)
+        if stored is None:
+            return False
+        shared, hard_ttl = stored
+        if shared is not None:
+            await asyncio.to_thread(shared.put, key, value, hard_ttl)
+        return True
+
+    def _put_local(
+        self, key: str, tool_display_name: str, value: Any
+    ) -> tuple[SQLiteCache | None, float] | None:
+        """Cache a tool result in process.
+
+        Returns:
+            The shared cache to write the result to next, if any, and the
+            result's hard TTL; or None if the result isn't cached
+        """
+        ttl = self._policy.ttl_for(tool_display_name)
+        if ttl is None or value is None:
+            return None
+
+        size = payload_size(value)
+        if size > self._policy.max_bytes:
+            return None
+
+        hard_ttl = ttl + self._policy.stale_ttl_for(tool_display_name)
+        with self._lock:
+            self._store(key, value, size, hard_ttl, hard_ttl - ttl)
+            return self._shared, hard_ttl
+
+    @property
+    def caches_errors(self) -> bool:
+        """Whether deterministic errors are cached under the current policy."""
+        ttl = self._policy.error_ttl
+        return ttl is not None and ttl > 0
+
+    def get_error(self, key: str) -> dict[str, Any] | None:
+        """Get a live cached error response.
+
+        Args:
+            key: The tool call key
+
+        Returns:
+            The cached error response, or None if the call's last outcome isn't cached
+        """
+        with self._lock:
+            cached = self._errors.get(key)
+            if cached is None:
+                return None
+            if cached[1] <= self._clock():
+                del self._errors[key]
+                return None
+            self._negative_hits += 1
+            return dict(cached[0])
+
+    def put_error(self, key: str, response: dict[str, Any]) -> bool:
+        """Cache the error response of a call that failed deterministically.
+
+        Error responses are only kept in process, never in the shared cache.
+
+        Args:
+            key: The tool call key
+            response: The error response returned to the caller
+
+        Returns:
+            True if the response was cached
+        """
+        if not self.caches_errors:
+            return False
+
+        with self._lock:
+            self._errors.pop(key, None)
+            self._errors[key] = (dict(response), self._clock() + (self._policy.error_ttl or 0))
+            while len(self._errors) > self._policy.max_entries:
+                self._errors.popitem(last=False)
+        return True
+
+    def claim_refresh(self, key: str) -> bool:
+        """Claim the background refresh of a stale result.
+
+        Args:
+            key: The tool call key
+
+        Returns:
+            True if the caller should refresh the result and then call
+            :meth:`release_refresh`, False if a refresh is already under way
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def release_refresh(self, key: str) -> None:
+        """Mark the background refresh of a result as finished.
+
+        Args:
+            key: The tool call key
+        """
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def invalidate(self, key: str) -> bool:
+        """Drop a cached result, from the shared cache too.
+
+        Args:
+            key: The tool call key
+
+        Returns:
+            False if the shared cache couldn't be written, e.g. because
+            another process held its lock past the busy timeout
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._errors.pop(key, None)
+            shared = self._shared
+        if shared is not None:
+            try:
+                shared.invalidate(key)
+            except sqlite3.Error:
+                return False
+        return True
+
+    def clear(self) -> bool:
+        """Drop all cached results, from the shared cache too, and reset the counters.
+
+        Returns:
+            False if the shared cache couldn't be written, see :meth:`invalidate`
+        """
+        with self._lock:
+            self._entries.clear()
+            self._errors.clear()
+            self._bytes = 0
+            self._hits = self._shared_hits = self._stale_hits = self._negative_hits = 0
+            self._misses = 0
+            self._evictions = self._expirations = 0
+            shared = self._shared
+        if shared is not None:
+            try:
+                shared.clear()
+            except sqlite3.Error:
+                return False
+        return True
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                shared_hits=self._shared_hits,
+                stale_hits=self._stale_hits,
+                negative_hits=self._negative_hits,
+            )
+
+    def __len__(self) -> int:
+        """Return the number of cached results, including expired ones not yet purged."""
+        return len(self._entries)
+
+    def _hit(self, entry: _Entry) -> tuple[Any, bool]:
+        """Count a hit on a live entry. Lock must be held."""
+        self._hits += 1
+        stale = entry.stale_at <= self._clock()
+        if stale:
+            self._stale_hits += 1
+        return entry.value, stale
+
+    def _store(self, key: str, value: Any, size: int, ttl: float, stale_ttl: float) -> _Entry:
+        """Store an entry, unless it's too large, and return it. Lock must be held.
+
+        The entry expires after the hard ``ttl`` and turns stale ``stale_ttl`` before that.
+        """
+        now = self._clock()
+        entry = _Entry(value, size, now + ttl - stale_ttl, now + ttl)
+        if size > self._policy.max_bytes:
+            return entry
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._bytes += size
+        self._evict()
+        return entry
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry. Must be called with the lock held."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within bounds. Lock must be held."""
+        while self._entries and (
+            len(self._entries) > self._policy.max_entries or self._bytes > self._policy.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self._evictions += 1
+
+
+_RESULT_CACHE = ResultCache()
+
+
+def get_result_cache() -> ResultCache:
+    """Get the global result cache instance.
+
+    Returns:
+        The global result cache instance
+    """
+    return _RESULT_CACHE
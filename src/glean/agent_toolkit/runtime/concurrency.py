@@ -0,0 +1,278 @@
+"""Adaptive (AIMD) concurrency limiting for outbound tool calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+import httpx
+
+from glean.agent_toolkit.runtime.deadline import DeadlineExceededError
+from glean.api_client.errors import GleanBaseError
+
+
+@dataclass(frozen=True)
+class ConcurrencyPolicy:
+    """How many tool calls may be in flight and how the limit adapts.
+
+    The limit grows additively, by about one per ``limit`` successful calls,
+    while calls keep the limiter busy and their latency stays within
+    ``latency_tolerance`` times the smoothed baseline. It shrinks
+    multiplicatively by ``backoff_ratio`` on every overload signal (a 429 or a
+    timeout). The default policy doesn't limit concurrency.
+
+    Attributes:
+        enabled: Whether calls are limited
+        initial_limit: Limit before any calls have completed
+        min_limit: Lowest the limit can shrink to
+        max_limit: Highest the limit can grow to
+        backoff_ratio: Factor applied to the limit on an overload signal
+        latency_tolerance: Latency, relative to the baseline, above which the limit stops growing
+        smoothing: Weight of each new sample in the baseline latency
+    """
+
+    enabled: bool = False
+    initial_limit: int = 20
+    min_limit: int = 1
+    max_limit: int = 200
+    backoff_ratio: float = 0.75
+    latency_tolerance: float = 2.0
+    smoothing: float = 0.1
+
+
+@dataclass(frozen=True)
+class ConcurrencyStats:
+    """Snapshot of concurrency limiter metrics.
+
+    Attributes:
+        limit: Current concurrency limit
+        in_flight: Calls currently holding a permit
+        queue_depth: Calls waiting for a permit
+        rejected: Calls that gave up waiting for a permit
+        baseline_latency: Smoothed latency of successful calls in seconds, if known
+    """
+
+    limit: int
+    in_flight: int
+    queue_depth: int
+    rejected: int
+    baseline_latency: float | None
+
+
+def is_overload(exc: BaseException | None) -> bool:
+    """Whether a call's outcome signals that the backend is overloaded.
+
+    Args:
+        exc: The exception the call raised, or None if it succeeded
+
+    Returns:
+        True for rate limiting (429) and timeouts
+    """
+    if isinstance(exc, GleanBaseError):
+        return exc.status_code == 429
+    if isinstance(exc, DeadlineExceededError):
+        return False
+    return isinstance(exc, TimeoutError | asyncio.TimeoutError | httpx.TimeoutException)
+
+
+class _Waiter:
+    """A caller queued for a permit, woken from whichever thread releases one."""
+
+    def __init__(self, future: asyncio.Future[None] | None = None) -> None:
+        self.granted = False
+        self.event = threading.Event()
+        self.future = future
+
+    def wake(self) -> None:
+        self.granted = True
+        self.event.set()
+        if self.future is not None:
+            self.future.get_loop().call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if self.future is not None and not self.future.done():
+            self.future.set_result(None)
+
+
+class AdaptiveLimiter:
+    """Concurrency limiter whose limit adapts with AIMD.
+
+    Callers wait in FIFO order for a permit and must release it with the
+    call's latency and outcome, which drive the limit.
+    """
+
+    def __init__(self, policy: ConcurrencyPolicy | None = None) -> None:
+        """Initialize the limiter.
+
+        Args:
+            policy: The concurrency policy; the default doesn't limit concurrency
+        """
+        self._lock = threading.Lock()
+        self._waiters: deque[_Waiter] = deque()
+        self._in_flight = 0
+        self._rejected = 0
+        self.configure(policy or ConcurrencyPolicy())
+
+    @property
+    def policy(self) -> ConcurrencyPolicy:
+        """The current concurrency policy."""
+        return self._policy
+
+    def configure(self, policy: ConcurrencyPolicy) -> None:
+        """Replace the policy and restart the limit from its initial value.
+
+        Calls already holding a permit keep it.
+
+        Args:
+            policy: The new concurrency policy
+        """
+        with self._lock:
+            self._policy = policy
+            self._limit = float(policy.initial_limit)
+            self._baseline: float | None = None
+            self._rejected = 0
+            self._grant()
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a permit."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a permit."""
+        return len(self._waiters)
+
+    @property
+    def stats(self) -> ConcurrencyStats:
+        """A snapshot of the limiter metrics."""
+        with self._lock:
+            return ConcurrencyStats(
+                limit=int(self._limit),
+                in_flight=self._in_flight,
+                queue_depth=len(self._waiters),
+                rejected=self._rejected,
+                baseline_latency=self._baseline,
+            )
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Wait for a permit.
+
+        Args:
+            timeout: Longest wait in seconds, or None to wait as long as needed
+
+        Returns:
+            True if a permit was acquired and must be released
+        """
+        if not self._policy.enabled:
+            return True
+
+        with self._lock:
+            if self._try_take():
+                return True
+            waiter = _Waiter()
+            self._waiters.append(waiter)
+
+        waiter.event.wait(None if timeout is None else max(0.0, timeout))
+        return self._settle(waiter)
+
+    async def acquire_async(self, timeout: float | None = None) -> bool:
+        """Wait for a permit without blocking the event loop.
+
+        Args:
+            timeout: Longest wait in seconds, or None to wait as long as needed
+
+        Returns:
+            True if a permit was acquired and must be released
+        """
+        if not self._policy.enabled:
+            return True
+
+        with self._lock:
+            if self._try_take():
+                return True
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            waiter = _Waiter(future)
+            self._waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(future), None if timeout is None else max(0.0, timeout)
+            )
+        except (TimeoutError, asyncio.TimeoutError):
+            pass
+        except asyncio.CancelledError:
+            if self._settle(waiter):
+                self.release()
+            raise
+        return self._settle(waiter)
+
+    def release(self, latency: float | None = None, exc: BaseException | None = None) -> None:
+        """Return a permit and adapt the limit to the call's outcome.
+
+        Args:
+            latency: Seconds the call took, or None if it shouldn't be sampled
+            exc: The exception the call raised, or None if it succeeded
+        """
+        if not self._policy.enabled:
+            return
+
+        policy = self._policy
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            if is_overload(exc):
+                self._limit = max(float(policy.min_limit), self._limit * policy.backoff_ratio)
+            elif exc is None and latency is not None:
+                stable = self._baseline is None or latency <= self._baseline * (
+                    policy.latency_tolerance
+                )
+                busy = self._in_flight + 1 >= self._limit / 2
+                if stable and busy:
+                    self._limit = min(float(policy.max_limit), self._limit + 1 / self._limit)
+                self._baseline = (
+                    latency
+                    if self._baseline is None
+                    else (1 - policy.smoothing) * self._baseline + policy.smoothing * latency
+                )
+            self._grant()
+
+    def _try_take(self) -> bool:
+        """Take a permit if one is free and nobody is queued. Lock must be held."""
+        if not self._waiters and self._in_flight < int(self._limit):
+            self._in_flight += 1
+            return True
+        return False
+
+    def _grant(self) -> None:
+        """Hand free permits to queued callers in order. Lock must be held."""
+        while self._waiters and (not self._policy.enabled or self._in_flight < int(self._limit)):
+            self._in_flight += 1
+            self._waiters.popleft().wake()
+
+    def _settle(self, waiter: _Waiter) -> bool:
+        """Resolve a waiter that stopped waiting: keep its permit or leave the queue."""
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            self._rejected += 1
+            return False
+
+
+_CONCURRENCY_LIMITER = AdaptiveLimiter()
+
+
+def get_concurrency_limiter() -> AdaptiveLimiter:
+    """Get the global concurrency limiter used by the built-in tools.
+
+    Returns:
+        The global concurrency limiter
+    """
+    return _CONCURRENCY_LIMITER
@@ -0,0 +1,72 @@
+"""Glean credentials scoped to a call or a context, for multi-tenant use."""
+
+from __future__ import annotations
+
+import contextvars
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+_CREDENTIALS: contextvars.ContextVar[Credentials | None] = contextvars.ContextVar(
+    "glean_agent_toolkit_credentials", default=None
+)
+
+
+@dataclass(frozen=True)
+class Credentials:
+    """A Glean instance and the API token to call it with.
+
+    Attributes:
+        instance: The Glean instance name
+        api_token: The Glean API token, left out of the repr
+    """
+
+    instance: str
+    api_token: str = field(repr=False)
+
+    def __post_init__(self) -> None:
+        """Validate the credentials.
+
+        Raises:
+            ValueError: If the instance or token is empty
+        """
+        if not self.instance or not self.api_token:
+            raise ValueError("Credentials need both an instance and an API token")
+
+
+@contextmanager
+def use_credentials(credentials: Credentials | None) -> Iterator[None]:
+    """Make the tool calls inside the block use ``credentials``.
+
+    The credentials are stored in a context variable, so they follow the call
+    into coroutines and into threads started with a copied context, and
+    concurrent requests for different tenants don't interfere. They take
+    precedence over the ``GLEAN_INSTANCE`` and ``GLEAN_API_TOKEN`` environment
+    variables.
+
+    Example:
+        with use_credentials(Credentials(tenant.instance, tenant.api_token)):
+            glean_search(parameters=params)
+
+    Args:
+        credentials: Credentials for the block, or None to leave the current
+            credentials unchanged
+    """
+    if credentials is None:
+        yield
+        return
+
+    token = _CREDENTIALS.set(credentials)
+    try:
+        yield
+    finally:
+        _CREDENTIALS.reset(token)
+
+
+def current_credentials() -> Credentials | None:
+    """Get the credentials set for the current context.
+
+    Returns:
+        The credentials, or None if none were set with :func:`use_credentials`
+    """
+    return _CREDENTIALS.get()
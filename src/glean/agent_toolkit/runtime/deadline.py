@@ -0,0 +1,62 @@
+"""Deadlines that bound tool calls end to end."""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+_DEADLINE: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "glean_agent_toolkit_deadline", default=None
+)
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call's deadline has passed before it could complete."""
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Bound all tool calls made inside the block to ``seconds`` from now.
+
+    Deadlines nest: an inner deadline can only shorten the time left, never
+    extend an outer one. The deadline is stored in a context variable, so it
+    follows the call into coroutines and into threads started with a copied
+    context.
+
+    Example:
+        with deadline(8.0):  # this agent turn has 8s left
+            glean_search(parameters=params)
+
+    Args:
+        seconds: Time allowed for the block, or None to leave the current
+            deadline unchanged
+    """
+    if seconds is None:
+        yield
+        return
+
+    expires_at = time.monotonic() + seconds
+    current = _DEADLINE.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+
+    token = _DEADLINE.set(expires_at)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def remaining() -> float | None:
+    """Get the time left until the current deadline.
+
+    Returns:
+        Seconds left (zero or negative once the deadline has passed), or None
+        if no deadline is set
+    """
+    expires_at = _DEADLINE.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
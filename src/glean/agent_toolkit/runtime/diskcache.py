@@ -0,0 +1,353 @@
+"""SQLite-backed result cache shared by the processes on a host."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_BUSY_TIMEOUT = 5.0
+DEFAULT_TOUCH_INTERVAL = 60.0
+
+# Only models from these packages are rebuilt from cached payloads, so a
+# tampered cache file can't make the process import arbitrary modules.
+_TRUSTED_MODEL_PREFIXES = ("glean.",)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_expires_at ON results (expires_at);
+CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, bytes) SELECT 0, COALESCE(SUM(size), 0) FROM results;
+CREATE TRIGGER IF NOT EXISTS results_inserted AFTER INSERT ON results BEGIN
+    UPDATE totals SET bytes = bytes + new.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS results_updated AFTER UPDATE OF size ON results BEGIN
+    UPDATE totals SET bytes = bytes + new.size - old.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS results_deleted AFTER DELETE ON results BEGIN
+    UPDATE totals SET bytes = bytes - old.size WHERE id = 0;
+END;
+"""
+
+
+@dataclass(frozen=True)
+class SharedCacheStats:
+    """Snapshot of shared cache counters.
+
+    Counters are per process; sizes describe the shared database.
+
+    Attributes:
+        hits: Lookups answered from the database
+        misses: Lookups that found no live entry
+        evictions: Entries removed by this process to stay within ``max_bytes``
+        entries: Current number of entries in the database
+        bytes: Current total compressed size of entries in the database
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+def encode(value: Any) -> bytes:
+    """Serialize and compress a tool result.
+
+    Pydantic models are stored as JSON along with their class, everything else
+    must be JSON-serializable.
+
+    Args:
+        value: The tool result
+
+    Returns:
+        The compressed payload
+    """
+    if isinstance(value, BaseModel):
+        cls = type(value)
+        document = {
+            "model": f"{cls.__module__}:{cls.__qualname__}",
+            "data": value.model_dump(mode="json", by_alias=True),
+        }
+    else:
+        document = {"data": value}
+    return zlib.compress(json.dumps(document, separators=(",", ":")).encode())
+
+
+def decode(payload: bytes) -> Any:
+    """Decompress and deserialize a tool result.
+
+    Args:
+        payload: The compressed payload
+
+    Returns:
+        The tool result
+
+    Raises:
+        ValueError: If the payload is corrupt or names an untrusted model
+    """
+    try:
+        document = json.loads(zlib.decompress(payload))
+    except (zlib.error, json.JSONDecodeError) as exc:
+        raise ValueError("Corrupt cache payload") from exc
+
+    model = document.get("model")
+    if model is None:
+        return document["data"]
+
+    module_name, _, qualname = model.partition(":")
+    if not module_name.startswith(_TRUSTED_MODEL_PREFIXES):
+        raise ValueError(f"Refusing to load untrusted model {model!r}")
+    cls: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        cls = getattr(cls, part)
+    if not (isinstance(cls, type) and issubclass(cls, BaseModel)):
+        raise ValueError(f"{model!r} is not a pydantic model")
+    return cls.model_validate(document["data"])
+
+
+class SQLiteCache:
+    """Tool result cache in a SQLite database in WAL mode.
+
+    Several processes can open the same file: WAL lets readers proceed while
+    one process writes. Payloads are compressed, entries expire by wall-clock
+    TTL, and the least recently used entries are evicted when the database
+    grows past ``max_bytes``. The total size is kept up to date by triggers,
+    so writes don't have to sum the table.
+
+    Reads only record their access time once it is ``touch_interval`` old,
+    so most hits don't take the write lock; recency is tracked to within
+    that interval. Connections are per thread and are reopened in a forked
+    child rather than shared with its parent.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+        clock: Callable[[], float] = time.time,
+        touch_interval: float = DEFAULT_TOUCH_INTERVAL,
+    ) -> None:
+        """Open or create the cache database.
+
+        Args:
+            path: Database file path
+            max_bytes: Maximum total compressed size of cached results
+            busy_timeout: Seconds to wait for another process's write lock
+            clock: Wall clock returning seconds, shared by all processes
+            touch_interval: Seconds after which a read updates an entry's access time
+        """
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.busy_timeout = busy_timeout
+        self._clock = clock
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._pid = os.getpid()
+        self._hits = self._misses = self._evictions = 0
+        self._lock = threading.Lock()
+        with self._connection() as conn:
+            conn.executescript(f"BEGIN IMMEDIATE;{_SCHEMA}COMMIT;")
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        """Get a live cached result.
+
+        Database errors, such as a lock held past the busy timeout, count as a miss.
+
+        Args:
+            key: The tool call key
+
+        Returns:
+            The cached result and its remaining TTL in seconds, or None on a miss
+        """
+        now = self._clock()
+        try:
+            with self._connection() as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at, accessed_at FROM results "
+                    "WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                if row is not None and now - row[2] >= self.touch_interval:
+                    conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+        except sqlite3.Error:
+            row = None
+
+        if row is None:
+            self._count(misses=1)
+            return None
+
+        try:
+            value = decode(row[0])
+        except (ValueError, ImportError, AttributeError):
+            try:
+                self.invalidate(key)
+            except sqlite3.Error:
+                pass
+            self._count(misses=1)
+            return None
+
+        self._count(hits=1)
+        return value, row[1] - now
+
+    def put(self, key: str, value: Any, ttl: float) -> bool:
+        """Cache a tool result.
+
+        Args:
+            key: The tool call key
+            value: The tool result
+            ttl: Seconds until the result expires
+
+        Returns:
+            True if the result was cached; False if it isn't serializable, is
+            larger than ``max_bytes``, or the database couldn't be written
+        """
+        try:
+            payload = encode(value)
+        except (TypeError, ValueError):
+            return False
+        if len(payload) > self.max_bytes:
+            return False
+
+        now = self._clock()
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT INTO results (key, value, size, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                    "value = excluded.value, size = excluded.size, "
+                    "expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                    (key, payload, len(payload), now + ttl, now),
+                )
+                self._evict(conn, now)
+        except sqlite3.Error:
+            return False
+        return True
+
+    def invalidate(self, key: str) -> None:
+        """Drop a cached result.
+
+        Args:
+            key: The tool call key
+
+        Raises:
+            sqlite3.Error: If the database couldn't be written, e.g. because
+                another process held its lock past the busy timeout
+        """
+        with self._connection() as conn:
+            conn.execute("DELETE FROM results WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Drop all cached results, for every process sharing the database.
+
+        Raises:
+            sqlite3.Error: If the database couldn't be written, e.g. because
+                another process held its lock past the busy timeout
+        """
+        with self._connection() as conn:
+            conn.execute("DELETE FROM results")
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+
+    def purge_expired(self) -> int:
+        """Delete expired entries.
+
+        Returns:
+            The number of entries deleted
+
+        Raises:
+            sqlite3.Error: If the database couldn't be written, e.g. because
+                another process held its lock past the busy timeout
+        """
+        with self._connection() as conn:
+            return conn.execute(
+                "DELETE FROM results WHERE expires_at <= ?", (self._clock(),)
+            ).rowcount
+
+    @property
+    def stats(self) -> SharedCacheStats:
+        """A snapshot of the cache counters."""
+        with self._connection() as conn:
+            (entries,) = conn.execute("SELECT COUNT(*) FROM results").fetchone()
+            size = self._size(conn)
+        with self._lock:
+            return SharedCacheStats(self._hits, self._misses, self._evictions, entries, size)
+
+    def close(self) -> None:
+        """Close every connection opened by this instance."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use and after a fork."""
+        if os.getpid() != self._pid:
+            # Connections inherited from the parent must not be used, or closed.
+            with self._lock:
+                self._local = threading.local()
+                self._connections = []
+                self._pid = os.getpid()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Delete expired entries, then least recently used ones, until within max_bytes."""
+        size = self._size(conn)
+        if size <= self.max_bytes:
+            return
+
+        evicted = conn.execute("DELETE FROM results WHERE expires_at <= ?", (now,)).rowcount
+        size = self._size(conn)
+        for key, entry_size in conn.execute(
+            "SELECT key, size FROM results ORDER BY accessed_at"
+        ).fetchall():
+            if size <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            size -= entry_size
+            evicted += 1
+        self._count(evictions=evicted)
+
+    @staticmethod
+    def _size(conn: sqlite3.Connection) -> int:
+        """Get the total size of the entries, as tracked by the triggers."""
+        row = conn.execute("SELECT bytes FROM totals WHERE id = 0").fetchone()
+        return 0 if row is None else row[0]
+
+    def _count(self, hits: int = 0, misses: int = 0, evictions: int = 0) -> None:
+        """Update the counters."""
+        with self._lock:
+            self._hits += hits
+            self._misses += misses
+            self._evictions += evictions
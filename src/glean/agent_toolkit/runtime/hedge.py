@@ -0,0 +1,335 @@
+"""Hedged requests that cut tail latency of idempotent tool calls."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+READ_ONLY_SEARCH_TOOLS = frozenset({"Glean Search", "Code Search", "Employee Search"})
+
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_MAX_SYNC_CALLS = 64
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """Which tool calls are hedged and when.
+
+    A hedged call sends a second, identical request if the first hasn't
+    returned after the hedge delay, and uses whichever finishes first. Only
+    idempotent reads should be hedged; the default policy hedges nothing.
+
+    Attributes:
+        tools: Tool display names to hedge, e.g. :data:`READ_ONLY_SEARCH_TOOLS`
+        delay: Fixed hedge delay in seconds; None uses the observed ``quantile`` latency
+        quantile: Latency quantile used as the hedge delay when ``delay`` is None
+        min_samples: Latency samples needed before the quantile is trusted
+        fallback_delay: Hedge delay in seconds until enough samples are collected
+        window: Number of recent latency samples kept per tool
+        max_hedge_ratio: Maximum fraction of calls that may send a hedge
+        max_sync_calls: Maximum sync calls hedged at once; further calls are
+            made unhedged on the caller's thread
+    """
+
+    tools: frozenset[str] = frozenset()
+    delay: float | None = None
+    quantile: float = 0.95
+    min_samples: int = 20
+    fallback_delay: float = 1.0
+    window: int = 200
+    max_hedge_ratio: float = 0.05
+    max_sync_calls: int = DEFAULT_MAX_SYNC_CALLS
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Snapshot of hedging counters.
+
+    Attributes:
+        calls: Hedge-eligible calls
+        hedges: Hedge requests sent
+        hedge_wins: Calls answered by the hedge rather than the first request
+        throttled: Hedges skipped because of ``max_hedge_ratio``
+    """
+
+    calls: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    throttled: int = 0
+
+
+class Hedger:
+    """Sends hedge requests for slow calls to opted-in tools.
+
+    Async calls cancel the losing request. Sync calls start the first request
+    on a thread of its own, so it never queues behind other calls, and send
+    the hedge through a shared thread pool; the losing request can't be
+    interrupted and finishes in the background, its result discarded. At
+    most ``max_sync_calls`` first requests run on their own threads at once.
+
+    The hedge delay is derived from the latency of first requests only, so
+    hedges that win don't pull it down.
+    """
+
+    def __init__(self, policy: HedgePolicy | None = None) -> None:
+        """Initialize the hedger.
+
+        Args:
+            policy: The hedge policy; the default hedges nothing
+        """
+        self._policy = policy or HedgePolicy()
+        self._latencies: dict[str, deque[float]] = {}
+        self._tokens = 0.0
+        self._calls = self._hedges = self._hedge_wins = self._throttled = 0
+        self._primaries = 0
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def policy(self) -> HedgePolicy:
+        """The current hedge policy."""
+        return self._policy
+
+    def configure(self, policy: HedgePolicy) -> None:
+        """Replace the policy and reset latency samples and counters.
+
+        Args:
+            policy: The new hedge policy
+        """
+        with self._lock:
+            self._policy = policy
+            self._latencies.clear()
+            self._tokens = 0.0
+            self._calls = self._hedges = self._hedge_wins = self._throttled = 0
+
+    @property
+    def stats(self) -> HedgeStats:
+        """A snapshot of the hedging counters."""
+        with self._lock:
+            return HedgeStats(self._calls, self._hedges, self._hedge_wins, self._throttled)
+
+    def hedges(self, tool_display_name: str) -> bool:
+        """Whether calls to a tool are hedged under the current policy.
+
+        Args:
+            tool_display_name: The Glean tool display name
+
+        Returns:
+            True if the tool is opted in
+        """
+        return tool_display_name in self._policy.tools
+
+    def hedge_delay(self, tool_display_name: str) -> float:
+        """Get the delay after which a call to a tool is hedged.
+
+        Args:
+            tool_display_name: The Glean tool display name
+
+        Returns:
+            The delay in seconds
+        """
+        policy = self._policy
+        if policy.delay is not None:
+            return policy.delay
+        with self._lock:
+            samples = sorted(self._latencies.get(tool_display_name, ()))
+        if len(samples) < policy.min_samples:
+            return policy.fallback_delay
+        return samples[min(len(samples) - 1, int(policy.quantile * len(samples)))]
+
+    def call(self, tool_display_name: str, fn: Callable[[], T]) -> T:
+        """Call ``fn``, hedging it if it's slow and the tool is opted in.
+
+        Args:
+            tool_display_name: The Glean tool display name
+            fn: Function making one request; it runs in a copy of the caller's context
+
+        Returns:
+            The result of the first request to succeed
+
+        Raises:
+            Exception: The first request's exception if both requests failed
+        """
+        if not self.hedges(tool_display_name):
+            return fn()
+        primary = self._start_primary(tool_display_name, fn)
+        if primary is None:
+            return fn()
+
+        self._start_call()
+        delay = self.hedge_delay(tool_display_name)
+        futures = [primary]
+        if not wait(futures, timeout=delay).done and self._take_hedge():
+            futures.append(self._get_executor().submit(contextvars.copy_context().run, fn))
+
+        pending: set[Future[T]] = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((f for f in futures if f in done and f.exception() is None), None)
+            if winner is not None:
+                for future in pending:
+                    future.cancel()
+                if winner is not primary:
+                    self._record_hedge_win()
+                return winner.result()
+        return primary.result()
+
+    async def call_async(self, tool_display_name: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn``, hedging it if it's slow and the tool is opted in.
+
+        Args:
+            tool_display_name: The Glean tool display name
+            fn: Coroutine function making one request
+
+        Returns:
+            The result of the first request to succeed
+
+        Raises:
+            Exception: The first request's exception if both requests failed
+        """
+        if not self.hedges(tool_display_name):
+            return await fn()
+
+        self._start_call()
+        delay = self.hedge_delay(tool_display_name)
+        start = time.perf_counter()
+        primary: asyncio.Task[T] = asyncio.ensure_future(fn())
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and self._take_hedge():
+                tasks.append(asyncio.ensure_future(fn()))
+
+            pending: set[asyncio.Task[T]] = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next(
+                    (t for t in tasks if t in done and not t.cancelled() and t.exception() is None),
+                    None,
+                )
+                if winner is not None:
+                    # A primary cancelled because the hedge won took at least
+                    # this long, which keeps its sample above the delay.
+                    self._record_latency(tool_display_name, time.perf_counter() - start)
+                    if winner is not primary:
+                        self._record_hedge_win()
+                    return winner.result()
+            return primary.result()
+        finally:
+            _cancel(tasks)
+
+    def _start_call(self) -> None:
+        """Count a hedge-eligible call and earn hedge budget for it."""
+        with self._lock:
+            self._calls += 1
+            ratio = self._policy.max_hedge_ratio
+            self._tokens = min(max(1.0, ratio * 10), self._tokens + ratio)
+
+    def _take_hedge(self) -> bool:
+        """Spend hedge budget on a hedge request if there's enough."""
+        with self._lock:
+            if self._tokens < 1:
+                self._throttled += 1
+                return False
+            self._tokens -= 1
+            self._hedges += 1
+            return True
+
+    def _start_primary(self, tool_display_name: str, fn: Callable[[], T]) -> Future[T] | None:
+        """Start the first request of a sync call on its own thread.
+
+        Its latency is recorded when it succeeds, even if the hedge won.
+
+        Returns:
+            The request's future, or None if ``max_sync_calls`` first requests
+            are already running
+        """
+        with self._lock:
+            if self._primaries >= self._policy.max_sync_calls:
+                return None
+            self._primaries += 1
+
+        future: Future[T] = Future()
+        context = contextvars.copy_context()
+        start = time.perf_counter()
+
+        def run() -> None:
+            # The thread is released before the result is published, so a
+            # returning call never holds up the next one.
+            if not future.set_running_or_notify_cancel():
+                self._release_primary()
+                return
+            try:
+                result = context.run(fn)
+            except BaseException as exc:
+                self._release_primary()
+                future.set_exception(exc)
+            else:
+                self._record_latency(tool_display_name, time.perf_counter() - start)
+                self._release_primary()
+                future.set_result(result)
+
+        try:
+            threading.Thread(target=run, name="glean-hedge-primary", daemon=True).start()
+        except BaseException:
+            self._release_primary()
+            raise
+        return future
+
+    def _release_primary(self) -> None:
+        """Count a first request's thread as finished."""
+        with self._lock:
+            self._primaries -= 1
+
+    def _record_latency(self, tool_display_name: str, latency: float) -> None:
+        """Record the latency of a successful first request."""
+        with self._lock:
+            samples = self._latencies.get(tool_display_name)
+            if samples is None or samples.maxlen != self._policy.window:
+                samples = self._latencies[tool_display_name] = deque(
+                    samples or (), maxlen=self._policy.window
+                )
+            samples.append(latency)
+
+    def _record_hedge_win(self) -> None:
+        """Count a call answered by its hedge."""
+        with self._lock:
+            self._hedge_wins += 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool for sync hedged calls, creating it on first use."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="glean-hedge"
+                    )
+        return self._executor
+
+
+def _cancel(tasks: Iterable[asyncio.Future[Any]]) -> None:
+    """Cancel tasks that haven't finished."""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+
+
+_HEDGER = Hedger()
+
+
+def get_hedger() -> Hedger:
+    """Get the global hedger used by the built-in tools.
+
+    Returns:
+        The global hedger
+    """
+    return _HEDGER
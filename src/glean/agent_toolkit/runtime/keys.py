@@ -0,0 +1,84 @@
+"""Canonical keys and size estimates for tool calls."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def canonical_parameters(parameters: Any) -> Any:
+    """Convert tool call parameters to a canonical, JSON-serializable form.
+
+    Pydantic models (such as ``ToolsCallParameter``) are dumped without unset
+    fields, and mappings are ordered by key, so that equivalent parameter sets
+    produce the same value regardless of construction order.
+
+    Args:
+        parameters: Tool call parameters
+
+    Returns:
+        The canonical form of the parameters
+    """
+    if isinstance(parameters, BaseModel):
+        parameters = parameters.model_dump(mode="json", exclude_none=True)
+    if isinstance(parameters, Mapping):
+        return {str(k): canonical_parameters(v) for k, v in sorted(parameters.items())}
+    if isinstance(parameters, list | tuple):
+        return [canonical_parameters(v) for v in parameters]
+    return parameters
+
+
+def credential_scope(instance: str, api_token: str) -> str:
+    """Derive a non-reversible scope identifier for an instance and token.
+
+    Tool results are permission-aware, so keys must never be shared across
+    credentials. The token itself is hashed rather than stored.
+
+    Args:
+        instance: The Glean instance name
+        api_token: The Glean API token
+
+    Returns:
+        A short hex digest identifying the credentials
+    """
+    return hashlib.sha256(f"{instance}\0{api_token}".encode()).hexdigest()[:16]
+
+
+def tool_call_key(tool_display_name: str, parameters: Any, scope: str = "") -> str:
+    """Build a stable key for a tool call.
+
+    Args:
+        tool_display_name: The Glean tool display name
+        parameters: Tool call parameters
+        scope: Credential scope, see :func:`credential_scope`
+
+    Returns:
+        A hex digest identifying the call
+    """
+    payload = json.dumps(
+        [scope, tool_display_name, canonical_parameters(parameters)],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def payload_size(value: Any) -> int:
+    """Estimate the serialized size of a tool result in bytes.
+
+    Args:
+        value: The tool result
+
+    Returns:
+        The approximate size in bytes
+    """
+    if isinstance(value, BaseModel):
+        return len(value.model_dump_json())
+    if isinstance(value, bytes | str):
+        return len(value)
+    return len(json.dumps(value, default=str))
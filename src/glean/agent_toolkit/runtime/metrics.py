@@ -0,0 +1,556 @@
+"""Metrics for tool calls: latency, calls in flight, errors and response sizes."""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import inspect
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from glean.agent_toolkit.runtime.keys import payload_size
+from glean.agent_toolkit.runtime.tracing import OTHER_ERROR
+
+CallableT = TypeVar("CallableT", bound=Callable[..., Any])
+
+# Source label of calls made through ``run_tool``; adapter invocations are
+# labeled with the adapter name.
+RUN_TOOL_SOURCE = "run_tool"
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+DEFAULT_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class MetricsSink(ABC):
+    """Destination for tool call metrics.
+
+    Implementations are called on the tool call path, from any thread, and
+    should return quickly without raising.
+    """
+
+    @abstractmethod
+    def call_started(self, tool: str, source: str) -> None:
+        """Record that a call started.
+
+        Args:
+            tool: The tool display name for ``run_tool`` calls, else the tool name
+            source: ``run_tool`` or the adapter name
+        """
+
+    @abstractmethod
+    def call_finished(
+        self,
+        tool: str,
+        source: str,
+        latency: float,
+        size: int | None,
+        error_type: str | None,
+    ) -> None:
+        """Record that a call finished.
+
+        Args:
+            tool: The tool display name for ``run_tool`` calls, else the tool name
+            source: ``run_tool`` or the adapter name
+            latency: Wall-clock seconds the call took
+            size: Estimated size of the result in bytes, if measured
+            error_type: Class of the error the call failed with, or None if it succeeded
+        """
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Snapshot of a histogram.
+
+    Attributes:
+        buckets: Upper bounds of the buckets
+        counts: Observations per bucket, plus a final one for those above the last bound
+        count: Number of observations
+        sum: Sum of the observations
+    """
+
+    buckets: tuple[float, ...]
+    counts: tuple[int, ...]
+    count: int = 0
+    sum: float = 0.0
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile as the upper bound of the bucket it falls in.
+
+        Args:
+            q: The quantile, e.g. 0.99
+
+        Returns:
+            The estimate, infinity if it's above the last bucket, or None without observations
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+@dataclass(frozen=True)
+class ToolMetricsSnapshot:
+    """Snapshot of the metrics of one tool and source.
+
+    Attributes:
+        calls: Finished calls
+        errors: Failed calls keyed by error class
+        in_flight: Calls currently running
+        peak_in_flight: Highest number of calls running at once
+        latency: Latency histogram in seconds
+        size: Response size histogram in bytes
+    """
+
+    calls: int
+    errors: Mapping[str, int]
+    in_flight: int
+    peak_in_flight: int
+    latency: HistogramSnapshot
+    size: HistogramSnapshot
+
+
+class _Histogram:
+    """Fixed-bucket histogram. Not thread-safe."""
+
+    __slots__ = ("buckets", "count", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(self.buckets, tuple(self.counts), self.count, self.sum)
+
+
+class _Series:
+    """In-memory metrics of one tool and source. Not thread-safe."""
+
+    __slots__ = ("calls", "errors", "in_flight", "latency", "peak_in_flight", "size")
+
+    def __init__(self, latency_buckets: tuple[float, ...], size_buckets: tuple[float, ...]) -> None:
+        self.calls = 0
+        self.errors: dict[str, int] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.latency = _Histogram(latency_buckets)
+        self.size = _Histogram(size_buckets)
+
+
+class InMemorySink(MetricsSink):
+    """Sink that keeps metrics in process, for tests and ad hoc inspection."""
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+    ) -> None:
+        """Initialize the sink.
+
+        Args:
+            latency_buckets: Upper bounds of the latency buckets in seconds
+            size_buckets: Upper bounds of the response size buckets in bytes
+        """
+        self._latency_buckets = tuple(sorted(latency_buckets))
+        self._size_buckets = tuple(sorted(size_buckets))
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def call_started(self, tool: str, source: str) -> None:
+        """Count a call in flight."""
+        with self._lock:
+            series = self._get(tool, source)
+            series.in_flight += 1
+            series.peak_in_flight = max(series.peak_in_flight, series.in_flight)
+
+    def call_finished(
+        self,
+        tool: str,
+        source: str,
+        latency: float,
+        size: int | None,
+        error_type: str | None,
+    ) -> None:
+        """Record a finished call."""
+        with self._lock:
+            series = self._get(tool, source)
+            series.in_flight -= 1
+            series.calls += 1
+            series.latency.observe(latency)
+            if size is not None:
+                series.size.observe(size)
+            if error_type is not None:
+                series.errors[error_type] = series.errors.get(error_type, 0) + 1
+
+    def snapshot(self, tool: str, source: str = RUN_TOOL_SOURCE) -> ToolMetricsSnapshot:
+        """Get the metrics of a tool.
+
+        Args:
+            tool: The tool display name for ``run_tool`` calls, else the tool name
+            source: ``run_tool`` or the adapter name
+
+        Returns:
+            A snapshot of the tool's metrics, empty if it hasn't been called
+        """
+        with self._lock:
+            series = self._series.get((tool, source)) or _Series(
+                self._latency_buckets, self._size_buckets
+            )
+            return ToolMetricsSnapshot(
+                calls=series.calls,
+                errors=dict(series.errors),
+                in_flight=series.in_flight,
+                peak_in_flight=series.peak_in_flight,
+                latency=series.latency.snapshot(),
+                size=series.size.snapshot(),
+            )
+
+    def tools(self) -> list[tuple[str, str]]:
+        """List the tools with metrics.
+
+        Returns:
+            ``(tool, source)`` pairs
+        """
+        with self._lock:
+            return list(self._series)
+
+    def clear(self) -> None:
+        """Forget all metrics."""
+        with self._lock:
+            self._series.clear()
+
+    def _get(self, tool: str, source: str) -> _Series:
+        """Get the series of a tool, creating it if needed. Lock must be held."""
+        series = self._series.get((tool, source))
+        if series is None:
+            series = self._series[(tool, source)] = _Series(
+                self._latency_buckets, self._size_buckets
+            )
+        return series
+
+
+class PrometheusSink(MetricsSink):
+    """Sink that exports metrics with ``prometheus_client``.
+
+    Registers four metrics, labeled by ``tool`` and ``source``:
+    ``<namespace>_tool_call_duration_seconds`` and
+    ``<namespace>_tool_response_size_bytes`` histograms,
+    ``<namespace>_tool_calls_in_flight`` gauge, and
+    ``<namespace>_tool_call_errors_total`` counter, also labeled by ``error_type``.
+    """
+
+    def __init__(
+        self,
+        registry: Any | None = None,
+        namespace: str = "glean",
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+    ) -> None:
+        """Register the metrics.
+
+        Args:
+            registry: Collector registry; defaults to the global one
+            namespace: Prefix of the metric names
+            latency_buckets: Upper bounds of the latency buckets in seconds
+            size_buckets: Upper bounds of the response size buckets in bytes
+
+        Raises:
+            ImportError: If ``prometheus_client`` isn't installed
+        """
+        try:
+            import prometheus_client
+        except ImportError as exc:
+            raise ImportError(
+                "prometheus_client is required for Prometheus metrics. "
+                "Install it with `pip install agent_toolkit[prometheus]`."
+            ) from exc
+
+        options: dict[str, Any] = {"namespace": namespace}
+        if registry is not None:
+            options["registry"] = registry
+        labels = ("tool", "source")
+        self._latency = prometheus_client.Histogram(
+            "tool_call_duration_seconds",
+            "Latency of Glean tool calls",
+            labels,
+            buckets=tuple(latency_buckets),
+            **options,
+        )
+        self._size = prometheus_client.Histogram(
+            "tool_response_size_bytes",
+            "Estimated size of Glean tool results",
+            labels,
+            buckets=tuple(size_buckets),
+            **options,
+        )
+        self._in_flight = prometheus_client.Gauge(
+            "tool_calls_in_flight", "Glean tool calls running", labels, **options
+        )
+        self._errors = prometheus_client.Counter(
+            "tool_call_errors", "Failed Glean tool calls", (*labels, "error_type"), **options
+        )
+
+    def call_started(self, tool: str, source: str) -> None:
+        """Count a call in flight."""
+        self._in_flight.labels(tool, source).inc()
+
+    def call_finished(
+        self,
+        tool: str,
+        source: str,
+        latency: float,
+        size: int | None,
+        error_type: str | None,
+    ) -> None:
+        """Record a finished call."""
+        self._in_flight.labels(tool, source).dec()
+        self._latency.labels(tool, source).observe(latency)
+        if size is not None:
+            self._size.labels(tool, source).observe(size)
+        if error_type is not None:
+            self._errors.labels(tool, source, error_type).inc()
+
+
+class StatsDSink(MetricsSink):
+    """Sink that sends metrics to a StatsD agent over UDP, with DogStatsD-style tags.
+
+    Sends ``<prefix>.tool.duration`` timings in milliseconds,
+    ``<prefix>.tool.response_size`` histograms, ``<prefix>.tool.in_flight``
+    gauge deltas, and ``<prefix>.tool.errors`` counts tagged with ``error_type``.
+    Sending never blocks, and packets that can't be sent are dropped.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8125, prefix: str = "glean") -> None:
+        """Open the UDP socket.
+
+        Args:
+            host: StatsD agent host
+            port: StatsD agent port
+            prefix: Prefix of the metric names
+        """
+        self._address = (host, port)
+        self._prefix = prefix
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def call_started(self, tool: str, source: str) -> None:
+        """Count a call in flight."""
+        self._send(f"{self._prefix}.tool.in_flight:+1|g{_tags(tool, source)}")
+
+    def call_finished(
+        self,
+        tool: str,
+        source: str,
+        latency: float,
+        size: int | None,
+        error_type: str | None,
+    ) -> None:
+        """Record a finished call."""
+        tags = _tags(tool, source)
+        lines = [
+            f"{self._prefix}.tool.in_flight:-1|g{tags}",
+            f"{self._prefix}.tool.duration:{latency * 1000:.3f}|ms{tags}",
+        ]
+        if size is not None:
+            lines.append(f"{self._prefix}.tool.response_size:{size}|h{tags}")
+        if error_type is not None:
+            lines.append(f"{self._prefix}.tool.errors:1|c{tags},error_type:{_tag(error_type)}")
+        self._send("\n".join(lines))
+
+    def close(self) -> None:
+        """Close the socket."""
+        self._socket.close()
+
+    def _send(self, payload: str) -> None:
+        try:
+            self._socket.sendto(payload.encode(), self._address)
+        except OSError:
+            pass
+
+
+def _tag(value: str) -> str:
+    """Make a value safe to use in a StatsD tag."""
+    return value.replace(" ", "_").replace(",", "_").replace("|", "_").replace(":", "_").lower()
+
+
+@functools.lru_cache(maxsize=1024)
+def _tags(tool: str, source: str) -> str:
+    """Build the tags of a tool's StatsD metrics."""
+    return f"|#tool:{_tag(tool)},source:{_tag(source)}"
+
+
+@dataclass(frozen=True)
+class MetricsPolicy:
+    """Where and what tool call metrics are recorded.
+
+    Attributes:
+        sink: Destination of the metrics, or None to record nothing
+        record_sizes: Whether response sizes are measured. Off by default,
+            since it serializes each successful result to estimate its size;
+            traced ``run_tool`` calls reuse the measurement for their span.
+    """
+
+    sink: MetricsSink | None = None
+    record_sizes: bool = False
+
+
+@dataclass(slots=True)
+class _Call:
+    """A call being measured, and the sink that counted it in flight."""
+
+    sink: MetricsSink
+    tool: str
+    source: str
+    start: float = field(default_factory=time.perf_counter)
+
+
+class MetricsRecorder:
+    """Records tool call metrics into the configured sink.
+
+    While no sink is configured, callers check :attr:`enabled` and skip all
+    recording, so the only cost is that attribute check.
+    """
+
+    def __init__(self, policy: MetricsPolicy | None = None) -> None:
+        """Initialize the recorder.
+
+        Args:
+            policy: Metrics policy; defaults to recording nothing
+        """
+        self.enabled = False
+        self._policy = MetricsPolicy()
+        self.configure(policy or MetricsPolicy())
+
+    @property
+    def policy(self) -> MetricsPolicy:
+        """The current metrics policy."""
+        return self._policy
+
+    def configure(self, policy: MetricsPolicy) -> None:
+        """Replace the metrics policy.
+
+        Args:
+            policy: The new policy
+        """
+        self._policy = policy
+        self.enabled = policy.sink is not None
+
+    def start(self, tool: str, source: str = RUN_TOOL_SOURCE) -> _Call | None:
+        """Record the start of a call.
+
+        Args:
+            tool: The tool display name for ``run_tool`` calls, else the tool name
+            source: ``run_tool`` or the adapter name
+
+        Returns:
+            The call to pass to :meth:`finish`, or None if metrics are disabled
+        """
+        sink = self._policy.sink
+        if sink is None:
+            return None
+        sink.call_started(tool, source)
+        return _Call(sink, tool, source)
+
+    def finish(self, call: _Call | None, result: Any, error_type: str | None = None) -> int | None:
+        """Record the end of a call.
+
+        Args:
+            call: The call returned by :meth:`start`
+            result: What the call returned: a tool response ``{"result": ..., "error": ...}``
+                or a plain result; None if it raised
+            error_type: Class of the error the call failed with, if known
+
+        Returns:
+            The result size, if it was measured, so that it needn't be measured again
+        """
+        if call is None:
+            return None
+        latency = time.perf_counter() - call.start
+        size = None
+        if isinstance(result, dict) and "result" in result:
+            if result.get("error"):
+                error_type = error_type or OTHER_ERROR
+            else:
+                result = result["result"]
+        if error_type is None and result is not None and self._policy.record_sizes:
+            size = payload_size(result)
+        call.sink.call_finished(call.tool, call.source, latency, size, error_type)
+        return size
+
+
+def measured(func: CallableT, source: str, tool: str) -> CallableT:
+    """Wrap a tool function so that each invocation is measured.
+
+    The wrapper keeps the function's name, docstring and signature, and checks
+    whether metrics are enabled on every call.
+
+    Args:
+        func: The tool function, sync or async
+        source: The adapter name, e.g. ``langchain``
+        tool: The registered tool name
+
+    Returns:
+        The wrapped function
+    """
+    recorder = get_metrics_recorder()
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def measured_async(*args: Any, **kwargs: Any) -> Any:
+            if not recorder.enabled:
+                return await func(*args, **kwargs)
+            call = recorder.start(tool, source)
+            try:
+                result = await func(*args, **kwargs)
+            except BaseException as exc:
+                recorder.finish(call, None, type(exc).__qualname__)
+                raise
+            recorder.finish(call, result)
+            return result
+
+        return measured_async  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def measured_sync(*args: Any, **kwargs: Any) -> Any:
+        if not recorder.enabled:
+            return func(*args, **kwargs)
+        call = recorder.start(tool, source)
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            recorder.finish(call, None, type(exc).__qualname__)
+            raise
+        recorder.finish(call, result)
+        return result
+
+    return measured_sync  # type: ignore[return-value]
+
+
+_METRICS_RECORDER = MetricsRecorder()
+
+
+def get_metrics_recorder() -> MetricsRecorder:
+    """Get the global metrics recorder used by the built-in tools and the adapters.
+
+    Returns:
+        The global metrics recorder
+    """
+    return _METRICS_RECORDER
@@ -0,0 +1,481 @@
+"""Process-wide pool of reusable Glean API clients."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import importlib.util
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from glean.api_client import Glean
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_MAX_CLIENTS = 64
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """Limits on the pooled clients and their connections.
+
+    Attributes:
+        max_connections: Maximum number of concurrent connections per client
+        max_keepalive_connections: Maximum number of idle connections kept open
+        keepalive_expiry: Seconds an idle connection is kept before being closed
+        max_clients: Maximum number of instance and token pairs with a pooled
+            client; the least recently used one is closed to make room
+        idle_timeout: Seconds a client may go unused before it is closed
+    """
+
+    max_connections: int | None = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY
+    max_clients: int | None = DEFAULT_MAX_CLIENTS
+    idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT
+
+    def to_httpx(self) -> httpx.Limits:
+        """Convert to ``httpx.Limits``.
+
+        Returns:
+            The equivalent httpx limits
+        """
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """How pooled clients reach the Glean API.
+
+    By default each instance and token pair gets its own HTTP/1.1 clients with
+    the pool's connection limits. Pre-configured clients replace that
+    entirely and are shared by every tenant; the pool never closes them.
+
+    A custom ``transport`` or ``async_transport`` is used as is: httpx doesn't
+    apply the pool's :class:`PoolLimits`, HTTP/2, proxy or TLS settings to it,
+    so configure those on the transport itself, e.g.
+    ``httpx.HTTPTransport(limits=limits.to_httpx(), http2=True)``.
+
+    Attributes:
+        server_url: Base URL used instead of the instance's, e.g. a local stand-in for load tests
+        http2: Whether to negotiate HTTP/2; requires ``pip install agent_toolkit[http2]``
+        proxy: Proxy URL for every request
+        verify: TLS verification setting passed to httpx, e.g. a CA bundle path
+        transport: httpx transport for sync clients, e.g. ``httpx.MockTransport``;
+            can't be combined with ``http2``, ``proxy`` or ``verify``
+        async_transport: httpx transport for async clients; same restrictions
+        http_client: Pre-configured sync client to use instead of creating one
+        async_http_client: Pre-configured async client to use instead of
+            creating one; it must only be used from a single event loop
+    """
+
+    server_url: str | None = None
+    http2: bool = False
+    proxy: str | None = None
+    verify: bool | str = True
+    transport: httpx.BaseTransport | None = None
+    async_transport: httpx.AsyncBaseTransport | None = None
+    http_client: httpx.Client | None = None
+    async_http_client: httpx.AsyncClient | None = None
+
+    def __post_init__(self) -> None:
+        """Check that the settings can take effect.
+
+        Raises:
+            ValueError: If a custom transport is combined with settings that
+                httpx would silently ignore for it
+            ImportError: If ``http2`` is set and the ``h2`` package is missing
+        """
+        if self.transport is not None or self.async_transport is not None:
+            ignored = [
+                name
+                for name, is_set in (
+                    ("http2", self.http2),
+                    ("proxy", self.proxy is not None),
+                    ("verify", self.verify is not True),
+                )
+                if is_set
+            ]
+            if ignored:
+                raise ValueError(
+                    f"{', '.join(ignored)} can't be combined with a custom transport; "
+                    "configure the transport instead"
+                )
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "The h2 package is required for HTTP/2. "
+                "Install it with `pip install agent_toolkit[http2]`."
+            )
+
+    def client_options(self) -> dict[str, Any]:
+        """Get the ``Glean`` constructor arguments for unpooled clients.
+
+        Returns:
+            The configured server URL and pre-configured clients, if any
+        """
+        options = {
+            "server_url": self.server_url,
+            "client": self.http_client,
+            "async_client": self.async_http_client,
+        }
+        return {name: value for name, value in options.items() if value is not None}
+
+
+# An evicted sync client and its async clients with their event loops; None
+# stands for a client that the pool doesn't own and mustn't close.
+_Evicted = tuple[
+    httpx.Client | None, list[tuple[asyncio.AbstractEventLoop, httpx.AsyncClient | None]]
+]
+
+
+@dataclass
+class _Entry:
+    g_client: Glean
+    http_client: httpx.Client
+    last_used: float
+    owned: bool = True
+    # Requests holding the entry through ClientPool.lease, and the clients to
+    # close once the last of them finishes if the entry was evicted meanwhile.
+    leases: int = 0
+    evicted: _Evicted | None = None
+
+
+class ClientPool:
+    """Pool of Glean clients keyed by instance and API token.
+
+    Each entry owns a keep-alive ``httpx.Client`` so that repeated tool calls
+    against the same instance reuse TCP/TLS connections instead of paying a new
+    handshake per call. Async clients are pooled per event loop, because httpx
+    async connections cannot be shared across loops.
+
+    The pool serves many tenants at once but stays bounded: when a new
+    instance and token pair would exceed ``max_clients``, or a client has been
+    idle for longer than ``idle_timeout``, that client and its connections are
+    closed. Clients with requests in flight, as marked by :meth:`lease`, are
+    only evicted when every client is busy, and are closed once their last
+    request finishes.
+    """
+
+    def __init__(
+        self,
+        limits: PoolLimits | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        transport: TransportConfig | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            limits: Limits on the pooled clients and their connections
+            clock: Monotonic clock returning seconds
+            transport: How clients reach the Glean API; defaults to direct HTTP/1.1
+        """
+        self._limits = limits or PoolLimits()
+        self._clock = clock
+        self._transport = transport or TransportConfig()
+        self._clients: dict[tuple[str, str], _Entry] = {}
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            dict[tuple[str, str], tuple[Glean, httpx.AsyncClient | None]],
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def limits(self) -> PoolLimits:
+        """Limits applied to newly created clients."""
+        return self._limits
+
+    @property
+    def transport(self) -> TransportConfig:
+        """How newly created clients reach the Glean API."""
+        return self._transport
+
+    def configure(self, limits: PoolLimits, transport: TransportConfig | None = None) -> None:
+        """Change the limits and the transport.
+
+        Existing clients are dropped so that subsequent calls pick up the new
+        settings, and closed once their requests in flight finish.
+
+        Args:
+            limits: The new limits
+            transport: The new transport configuration; None uses direct HTTP/1.1
+        """
+        with self._lock:
+            self._limits = limits
+            self._transport = transport or TransportConfig()
+            clients = self._drain()
+        self._close_entries(clients)
+
+    def get(self, instance: str, api_token: str) -> Glean:
+        """Get the pooled client for an instance and token, creating it if needed.
+
+        Args:
+            instance: The Glean instance name
+            api_token: The Glean API token
+
+        Returns:
+            A Glean client backed by a keep-alive connection pool
+        """
+        key = (instance, api_token)
+        entry = self._clients.get(key)
+        if entry is not None:
+            entry.last_used = self._clock()
+            return entry.g_client
+
+        with self._lock:
+            return self._get_or_create(key).g_client
+
+    def get_async(self, instance: str, api_token: str) -> Glean:
+        """Get the pooled client for async calls on the running event loop.
+
+        Args:
+            instance: The Glean instance name
+            api_token: The Glean API token
+
+        Returns:
+            A Glean client backed by a keep-alive async connection pool
+
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        loop = asyncio.get_running_loop()
+        key = (instance, api_token)
+        entry = self._async_clients.get(loop, {}).get(key)
+        sync_entry = self._clients.get(key)
+        if entry is not None and sync_entry is not None:
+            sync_entry.last_used = self._clock()
+            return entry[0]
+
+        with self._lock:
+            http_client = self._get_or_create(key).http_client
+            loop_clients = self._async_clients.setdefault(loop, {})
+            entry = loop_clients.get(key)
+            if entry is None:
+                transport = self._transport
+                async_http_client = transport.async_http_client or httpx.AsyncClient(
+                    follow_redirects=True,
+                    limits=self._limits.to_httpx(),
+                    http2=transport.http2,
+                    proxy=transport.proxy,
+                    verify=transport.verify,
+                    transport=transport.async_transport,
+                )
+                g_client = Glean(
+                    api_token=api_token,
+                    instance=instance,
+                    server_url=transport.server_url,
+                    client=http_client,
+                    async_client=async_http_client,
+                )
+                owned = None if transport.async_http_client else async_http_client
+                entry = (g_client, owned)
+                loop_clients[key] = entry
+            return entry[0]
+
+    @contextmanager
+    def lease(self, instance: str, api_token: str) -> Iterator[None]:
+        """Mark the clients of an instance and token as in use for the block.
+
+        A client evicted while leased keeps working and is closed when the
+        last lease on it ends, so eviction never fails a request in flight.
+
+        Args:
+            instance: The Glean instance name
+            api_token: The Glean API token
+        """
+        with self._lock:
+            entry = self._get_or_create((instance, api_token))
+            entry.leases += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                entry.leases -= 1
+                evicted = entry.evicted if entry.leases == 0 else None
+                entry.evicted = None
+            if evicted is not None:
+                self._close_entries([evicted])
+
+    def evict_idle(self) -> int:
+        """Close clients that have been idle for longer than ``idle_timeout``.
+
+        This also happens whenever a new client is created; call it
+        periodically to release idle tenants' connections sooner.
+
+        Returns:
+            The number of clients closed
+        """
+        with self._lock:
+            evicted = self._evict_idle()
+        self._close_entries(evicted)
+        return len(evicted)
+
+    def _get_or_create(self, key: tuple[str, str]) -> _Entry:
+        """Get or create the sync entry for a key. Must be called with the lock held."""
+        now = self._clock()
+        entry = self._clients.get(key)
+        if entry is not None:
+            entry.last_used = now
+            return entry
+
+        evicted = self._evict_idle()
+        max_clients = self._limits.max_clients
+        while max_clients is not None and self._clients and len(self._clients) >= max_clients:
+            lru = min(
+                self._clients,
+                key=lambda k: (self._clients[k].leases > 0, self._clients[k].last_used),
+            )
+            evicted.extend(self._pop(lru))
+        # Closing only schedules work for async clients, so it is safe under the lock.
+        self._close_entries(evicted)
+
+        instance, api_token = key
+        transport = self._transport
+        http_client = transport.http_client or httpx.Client(
+            follow_redirects=True,
+            limits=self._limits.to_httpx(),
+            http2=transport.http2,
+            proxy=transport.proxy,
+            verify=transport.verify,
+            transport=transport.transport,
+        )
+        g_client = Glean(
+            api_token=api_token,
+            instance=instance,
+            server_url=transport.server_url,
+            client=http_client,
+        )
+        entry = self._clients[key] = _Entry(
+            g_client, http_client, now, owned=transport.http_client is None
+        )
+        return entry
+
+    def _evict_idle(self) -> list[_Evicted]:
+        """Remove entries idle past the idle timeout. Must be called with the lock held."""
+        idle_timeout = self._limits.idle_timeout
+        if idle_timeout is None:
+            return []
+        cutoff = self._clock() - idle_timeout
+        idle = [
+            key
+            for key, entry in self._clients.items()
+            if entry.last_used <= cutoff and entry.leases == 0
+        ]
+        return [evicted for key in idle for evicted in self._pop(key)]
+
+    def _pop(self, key: tuple[str, str]) -> list[_Evicted]:
+        """Remove a key's sync and async clients. Must be called with the lock held.
+
+        Returns:
+            The clients to close now: none if the entry is leased, in which
+            case they are closed when its last lease ends
+        """
+        entry = self._clients.pop(key)
+        async_http_clients = []
+        for loop, loop_clients in self._async_clients.items():
+            async_entry = loop_clients.pop(key, None)
+            if async_entry is not None:
+                async_http_clients.append((loop, async_entry[1]))
+        evicted = (entry.http_client if entry.owned else None), async_http_clients
+        if entry.leases > 0:
+            entry.evicted = evicted
+            return []
+        return [evicted]
+
+    @staticmethod
+    def _close_entries(entries: list[_Evicted]) -> None:
+        """Close evicted clients; async ones are closed on their own event loop."""
+        for http_client, async_http_clients in entries:
+            if http_client is not None:
+                http_client.close()
+            for loop, async_http_client in async_http_clients:
+                if async_http_client is not None:
+                    _schedule_aclose(loop, async_http_client)
+
+    def close(self) -> None:
+        """Close every pooled sync client and its connections.
+
+        Clients with requests in flight are closed when their last lease ends.
+        Async clients are dropped from the pool; use :meth:`aclose` from the
+        owning event loop to close their connections explicitly.
+        """
+        with self._lock:
+            clients = self._drain()
+        self._close_entries(clients)
+
+    def _drain(self) -> list[_Evicted]:
+        """Remove every client from the pool. Must be called with the lock held.
+
+        Returns:
+            The sync clients the pool created that aren't leased, to close now
+        """
+        clients = []
+        for entry in self._clients.values():
+            evicted: _Evicted = (entry.http_client if entry.owned else None), []
+            if entry.leases > 0:
+                entry.evicted = evicted
+            else:
+                clients.append(evicted)
+        self._clients.clear()
+        self._async_clients.clear()
+        return clients
+
+    async def aclose(self) -> None:
+        """Close the async clients pooled for the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = list(self._async_clients.pop(loop, {}).values())
+        for _, async_http_client in clients:
+            if async_http_client is not None:
+                await async_http_client.aclose()
+
+    def __len__(self) -> int:
+        """Return the number of pooled clients."""
+        return len(self._clients)
+
+
+def _schedule_aclose(loop: asyncio.AbstractEventLoop, async_http_client: httpx.AsyncClient) -> None:
+    """Close an async client on its event loop, or leave it to be collected if the loop stopped."""
+
+    def aclose() -> None:
+        task = loop.create_task(async_http_client.aclose())
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+
+    if loop.is_closed():
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        aclose()
+    elif loop.is_running():
+        loop.call_soon_threadsafe(aclose)
+
+
+_closing: set[asyncio.Task[None]] = set()
+
+_CLIENT_POOL = ClientPool()
+atexit.register(_CLIENT_POOL.close)
+
+
+def get_client_pool() -> ClientPool:
+    """Get the global client pool instance.
+
+    Returns:
+        The global client pool instance
+    """
+    return _CLIENT_POOL
@@ -0,0 +1,299 @@
+"""Client-side token-bucket rate limiting per Glean instance and token."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+
+MIN_SWEEP_SIZE = 1024
+
+
+class RateLimitExceededError(Exception):
+    """Raised when a call can't acquire a rate limit token in time."""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A token-bucket rate.
+
+    Attributes:
+        rate: Tokens added per second, i.e. the sustained calls per second
+        burst: Bucket capacity, i.e. the calls allowed at once after a quiet period
+    """
+
+    rate: float
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate the rate.
+
+        Raises:
+            ValueError: If the rate or burst isn't positive
+        """
+        if self.rate <= 0 or self.burst < 1:
+            raise ValueError("Rate limits need a positive rate and a burst of at least 1")
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """Which calls are rate limited and how callers wait.
+
+    Limits apply per credentials (instance and API token). A call needs a token
+    from the credentials' bucket and, if its tool has an entry in ``per_tool``,
+    from that tool's bucket too. The default policy limits nothing.
+
+    Attributes:
+        default: Limit shared by all calls made with the same credentials
+        per_tool: Additional limits keyed by tool display name
+        blocking: Whether the built-in tools wait for a token (bounded by the
+            current deadline) or fail immediately when none is available
+    """
+
+    default: RateLimit | None = None
+    per_tool: Mapping[str, RateLimit] = field(default_factory=dict)
+    blocking: bool = True
+
+
+@dataclass(frozen=True)
+class RateLimitStats:
+    """Snapshot of rate limiter counters.
+
+    Attributes:
+        acquired: Tokens handed out
+        rejected: Acquisitions that failed because no token was available in time
+        waited: Total seconds callers were asked to wait
+    """
+
+    acquired: int = 0
+    rejected: int = 0
+    waited: float = 0.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket with reservations.
+
+    A caller that can't get a token immediately reserves the next one and is
+    told how long to wait for it, so waiting callers are served in order.
+    """
+
+    def __init__(self, limit: RateLimit, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            limit: The rate and capacity
+            clock: Monotonic clock returning seconds
+        """
+        self.limit = limit
+        self._clock = clock
+        self._tokens = float(limit.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, timeout: float | None = None) -> float | None:
+        """Reserve a token.
+
+        Args:
+            timeout: Longest acceptable wait in seconds, or None to wait as long as needed
+
+        Returns:
+            Seconds to wait before using the token, or None if the wait would
+            exceed ``timeout`` (nothing is reserved then)
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                float(self.limit.burst), self._tokens + (now - self._updated) * self.limit.rate
+            )
+            self._updated = now
+
+            wait = max(0.0, (1 - self._tokens) / self.limit.rate)
+            if timeout is not None and wait > timeout:
+                return None
+            self._tokens -= 1
+            return wait
+
+    def refund(self) -> None:
+        """Return a reserved token that won't be used."""
+        with self._lock:
+            self._tokens = min(float(self.limit.burst), self._tokens + 1)
+
+    @property
+    def full(self) -> bool:
+        """Whether the bucket has refilled to capacity, like a new bucket."""
+        with self._lock:
+            refilled = self._tokens + (self._clock() - self._updated) * self.limit.rate
+            return refilled >= self.limit.burst
+
+
+class RateLimiter:
+    """Rate limits tool calls per credentials and, optionally, per tool.
+
+    Buckets are created on first use. Once the number of buckets has doubled
+    since the last sweep (and is at least :data:`MIN_SWEEP_SIZE`), buckets
+    that have refilled are dropped: a new bucket would start out the same,
+    so callers seen once don't hold on to memory.
+    """
+
+    def __init__(
+        self,
+        policy: RateLimitPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            policy: The rate limit policy; the default limits nothing
+            clock: Monotonic clock returning seconds
+        """
+        self._policy = policy or RateLimitPolicy()
+        self._clock = clock
+        self._buckets: dict[tuple[str, str | None], TokenBucket] = {}
+        self._sweep_at = MIN_SWEEP_SIZE
+        self._acquired = 0
+        self._rejected = 0
+        self._waited = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def policy(self) -> RateLimitPolicy:
+        """The current rate limit policy."""
+        return self._policy
+
+    def configure(self, policy: RateLimitPolicy) -> None:
+        """Replace the policy, refilling all buckets and resetting the counters.
+
+        Args:
+            policy: The new rate limit policy
+        """
+        with self._lock:
+            self._policy = policy
+            self._buckets.clear()
+            self._sweep_at = MIN_SWEEP_SIZE
+            self._acquired = self._rejected = 0
+            self._waited = 0.0
+
+    @property
+    def stats(self) -> RateLimitStats:
+        """A snapshot of the limiter counters."""
+        with self._lock:
+            return RateLimitStats(self._acquired, self._rejected, self._waited)
+
+    def try_acquire(self, scope: str, tool_display_name: str) -> bool:
+        """Take a token without waiting.
+
+        Args:
+            scope: Credential scope, see :func:`~glean.agent_toolkit.runtime.keys.credential_scope`
+            tool_display_name: The Glean tool display name
+
+        Returns:
+            True if a token was available
+        """
+        return self._reserve(scope, tool_display_name, 0) is not None
+
+    def acquire(self, scope: str, tool_display_name: str, timeout: float | None = None) -> bool:
+        """Take a token, sleeping until one is available.
+
+        Args:
+            scope: Credential scope, see :func:`~glean.agent_toolkit.runtime.keys.credential_scope`
+            tool_display_name: The Glean tool display name
+            timeout: Longest acceptable wait in seconds, or None to wait as long as needed
+
+        Returns:
+            True if a token was acquired, False if none is available within ``timeout``
+        """
+        wait = self._reserve(scope, tool_display_name, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(
+        self, scope: str, tool_display_name: str, timeout: float | None = None
+    ) -> bool:
+        """Take a token, waiting on the event loop until one is available.
+
+        Args:
+            scope: Credential scope, see :func:`~glean.agent_toolkit.runtime.keys.credential_scope`
+            tool_display_name: The Glean tool display name
+            timeout: Longest acceptable wait in seconds, or None to wait as long as needed
+
+        Returns:
+            True if a token was acquired, False if none is available within ``timeout``
+        """
+        wait = self._reserve(scope, tool_display_name, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def _buckets_for(self, scope: str, tool_display_name: str) -> list[TokenBucket]:
+        """Get the buckets a call draws from, creating them if needed."""
+        policy = self._policy
+        limits: list[tuple[tuple[str, str | None], RateLimit]] = []
+        if policy.default is not None:
+            limits.append(((scope, None), policy.default))
+        tool_limit = policy.per_tool.get(tool_display_name)
+        if tool_limit is not None:
+            limits.append(((scope, tool_display_name), tool_limit))
+
+        buckets = []
+        with self._lock:
+            for key, limit in limits:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    if len(self._buckets) >= self._sweep_at:
+                        self._sweep()
+                    bucket = self._buckets[key] = TokenBucket(limit, self._clock)
+                buckets.append(bucket)
+        return buckets
+
+    def _sweep(self) -> None:
+        """Drop buckets that have refilled. Must be called with the lock held."""
+        for key in [key for key, bucket in self._buckets.items() if bucket.full]:
+            del self._buckets[key]
+        self._sweep_at = max(MIN_SWEEP_SIZE, 2 * len(self._buckets))
+
+    def _reserve(self, scope: str, tool_display_name: str, timeout: float | None) -> float | None:
+        """Reserve a token from every applicable bucket, or from none of them."""
+        buckets = self._buckets_for(scope, tool_display_name)
+        if not buckets:
+            return 0.0
+
+        reserved: list[TokenBucket] = []
+        wait = 0.0
+        for bucket in buckets:
+            bucket_wait = bucket.reserve(timeout)
+            if bucket_wait is None:
+                for held in reserved:
+                    held.refund()
+                with self._lock:
+                    self._rejected += 1
+                return None
+            reserved.append(bucket)
+            wait = max(wait, bucket_wait)
+
+        with self._lock:
+            self._acquired += 1
+            self._waited += wait
+        return wait
+
+    def __len__(self) -> int:
+        """Return the number of token buckets held."""
+        return len(self._buckets)
+
+
+_RATE_LIMITER = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the global rate limiter used by the built-in tools.
+
+    Returns:
+        The global rate limiter
+    """
+    return _RATE_LIMITER
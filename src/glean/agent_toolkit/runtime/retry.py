@@ -0,0 +1,315 @@
+"""Retries with exponential backoff, jitter and a process-wide retry budget."""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+import httpx
+
+from glean.agent_toolkit.runtime.deadline import remaining
+from glean.api_client.errors import GleanBaseError
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 502, 503, 504})
+
+_RETRYABLE_TRANSPORT_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How failed tool calls are retried.
+
+    The delay before retry ``n`` (starting at 0) is drawn uniformly from
+    ``[0, min(max_delay, base_delay * multiplier ** n)]``. A ``Retry-After``
+    header on the response replaces the drawn delay, unless it asks for longer
+    than ``max_retry_after``, in which case the call isn't retried.
+
+    Attributes:
+        max_attempts: Maximum number of attempts, including the first; 1 disables retries
+        base_delay: Upper bound of the first backoff delay in seconds
+        multiplier: Growth factor of the backoff bound per retry
+        max_delay: Cap on the backoff bound in seconds
+        max_retry_after: Longest ``Retry-After`` in seconds that is honored
+        retryable_status_codes: HTTP status codes that are retried
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    multiplier: float = 2.0
+    max_delay: float = 2.0
+    max_retry_after: float = 10.0
+    retryable_status_codes: frozenset[int] = RETRYABLE_STATUS_CODES
+
+    def backoff(self, retry: int) -> float:
+        """Draw the jittered delay before a retry.
+
+        Args:
+            retry: Zero-based index of the retry
+
+        Returns:
+            The delay in seconds
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * self.multiplier**retry))
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Whether a failed attempt may succeed if repeated.
+
+        Args:
+            exc: The exception raised by the attempt
+
+        Returns:
+            True for retryable HTTP statuses and connection-level failures
+        """
+        if isinstance(exc, GleanBaseError):
+            return exc.status_code in self.retryable_status_codes
+        return isinstance(exc, _RETRYABLE_TRANSPORT_ERRORS)
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    """Snapshot of retry counters.
+
+    Attributes:
+        retries: Retries performed
+        exhausted: Calls that failed after using all their attempts
+        throttled: Retries skipped because the retry budget was depleted
+        tokens: Current retry budget tokens
+    """
+
+    retries: int = 0
+    exhausted: int = 0
+    throttled: int = 0
+    tokens: float = 0.0
+
+
+class RetryBudget:
+    """Process-wide token bucket that stops retries during sustained failures.
+
+    Every retryable failure withdraws a token and every success deposits
+    ``token_ratio`` tokens. Retries are only allowed while more than half of
+    ``max_tokens`` remain, so when most calls fail the extra load from retries
+    stops instead of amplifying an outage.
+    """
+
+    def __init__(self, max_tokens: float = 100.0, token_ratio: float = 0.1) -> None:
+        """Initialize the budget.
+
+        Args:
+            max_tokens: Capacity of the bucket
+            token_ratio: Tokens deposited per successful call
+        """
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Current number of tokens."""
+        return self._tokens
+
+    def record_success(self) -> None:
+        """Deposit tokens for a successful call."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def record_failure(self) -> bool:
+        """Withdraw a token for a retryable failure.
+
+        Returns:
+            True if a retry is allowed
+        """
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+            return self._tokens > self.max_tokens / 2
+
+
+def retry_after(exc: BaseException) -> float | None:
+    """Read the delay requested by a ``Retry-After`` response header.
+
+    Args:
+        exc: The exception raised by the attempt
+
+    Returns:
+        The requested delay in seconds, or None if there is none
+    """
+    if not isinstance(exc, GleanBaseError):
+        return None
+
+    value = exc.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class Retrier:
+    """Runs calls with retries according to a policy and a shared retry budget.
+
+    Retries never outlast the current
+    :func:`~glean.agent_toolkit.runtime.deadline.deadline`: a retry whose delay
+    would end after the deadline is not attempted.
+    """
+
+    def __init__(
+        self, policy: RetryPolicy | None = None, budget: RetryBudget | None = None
+    ) -> None:
+        """Initialize the retrier.
+
+        Args:
+            policy: The retry policy
+            budget: The retry budget; a new one is created if not given
+        """
+        self._policy = policy or RetryPolicy()
+        self._budget = budget or RetryBudget()
+        self._retries = 0
+        self._exhausted = 0
+        self._throttled = 0
+        self._lock = threading.Lock()
+
+    @property
+    def policy(self) -> RetryPolicy:
+        """The current retry policy."""
+        return self._policy
+
+    @property
+    def budget(self) -> RetryBudget:
+        """The retry budget."""
+        return self._budget
+
+    def configure(self, policy: RetryPolicy, budget: RetryBudget | None = None) -> None:
+        """Replace the retry policy and reset the budget and counters.
+
+        Args:
+            policy: The new retry policy
+            budget: The new retry budget; a fresh default budget if not given
+        """
+        with self._lock:
+            self._policy = policy
+            self._budget = budget or RetryBudget()
+            self._retries = self._exhausted = self._throttled = 0
+
+    @property
+    def stats(self) -> RetryStats:
+        """A snapshot of the retry counters."""
+        with self._lock:
+            return RetryStats(
+                retries=self._retries,
+                exhausted=self._exhausted,
+                throttled=self._throttled,
+                tokens=self._budget.tokens,
+            )
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Call ``fn``, retrying retryable failures.
+
+        Args:
+            fn: Function making one attempt
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            Exception: The last attempt's exception if no attempt succeeded
+        """
+        attempt = 0
+        while True:
+            try:
+                result = fn()
+            except Exception as exc:
+                delay = self._next_delay(exc, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+            else:
+                self._budget.record_success()
+                return result
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn``, retrying retryable failures.
+
+        Args:
+            fn: Coroutine function making one attempt
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            Exception: The last attempt's exception if no attempt succeeded
+        """
+        attempt = 0
+        while True:
+            try:
+                result = await fn()
+            except Exception as exc:
+                delay = self._next_delay(exc, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                self._budget.record_success()
+                return result
+
+    def _next_delay(self, exc: Exception, attempt: int) -> float | None:
+        """Decide whether to retry a failed attempt and how long to wait first."""
+        policy = self._policy
+        if not policy.is_retryable(exc):
+            return None
+
+        allowed = self._budget.record_failure()
+        with self._lock:
+            if attempt + 1 >= policy.max_attempts:
+                self._exhausted += 1
+                return None
+            if not allowed:
+                self._throttled += 1
+                return None
+
+            delay = retry_after(exc)
+            if delay is None:
+                delay = policy.backoff(attempt)
+            elif delay > policy.max_retry_after:
+                self._exhausted += 1
+                return None
+
+            left = remaining()
+            if left is not None and delay >= left:
+                self._exhausted += 1
+                return None
+
+            self._retries += 1
+            return delay
+
+
+_RETRIER = Retrier()
+
+
+def get_retrier() -> Retrier:
+    """Get the global retrier used by the built-in tools.
+
+    Returns:
+        The global retrier
+    """
+    return _RETRIER
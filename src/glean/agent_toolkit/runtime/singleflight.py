@@ -0,0 +1,171 @@
+"""Request coalescing for identical in-flight tool calls."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Call:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: BaseException | None = None
+
+
+class _LeaderCancelledError(Exception):
+    """Set on an async flight whose leader was cancelled before it finished."""
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive while it is in flight wait for it and receive the same result or
+    exception. Sync and async callers are coalesced separately, and async
+    callers only with callers on the same event loop. If an async leader is
+    cancelled, its followers aren't: one of them runs the function again as
+    the new leader.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        """Initialize the group.
+
+        Args:
+            enabled: Whether calls are coalesced; when False every call runs
+        """
+        self.enabled = enabled
+        self._calls: dict[str, _Call] = {}
+        self._async_calls: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future[Any]] = {}
+        self._coalesced = 0
+        self._lock = threading.Lock()
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that were answered by another caller's execution."""
+        return self._coalesced
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys currently being executed."""
+        return len(self._calls) + len(self._async_calls)
+
+    def do(self, key: str, fn: Callable[[], T], timeout: float | None = None) -> T:
+        """Run ``fn`` unless an identical call is in flight, then share its outcome.
+
+        Args:
+            key: Key identifying identical calls
+            fn: Function to run
+            timeout: Maximum seconds to wait for another caller's execution; the
+                leader's own execution is not bounded
+
+        Returns:
+            The result of the leader's call
+
+        Raises:
+            TimeoutError: If the leader's call didn't finish within ``timeout``
+        """
+        if not self.enabled:
+            return fn()
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError("Timed out waiting for an identical in-flight call")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        timeout: float | None = None,
+    ) -> T:
+        """Await ``fn`` unless an identical call is in flight, then share its outcome.
+
+        Args:
+            key: Key identifying identical calls
+            fn: Coroutine function to run
+            timeout: Maximum seconds to wait for another caller's execution; the
+                leader's own execution is not bounded
+
+        Returns:
+            The result of the leader's call
+
+        Raises:
+            TimeoutError: If the leader's call didn't finish within ``timeout``
+        """
+        if not self.enabled:
+            return await fn()
+
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        while True:
+            future = self._async_calls.get(flight_key)
+            if future is None:
+                return await self._lead_async(flight_key, fn)
+            self._coalesced += 1
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except _LeaderCancelledError:
+                self._coalesced -= 1
+
+    async def _lead_async(
+        self,
+        flight_key: tuple[asyncio.AbstractEventLoop, str],
+        fn: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run ``fn`` as the leader of an async flight and publish its outcome."""
+        future = self._async_calls[flight_key] = flight_key[0].create_future()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # Only the leader was cancelled; let a follower take over.
+            future.set_exception(_LeaderCancelledError())
+            future.exception()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when nobody else was waiting
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._async_calls[flight_key]
+
+
+_SINGLE_FLIGHT = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the global single-flight group used by the built-in tools.
+
+    Returns:
+        The global single-flight group
+    """
+    return _SINGLE_FLIGHT
@@ -0,0 +1,315 @@
+"""Optional OpenTelemetry spans for tool calls and adapter invocations."""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from glean.agent_toolkit.runtime.keys import canonical_parameters, payload_size
+
+CallableT = TypeVar("CallableT", bound=Callable[..., Any])
+
+TRACER_NAME = "glean.agent_toolkit"
+
+ATTR_ADAPTER = "glean.adapter"
+ATTR_TOOL_NAME = "gen_ai.tool.name"
+ATTR_OPERATION = "gen_ai.operation.name"
+ATTR_DISPLAY_NAME = "glean.tool.display_name"
+ATTR_PARAMETER_COUNT = "glean.tool.parameter_count"
+ATTR_PARAMETER_SIZE = "glean.tool.parameter_size"
+ATTR_CACHE_HIT = "glean.tool.cache_hit"
+ATTR_STALE = "glean.tool.stale"
+ATTR_REFRESH = "glean.tool.refresh"
+ATTR_RETRY_COUNT = "glean.tool.retry_count"
+ATTR_RESULT_SIZE = "glean.tool.result_size"
+ATTR_ERROR_TYPE = "error.type"
+
+# Fallback ``error.type`` for failed calls without an exception, as recommended
+# by the OpenTelemetry semantic conventions.
+OTHER_ERROR = "_OTHER"
+
+# Name of the tool being invoked through an adapter, so that the tool call
+# spans beneath it can carry it too.
+_TOOL_NAME: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "glean_agent_toolkit_tool_name", default=None
+)
+
+
+@dataclass(frozen=True)
+class TracingPolicy:
+    """Whether and how tool calls are traced.
+
+    Tracing requires the OpenTelemetry API, which is installed with the
+    ``tracing`` extra. Spans go to the global tracer provider unless another
+    one is given, so they are dropped until the application configures the
+    OpenTelemetry SDK.
+
+    Attributes:
+        enabled: Whether spans are created
+        tracer_provider: Tracer provider to use instead of the global one
+        propagate: Whether the trace context is sent in the headers of the
+            outbound HTTP requests
+    """
+
+    enabled: bool = False
+    tracer_provider: Any | None = None
+    propagate: bool = True
+
+
+class ToolCallTrace:
+    """What happened during one traced tool call, recorded on its span when it ends.
+
+    Attributes:
+        span: The tool call span, or None if the call is only measured for metrics
+        cache_hit: Whether the result came from the result cache
+        stale: Whether the cached result was stale
+        retry_count: Requests retried after a failure
+        error_type: Class of the error the call failed with, if known
+        result_size: Size of the result if it was already measured for metrics
+    """
+
+    __slots__ = ("cache_hit", "error_type", "result_size", "retry_count", "span", "stale")
+
+    def __init__(self, span: Any) -> None:
+        """Initialize the record.
+
+        Args:
+            span: The tool call span, or None if the call is only measured for metrics
+        """
+        self.span = span
+        self.cache_hit = False
+        self.stale = False
+        self.retry_count = 0
+        self.error_type: str | None = None
+        self.result_size: int | None = None
+
+
+class ToolTracer:
+    """Creates spans for tool calls and adapter invocations.
+
+    While tracing is disabled, callers check :attr:`enabled` and skip all
+    tracing work, so the only cost is that attribute check.
+    """
+
+    def __init__(self, policy: TracingPolicy | None = None) -> None:
+        """Initialize the tracer.
+
+        Args:
+            policy: Tracing policy; defaults to tracing disabled
+        """
+        self.enabled = False
+        self._policy = TracingPolicy()
+        self._tracer: Any = None
+        self._propagate: Callable[[dict[str, str]], None] | None = None
+        self.configure(policy or TracingPolicy())
+
+    @property
+    def policy(self) -> TracingPolicy:
+        """The current tracing policy."""
+        return self._policy
+
+    def configure(self, policy: TracingPolicy) -> None:
+        """Replace the tracing policy.
+
+        Args:
+            policy: The new policy
+
+        Raises:
+            ImportError: If tracing is enabled and the OpenTelemetry API isn't installed
+        """
+        if not policy.enabled:
+            self.enabled = False
+            self._policy, self._tracer, self._propagate = policy, None, None
+            return
+
+        try:
+            from opentelemetry import propagate, trace
+        except ImportError as exc:
+            raise ImportError(
+                "OpenTelemetry is required for tracing. "
+                "Install it with `pip install agent_toolkit[tracing]`."
+            ) from exc
+
+        self._tracer = trace.get_tracer(TRACER_NAME, tracer_provider=policy.tracer_provider)
+        self._propagate = propagate.inject if policy.propagate else None
+        self._policy = policy
+        self.enabled = True
+
+    @contextmanager
+    def tool_call(
+        self,
+        tool_display_name: str,
+        parameters: Any,
+        refresh: bool = False,
+    ) -> Iterator[ToolCallTrace]:
+        """Trace a call to the Glean tools endpoint.
+
+        Args:
+            tool_display_name: The Glean tool display name
+            parameters: Tool call parameters
+            refresh: Whether the call refreshes a stale cached result in the background
+
+        Yields:
+            The record to fill in while the call runs
+        """
+        from opentelemetry.trace import SpanKind
+
+        attributes: dict[str, Any] = {
+            ATTR_DISPLAY_NAME: tool_display_name,
+            ATTR_PARAMETER_COUNT: len(parameters),
+            ATTR_PARAMETER_SIZE: payload_size(canonical_parameters(parameters)),
+        }
+        tool_name = _TOOL_NAME.get()
+        if tool_name is not None:
+            attributes[ATTR_TOOL_NAME] = tool_name
+        if refresh:
+            attributes[ATTR_REFRESH] = True
+
+        with self._tracer.start_as_current_span(
+            f"glean.tools.call {tool_display_name}", kind=SpanKind.CLIENT, attributes=attributes
+        ) as span:
+            yield ToolCallTrace(span)
+
+    def finish_tool_call(self, trace: ToolCallTrace, response: dict[str, Any]) -> None:
+        """Record the outcome of a traced tool call on its span.
+
+        Args:
+            trace: The call's record
+            response: The tool response
+        """
+        span = trace.span
+        span.set_attribute(ATTR_CACHE_HIT, trace.cache_hit)
+        if trace.stale:
+            span.set_attribute(ATTR_STALE, True)
+        span.set_attribute(ATTR_RETRY_COUNT, trace.retry_count)
+        _record_response(span, response, trace.error_type, trace.result_size)
+
+    @contextmanager
+    def adapter_call(self, adapter: str, tool_name: str) -> Iterator[Any]:
+        """Trace an invocation of a tool by an agent framework.
+
+        Args:
+            adapter: The adapter name, e.g. ``langchain``
+            tool_name: The registered tool name
+
+        Yields:
+            The span
+        """
+        token = _TOOL_NAME.set(tool_name)
+        try:
+            with self._tracer.start_as_current_span(
+                f"execute_tool {tool_name}",
+                attributes={
+                    ATTR_OPERATION: "execute_tool",
+                    ATTR_TOOL_NAME: tool_name,
+                    ATTR_ADAPTER: adapter,
+                },
+            ) as span:
+                yield span
+        finally:
+            _TOOL_NAME.reset(token)
+
+    def finish_adapter_call(self, span: Any, result: Any) -> None:
+        """Record the result of an adapter invocation on its span.
+
+        Args:
+            span: The adapter span
+            result: What the tool returned
+        """
+        if isinstance(result, dict) and ("error" in result or "result" in result):
+            _record_response(span, result, None, None)
+        else:
+            span.set_attribute(ATTR_RESULT_SIZE, payload_size(result))
+
+    def headers(self) -> dict[str, str] | None:
+        """Get the headers carrying the current trace context to the backend.
+
+        Returns:
+            The headers, or None if propagation is off
+        """
+        if self._propagate is None:
+            return None
+        carrier: dict[str, str] = {}
+        self._propagate(carrier)
+        return carrier
+
+
+def _record_response(
+    span: Any,
+    response: dict[str, Any],
+    error_type: str | None,
+    result_size: int | None,
+) -> None:
+    """Record the result size or the error of a tool response on a span.
+
+    ``result_size`` is the size if it was already measured, else it's measured here.
+    """
+    from opentelemetry.trace import Status, StatusCode
+
+    error = response.get("error")
+    if error:
+        span.set_attribute(ATTR_ERROR_TYPE, error_type or OTHER_ERROR)
+        span.set_status(Status(StatusCode.ERROR, str(error)))
+    elif response.get("result") is not None:
+        if result_size is None:
+            result_size = payload_size(response["result"])
+        span.set_attribute(ATTR_RESULT_SIZE, result_size)
+
+
+def traced(func: CallableT, adapter: str, tool_name: str) -> CallableT:
+    """Wrap a tool function so that each invocation gets an adapter span.
+
+    The wrapper keeps the function's name, docstring and signature, which the
+    agent frameworks inspect, and checks whether tracing is enabled on every
+    call, so tools converted before tracing was configured are traced too.
+
+    Args:
+        func: The tool function, sync or async
+        adapter: The adapter name, e.g. ``langchain``
+        tool_name: The registered tool name
+
+    Returns:
+        The wrapped function
+    """
+    tracer = get_tool_tracer()
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def traced_async(*args: Any, **kwargs: Any) -> Any:
+            if not tracer.enabled:
+                return await func(*args, **kwargs)
+            with tracer.adapter_call(adapter, tool_name) as span:
+                result = await func(*args, **kwargs)
+                tracer.finish_adapter_call(span, result)
+                return result
+
+        return traced_async  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def traced_sync(*args: Any, **kwargs: Any) -> Any:
+        if not tracer.enabled:
+            return func(*args, **kwargs)
+        with tracer.adapter_call(adapter, tool_name) as span:
+            result = func(*args, **kwargs)
+            tracer.finish_adapter_call(span, result)
+            return result
+
+    return traced_sync  # type: ignore[return-value]
+
+
+_TOOL_TRACER = ToolTracer()
+
+
+def get_tool_tracer() -> ToolTracer:
+    """Get the global tracer used by the built-in tools and the adapters.
+
+    Returns:
+        The global tool tracer
+    """
+    return _TOOL_TRACER
@@ -1,6 +1,6 @@
 """Tool specification dataclass."""
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -19,6 +19,8 @@ class ToolSpec:
         output_schema: JSON schema for the output value
         version: Optional version string
         output_model: Optional pydantic model for the output
+        async_function: Optional native coroutine implementation of the tool
+        timeout: Optional default time limit in seconds for each invocation
     """
 
     name: str
@@ -28,6 +30,8 @@ class ToolSpec:
     output_schema: dict[str, Any]
     version: str | None = None
     output_model: type[BaseModel] | None = None
+    async_function: Callable[..., Awaitable[Any]] | None = None
+    timeout: float | None = None
     _adapters: dict[str, Any] = field(default_factory=dict)
 
     def get_adapter(self, name: str) -> Any | None:
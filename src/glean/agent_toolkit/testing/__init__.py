@@ -0,0 +1,9 @@
+"""Test and benchmarking aids that stand in for the Glean API."""
+
+from glean.agent_toolkit.testing.backend import (
+    FakeBackendStats,
+    FakeGleanBackend,
+    ToolProfile,
+)
+
+__all__ = ["FakeBackendStats", "FakeGleanBackend", "ToolProfile"]
@@ -0,0 +1,330 @@
+"""In-process stand-in for the Glean tools endpoint, for offline and load tests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import pathlib
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from glean.agent_toolkit.runtime.pool import TransportConfig
+
+DEFAULT_SERVER_URL = "http://fake-glean.local"
+
+TOOLS_CALL_PATH = "/rest/api/v1/tools/call"
+
+# Canned response for one tool: a ``rawResponse`` payload, or a function
+# building one from the call's parameters.
+CannedResponse = Any | Callable[[dict[str, Any]], Any]
+
+
+@dataclass(frozen=True)
+class ToolProfile:
+    """How the fake backend behaves for a tool.
+
+    Latencies are drawn from a log-normal distribution around ``latency``,
+    which gives the long right tail real backends show; ``jitter`` 0 makes
+    every call take exactly ``latency``.
+
+    Attributes:
+        latency: Median response time in seconds
+        jitter: Standard deviation of the latency's logarithm
+        error_rate: Fraction of calls answered with a 500
+        throttle_rate: Fraction of calls answered with a 429
+        retry_after: ``Retry-After`` seconds sent with 429s, or None to omit the header
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the profile.
+
+        Raises:
+            ValueError: If a latency is negative or the rates don't form a probability
+        """
+        if self.latency < 0 or self.jitter < 0:
+            raise ValueError("Latency and jitter must not be negative")
+        if (
+            self.error_rate < 0
+            or self.throttle_rate < 0
+            or self.error_rate + self.throttle_rate > 1
+        ):
+            raise ValueError("Error and throttle rates must be probabilities summing to at most 1")
+
+
+@dataclass(frozen=True)
+class FakeBackendStats:
+    """Snapshot of fake backend counters.
+
+    Attributes:
+        requests: Tool calls received, keyed by tool display name
+        errors: Calls answered with a 500
+        throttled: Calls answered with a 429, including those over ``max_concurrency``
+        rejected: Calls answered with a 400 or 404
+        peak_in_flight: Highest number of calls handled at once
+    """
+
+    requests: Mapping[str, int] = field(default_factory=dict)
+    errors: int = 0
+    throttled: int = 0
+    rejected: int = 0
+    peak_in_flight: int = 0
+
+
+class FakeGleanBackend(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport that answers Glean tool calls locally.
+
+    Point the pooled clients at it, sync and async alike::
+
+        backend = FakeGleanBackend({"Glean Search": {"documents": []}})
+        get_client_pool().configure(PoolLimits(), backend.transport_config())
+
+    Sync requests sleep for their latency on the calling thread and async
+    requests on the event loop, so concurrency behaves as it would against a
+    remote server. Calls to tools without a canned response get
+    ``default_response``, or a 400 if there is none.
+    """
+
+    def __init__(
+        self,
+        responses: Mapping[str, CannedResponse] | None = None,
+        default_profile: ToolProfile | None = None,
+        profiles: Mapping[str, ToolProfile] | None = None,
+        max_concurrency: int | None = None,
+        seed: int | None = None,
+        default_response: CannedResponse | None = None,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            responses: Canned ``rawResponse`` payloads keyed by tool display name;
+                a list of payloads is served round-robin
+            default_profile: Behavior of tools without an entry in ``profiles``
+            profiles: Behavior keyed by tool display name
+            max_concurrency: Calls handled at once before further calls get a 429
+            seed: Seed for latency and error sampling, for reproducible runs
+            default_response: Response for tools without an entry in ``responses``
+        """
+        self._responses: dict[str, list[CannedResponse]] = {
+            name: list(value) if isinstance(value, list) else [value]
+            for name, value in (responses or {}).items()
+        }
+        self.default_response = default_response
+        self.default_profile = default_profile or ToolProfile()
+        self.profiles = dict(profiles or {})
+        self.max_concurrency = max_concurrency
+        self._random = random.Random(seed)
+        self._served: dict[str, int] = {}
+        self._requests: dict[str, int] = {}
+        self._errors = self._throttled = self._rejected = 0
+        self._in_flight = self._peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_cassettes(
+        cls,
+        paths: Iterable[str | os.PathLike[str]],
+        **kwargs: Any,
+    ) -> FakeGleanBackend:
+        """Build a backend serving the successful tool responses recorded in VCR cassettes.
+
+        Requires PyYAML, which is installed with the ``dev`` extra.
+
+        Args:
+            paths: Cassette files, or directories to read ``*.yaml`` cassettes from
+            **kwargs: Other arguments for the constructor
+
+        Returns:
+            A backend answering each recorded tool with its recorded responses in turn
+
+        Raises:
+            ImportError: If PyYAML isn't installed
+        """
+        try:
+            import yaml
+        except ImportError as exc:  # pragma: no cover
+            raise ImportError(
+                "PyYAML is required to load cassettes. "
+                "Install it with `pip install agent_toolkit[dev]`."
+            ) from exc
+
+        files: list[pathlib.Path] = []
+        for path in map(pathlib.Path, paths):
+            files.extend(sorted(path.glob("*.yaml")) if path.is_dir() else [path])
+
+        responses: dict[str, list[Any]] = {}
+        for file in files:
+            cassette = yaml.safe_load(file.read_text()) or {}
+            for interaction in cassette.get("interactions", []):
+                request, response = interaction["request"], interaction["response"]
+                if not request["uri"].endswith(TOOLS_CALL_PATH):
+                    continue
+                if response["status"]["code"] != 200:
+                    continue
+                name = json.loads(request["body"])["name"]
+                body = json.loads(response["body"]["string"])
+                responses.setdefault(name, []).append(body.get("rawResponse"))
+        return cls(responses, **kwargs)
+
+    def set_response(self, tool_display_name: str, response: CannedResponse) -> None:
+        """Replace the canned responses for a tool.
+
+        Args:
+            tool_display_name: The Glean tool display name
+            response: A ``rawResponse`` payload, a list of them, or a function of the parameters
+        """
+        with self._lock:
+            self._responses[tool_display_name] = (
+                list(response) if isinstance(response, list) else [response]
+            )
+
+    def transport_config(self, server_url: str = DEFAULT_SERVER_URL) -> TransportConfig:
+        """Build a transport configuration that sends every call to this backend.
+
+        Args:
+            server_url: Server URL the clients use; any URL works
+
+        Returns:
+            The transport configuration for the client pool
+        """
+        return TransportConfig(server_url=server_url, transport=self, async_transport=self)
+
+    @property
+    def stats(self) -> FakeBackendStats:
+        """A snapshot of the backend counters."""
+        with self._lock:
+            return FakeBackendStats(
+                requests=dict(self._requests),
+                errors=self._errors,
+                throttled=self._throttled,
+                rejected=self._rejected,
+                peak_in_flight=self._peak_in_flight,
+            )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request from a sync client.
+
+        Args:
+            request: The HTTP request
+
+        Returns:
+            The HTTP response, after the sampled latency
+        """
+        request.read()
+        delay, respond = self._plan(request)
+        try:
+            if delay > 0:
+                time.sleep(delay)
+            return respond()
+        finally:
+            self._finish()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request from an async client.
+
+        Args:
+            request: The HTTP request
+
+        Returns:
+            The HTTP response, after the sampled latency
+        """
+        await request.aread()
+        delay, respond = self._plan(request)
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return respond()
+        finally:
+            self._finish()
+
+    def _plan(self, request: httpx.Request) -> tuple[float, Callable[[], httpx.Response]]:
+        """Decide how and after how long to answer a request, and count it in flight."""
+        if request.method != "POST" or not request.url.path.endswith(TOOLS_CALL_PATH):
+            with self._lock:
+                self._in_flight += 1
+                self._rejected += 1
+            return 0.0, lambda: _json_response(404, {"error": "Not found"})
+
+        try:
+            call = json.loads(request.content)
+            name = call["name"]
+            parameters = call.get("parameters") or {}
+        except (ValueError, KeyError, TypeError):
+            with self._lock:
+                self._in_flight += 1
+                self._rejected += 1
+            return 0.0, lambda: _json_response(400, {"error": "Malformed tool call"})
+
+        profile = self.profiles.get(name, self.default_profile)
+        with self._lock:
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            self._requests[name] = self._requests.get(name, 0) + 1
+            delay = self._latency(profile)
+            roll = self._random.random()
+
+            if self.max_concurrency is not None and self._in_flight > self.max_concurrency:
+                self._throttled += 1
+                return 0.0, lambda: _throttled_response(profile)
+            if roll < profile.throttle_rate:
+                self._throttled += 1
+                return delay, lambda: _throttled_response(profile)
+            if roll < profile.throttle_rate + profile.error_rate:
+                self._errors += 1
+                return delay, lambda: _json_response(500, {"error": "Injected server error"})
+
+            canned = self._responses.get(name)
+            if canned:
+                served = self._served.get(name, 0)
+                self._served[name] = served + 1
+                response = canned[served % len(canned)]
+            elif self.default_response is not None:
+                response = self.default_response
+            else:
+                self._rejected += 1
+                return delay, lambda: _json_response(400, {"error": f"Unknown tool '{name}'"})
+
+        def respond() -> httpx.Response:
+            raw = response(parameters) if callable(response) else response
+            return _json_response(200, {"rawResponse": raw})
+
+        return delay, respond
+
+    def _finish(self) -> None:
+        """Count a request as no longer in flight."""
+        with self._lock:
+            self._in_flight -= 1
+
+    def _latency(self, profile: ToolProfile) -> float:
+        """Sample a latency. Lock must be held."""
+        if profile.latency <= 0:
+            return 0.0
+        if profile.jitter <= 0:
+            return profile.latency
+        return self._random.lognormvariate(math.log(profile.latency), profile.jitter)
+
+
+def _json_response(status_code: int, body: Any) -> httpx.Response:
+    """Build a JSON response."""
+    return httpx.Response(status_code, json=body)
+
+
+def _throttled_response(profile: ToolProfile) -> httpx.Response:
+    """Build a 429 response."""
+    headers = {}
+    if profile.retry_after is not None:
+        headers["Retry-After"] = f"{profile.retry_after:g}"
+    return httpx.Response(429, json={"error": "Too many requests"}, headers=headers)
@@ -0,0 +1,486 @@
+"""Load generator for registered tools.
+
+Drives concurrent callers against a tool and reports throughput, latency
+percentiles, errors and the time spent in the client outside the HTTP
+transport. Run it against the in-process fake backend, a local stand-in or a
+real instance::
+
+    python -m glean.agent_toolkit.testing.loadgen glean_search --query q --mode async --fake
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import collections
+import contextvars
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from importlib import import_module
+from typing import Any
+
+import httpx
+
+from glean.agent_toolkit.registry import get_registry
+from glean.agent_toolkit.runtime.credentials import Credentials, use_credentials
+from glean.agent_toolkit.runtime.pool import PoolLimits, TransportConfig, get_client_pool
+from glean.agent_toolkit.runtime.singleflight import get_single_flight
+from glean.agent_toolkit.spec import ToolSpec
+from glean.agent_toolkit.testing.backend import DEFAULT_SERVER_URL, FakeGleanBackend, ToolProfile
+
+MODES = ("sync", "threaded", "async")
+
+
+@dataclass(frozen=True)
+class LoadReport:
+    """Outcome of a load run.
+
+    Attributes:
+        tool: Name of the tool that was called
+        mode: ``sync``, ``threaded`` or ``async``
+        concurrency: Number of concurrent callers
+        calls: Calls completed
+        failures: Calls that returned an error
+        duration: Wall-clock seconds for the whole run
+        throughput: Calls completed per second
+        p50: Median call latency in seconds
+        p95: 95th percentile call latency in seconds
+        p99: 99th percentile call latency in seconds
+        max: Slowest call latency in seconds
+        mean: Mean call latency in seconds
+        transport_mean: Mean seconds per call spent in the HTTP transport, if measured
+        overhead_mean: Mean seconds per call spent in the client outside the transport
+        errors: Number of failed calls keyed by error message
+    """
+
+    tool: str
+    mode: str
+    concurrency: int
+    calls: int
+    failures: int
+    duration: float
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    mean: float
+    transport_mean: float | None = None
+    overhead_mean: float | None = None
+    errors: dict[str, int] = field(default_factory=dict)
+
+    def format(self) -> str:
+        """Render the report for a terminal.
+
+        Returns:
+            The report as text
+        """
+        lines = [
+            f"tool={self.tool} mode={self.mode} concurrency={self.concurrency}",
+            f"calls={self.calls} failures={self.failures} duration={self.duration:.2f}s "
+            f"throughput={self.throughput:.1f}/s",
+            f"latency ms: p50={self.p50 * 1000:.1f} p95={self.p95 * 1000:.1f} "
+            f"p99={self.p99 * 1000:.1f} max={self.max * 1000:.1f} mean={self.mean * 1000:.1f}",
+        ]
+        if self.transport_mean is not None and self.overhead_mean is not None:
+            lines.append(
+                f"per call ms: transport={self.transport_mean * 1000:.2f} "
+                f"client overhead={self.overhead_mean * 1000:.2f}"
+            )
+        for message, count in sorted(self.errors.items(), key=lambda item: -item[1]):
+            lines.append(f"  {count:>6}  {message}")
+        return "\n".join(lines)
+
+
+class TimedTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Transport wrapper that adds up the time requests spend in the wrapped transport."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Wrap transports.
+
+        Args:
+            transport: Transport for sync requests; defaults to ``httpx.HTTPTransport()``
+            async_transport: Transport for async requests; defaults to
+                ``httpx.AsyncHTTPTransport()``
+        """
+        self._transport = transport or httpx.HTTPTransport()
+        self._async_transport = async_transport or httpx.AsyncHTTPTransport()
+        self.seconds = 0.0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a sync request through the wrapped transport and time it."""
+        start = time.perf_counter()
+        try:
+            response = self._transport.handle_request(request)
+            response.read()
+            return response
+        finally:
+            self._record(time.perf_counter() - start)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send an async request through the wrapped transport and time it."""
+        start = time.perf_counter()
+        try:
+            response = await self._async_transport.handle_async_request(request)
+            await response.aread()
+            return response
+        finally:
+            self._record(time.perf_counter() - start)
+
+    def reset(self) -> None:
+        """Reset the totals."""
+        with self._lock:
+            self.seconds = 0.0
+            self.requests = 0
+
+    def close(self) -> None:
+        """Close the wrapped sync transport."""
+        self._transport.close()
+
+    async def aclose(self) -> None:
+        """Close the wrapped async transport."""
+        await self._async_transport.aclose()
+
+    def _record(self, seconds: float) -> None:
+        with self._lock:
+            self.seconds += seconds
+            self.requests += 1
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Get a nearest-rank percentile.
+
+    Args:
+        sorted_values: Samples in ascending order
+        fraction: The percentile as a fraction, e.g. 0.99
+
+    Returns:
+        The percentile, or 0 if there are no samples
+    """
+    if not sorted_values:
+        return 0.0
+    # Nearest rank is ceil(fraction * n); the epsilon absorbs float error like 0.99 * 100.
+    rank = max(1, min(len(sorted_values), math.ceil(fraction * len(sorted_values) - 1e-9)))
+    return sorted_values[rank - 1]
+
+
+def run_load(
+    tool_spec: ToolSpec,
+    parameters: dict[str, Any],
+    mode: str = "threaded",
+    concurrency: int = 8,
+    requests: int = 1000,
+    duration: float | None = None,
+    timer: TimedTransport | None = None,
+    coalesce: bool = False,
+) -> LoadReport:
+    """Call a tool repeatedly from concurrent callers and measure the calls.
+
+    Callers share one budget of ``requests`` calls and stop early once
+    ``duration`` seconds have passed. The tool is called the way an agent
+    would, with ``parameters=...``, through its sync function (``sync`` and
+    ``threaded`` modes) or its coroutine variant (``async`` mode). Identical
+    concurrent calls would be coalesced into one request, so single-flight is
+    turned off for the run unless ``coalesce`` is set.
+
+    Args:
+        tool_spec: The tool to call
+        parameters: Tool call parameters
+        mode: ``sync`` for one caller, ``threaded`` for a thread per caller, or
+            ``async`` for a task per caller on one event loop
+        concurrency: Number of concurrent callers; ignored in ``sync`` mode
+        requests: Maximum number of calls
+        duration: Maximum seconds to run, or None to run until ``requests`` are made
+        timer: Transport wrapper of the pooled clients, to split latency into
+            transport time and client overhead
+        coalesce: Whether to keep single-flight coalescing on
+
+    Returns:
+        The load report
+
+    Raises:
+        ValueError: If the mode is unknown, the concurrency isn't positive, or
+            ``async`` mode is requested for a tool without a coroutine variant
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode!r}; expected one of {', '.join(MODES)}")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if mode == "async" and tool_spec.async_function is None:
+        raise ValueError(f"Tool {tool_spec.name!r} has no async variant")
+    if mode == "sync":
+        concurrency = 1
+
+    latencies: list[float] = []
+    errors: collections.Counter[str] = collections.Counter()
+    lock = threading.Lock()
+    issued = 0
+    stop_at: float | None = None
+
+    def take() -> bool:
+        nonlocal issued
+        with lock:
+            if issued >= requests or (stop_at is not None and time.perf_counter() >= stop_at):
+                return False
+            issued += 1
+            return True
+
+    def record(latency: float, response: Any) -> None:
+        error = _error_of(response)
+        with lock:
+            latencies.append(latency)
+            if error is not None:
+                errors[error] += 1
+
+    def caller() -> None:
+        while take():
+            call_start = time.perf_counter()
+            try:
+                response: Any = tool_spec.function(parameters=parameters)
+            except Exception as exc:
+                response = {"error": f"{type(exc).__name__}: {exc}", "result": None}
+            record(time.perf_counter() - call_start, response)
+
+    async def async_caller() -> None:
+        assert tool_spec.async_function is not None
+        while take():
+            call_start = time.perf_counter()
+            try:
+                response: Any = await tool_spec.async_function(parameters=parameters)
+            except Exception as exc:
+                response = {"error": f"{type(exc).__name__}: {exc}", "result": None}
+            record(time.perf_counter() - call_start, response)
+
+    async def run_async() -> None:
+        await asyncio.gather(*(async_caller() for _ in range(concurrency)))
+        await get_client_pool().aclose()
+
+    single_flight = get_single_flight()
+    coalescing = single_flight.enabled
+    single_flight.enabled = coalesce
+    if timer is not None:
+        timer.reset()
+    start = time.perf_counter()
+    stop_at = None if duration is None else start + duration
+    try:
+        if mode == "async":
+            asyncio.run(run_async())
+        elif mode == "threaded":
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="loadgen") as pool:
+                futures = [
+                    pool.submit(contextvars.copy_context().run, caller) for _ in range(concurrency)
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            caller()
+    finally:
+        single_flight.enabled = coalescing
+    elapsed = time.perf_counter() - start
+
+    return _report(tool_spec.name, mode, concurrency, latencies, errors, elapsed, timer)
+
+
+def _error_of(response: Any) -> str | None:
+    """Get the error message of a tool response, or None if it succeeded."""
+    if isinstance(response, dict) and response.get("error"):
+        return str(response["error"]).splitlines()[0][:200]
+    if isinstance(response, dict) and response.get("result") is None:
+        return "Empty result"
+    return None
+
+
+def _report(
+    tool: str,
+    mode: str,
+    concurrency: int,
+    latencies: list[float],
+    errors: collections.Counter[str],
+    elapsed: float,
+    timer: TimedTransport | None,
+) -> LoadReport:
+    """Summarize the measurements of a run."""
+    ordered = sorted(latencies)
+    calls = len(ordered)
+    mean = sum(ordered) / calls if calls else 0.0
+    transport_mean = overhead_mean = None
+    if timer is not None and calls:
+        transport_mean = timer.seconds / calls
+        overhead_mean = mean - transport_mean
+    return LoadReport(
+        tool=tool,
+        mode=mode,
+        concurrency=concurrency,
+        calls=calls,
+        failures=sum(errors.values()),
+        duration=elapsed,
+        throughput=calls / elapsed if elapsed > 0 else 0.0,
+        p50=percentile(ordered, 0.50),
+        p95=percentile(ordered, 0.95),
+        p99=percentile(ordered, 0.99),
+        max=ordered[-1] if ordered else 0.0,
+        mean=mean,
+        transport_mean=transport_mean,
+        overhead_mean=overhead_mean,
+        errors=dict(errors),
+    )
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m glean.agent_toolkit.testing.loadgen",
+        description="Drive concurrent calls against a registered tool and report latency.",
+    )
+    parser.add_argument("tool", help="Registered tool name, e.g. glean_search")
+    parser.add_argument("--query", help="Value of the tool's query parameter")
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Tool parameter; may be repeated",
+    )
+    parser.add_argument("--mode", choices=MODES, default="threaded")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=1000, help="Total calls to make")
+    parser.add_argument("--duration", type=float, help="Stop after this many seconds")
+    parser.add_argument("--warmup", type=int, default=0, help="Calls to make before measuring")
+    parser.add_argument(
+        "--coalesce",
+        action="store_true",
+        help="Keep single-flight coalescing of identical concurrent calls on",
+    )
+    parser.add_argument("--server-url", help="Send calls to this URL instead of the instance")
+    parser.add_argument("--instance", default=os.getenv("GLEAN_INSTANCE", "loadgen"))
+    parser.add_argument("--api-token", default=os.getenv("GLEAN_API_TOKEN", "loadgen"))
+    parser.add_argument("--max-connections", type=int, default=None)
+    parser.add_argument("--http2", action="store_true", help="Negotiate HTTP/2")
+
+    fake = parser.add_argument_group("in-process fake backend")
+    fake.add_argument("--fake", action="store_true", help="Answer calls with the fake backend")
+    fake.add_argument("--cassettes", help="Serve responses recorded in this cassette directory")
+    fake.add_argument("--fake-latency", type=float, default=0.0, help="Median latency in s")
+    fake.add_argument("--fake-jitter", type=float, default=0.0, help="Sigma of log latency")
+    fake.add_argument("--fake-error-rate", type=float, default=0.0)
+    fake.add_argument("--fake-throttle-rate", type=float, default=0.0)
+    fake.add_argument("--fake-max-concurrency", type=int, default=None)
+    fake.add_argument("--seed", type=int, default=None)
+
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser.parse_args(argv)
+
+
+def _parameters(args: argparse.Namespace) -> dict[str, Any]:
+    """Build tool call parameters from the command line."""
+    values = {}
+    if args.query is not None:
+        values["query"] = args.query
+    for item in args.param:
+        name, separator, value = item.partition("=")
+        if not separator:
+            raise SystemExit(f"Invalid --param {item!r}; expected NAME=VALUE")
+        values[name] = value
+    return {name: {"name": name, "value": value} for name, value in values.items()}
+
+
+def _fake_backend(args: argparse.Namespace) -> FakeGleanBackend:
+    """Build the fake backend described by the command line."""
+    options: dict[str, Any] = {
+        "default_profile": ToolProfile(
+            latency=args.fake_latency,
+            jitter=args.fake_jitter,
+            error_rate=args.fake_error_rate,
+            throttle_rate=args.fake_throttle_rate,
+        ),
+        "max_concurrency": args.fake_max_concurrency,
+        "seed": args.seed,
+        "default_response": {"documents": []},
+    }
+    if args.cassettes:
+        return FakeGleanBackend.from_cassettes([args.cassettes], **options)
+    return FakeGleanBackend(**options)
+
+
+def main(argv: Sequence[str] | None = None, out: Callable[[str], Any] = print) -> int:
+    """Run the load generator from the command line.
+
+    Args:
+        argv: Command-line arguments, defaulting to ``sys.argv[1:]``
+        out: Function printing the report
+
+    Returns:
+        The process exit code: 0, or 1 if every call failed
+    """
+    args = _parse_args(argv)
+    import_module("glean.agent_toolkit.tools")  # registers the built-in tools
+    tool_spec = get_registry().get(args.tool)
+    if tool_spec is None:
+        known = ", ".join(sorted(spec.name for spec in get_registry().list()))
+        raise SystemExit(f"Unknown tool {args.tool!r}; registered tools: {known}")
+
+    fake = args.fake or bool(args.cassettes)
+    limits = PoolLimits(max_connections=args.max_connections or max(100, args.concurrency))
+    if fake:
+        backend = _fake_backend(args)
+        timer = TimedTransport(backend, backend)
+    else:
+        # httpx ignores the client's limits and HTTP/2 setting when it is
+        # given a transport, so the wrapped transports get them directly.
+        timer = TimedTransport(
+            httpx.HTTPTransport(limits=limits.to_httpx(), http2=args.http2),
+            httpx.AsyncHTTPTransport(limits=limits.to_httpx(), http2=args.http2),
+        )
+    get_client_pool().configure(
+        limits,
+        TransportConfig(
+            server_url=args.server_url or (DEFAULT_SERVER_URL if fake else None),
+            transport=timer,
+            async_transport=timer,
+        ),
+    )
+
+    parameters = _parameters(args)
+    try:
+        with use_credentials(Credentials(args.instance, args.api_token)):
+            if args.warmup:
+                run_load(
+                    tool_spec,
+                    parameters,
+                    mode=args.mode,
+                    concurrency=args.concurrency,
+                    requests=args.warmup,
+                    coalesce=args.coalesce,
+                )
+            report = run_load(
+                tool_spec,
+                parameters,
+                mode=args.mode,
+                concurrency=args.concurrency,
+                requests=args.requests,
+                duration=args.duration,
+                timer=timer,
+                coalesce=args.coalesce,
+            )
+    finally:
+        get_client_pool().close()
+
+    out(json.dumps(asdict(report), indent=2) if args.json else report.format())
+    return 1 if report.calls and report.failures == report.calls else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
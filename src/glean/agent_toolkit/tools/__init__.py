@@ -1,12 +1,31 @@
 """
 Each tool lives in its own module under :pymod:`glean.agent_toolkit.tools`.
 
-Importing this package will load all available tools.
+Tool modules are loaded on demand: accessing a tool attribute of this package,
+or looking the tool up in the registry, imports its module and registers it.
+Every tool also has a native coroutine variant (e.g. ``glean_search_async``)
+for use on an event loop.
 """
 
 from __future__ import annotations
 
+import functools as _functools
+import sys as _sys
+import types as _types
 from importlib import import_module as _import_module
+from typing import TYPE_CHECKING, Any
+
+from glean.agent_toolkit.registry import get_registry as _get_registry
+
+if TYPE_CHECKING:
+    from .ai_web_search import ai_web_search, ai_web_search_async
+    from .calendar_search import calendar_search, calendar_search_async
+    from .code_search import code_search, code_search_async
+    from .employee_search import employee_search, employee_search_async
+    from .glean_search import glean_search, glean_search_async
+    from .gmail_search import gmail_search, gmail_search_async
+    from .outlook_search import outlook_search, outlook_search_async
+    from .web_search import web_search, web_search_async
 
 _tool_modules: list[str] = [
     "glean_search",
@@ -19,17 +38,60 @@ _tool_modules: list[str] = [
     "outlook_search",
 ]
 
+
+class _ToolsModule(_types.ModuleType):
+    """Package module that binds tool names to the tools, not their submodules.
+
+    The import system binds each imported submodule as an attribute of its
+    package, which would otherwise shadow the tool of the same name.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if isinstance(value, _types.ModuleType) and name in _tool_modules:
+            super().__setattr__(f"{name}_async", getattr(value, f"{name}_async"))
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+_sys.modules[__name__].__class__ = _ToolsModule
+
+
+def _load_tool_module(module_name: str) -> Any:
+    """Import a tool module, which registers its tool as a side effect."""
+    return _import_module(f"{__name__}.{module_name}")
+
+
 for _mod in _tool_modules:
-    _import_module(f"{__name__}.{_mod}")
+    _get_registry().register_lazy(_mod, _functools.partial(_load_tool_module, _mod))
+
+
+def __getattr__(name: str) -> Any:
+    """Load tools and their async variants on first access.
+
+    Args:
+        name: The attribute name
+
+    Returns:
+        The requested tool
+
+    Raises:
+        AttributeError: If the attribute isn't a built-in tool
+    """
+    module_name = name.removesuffix("_async")
+    if module_name not in _tool_modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(_load_tool_module(module_name), name)
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including lazily loaded tools.
+
+    Returns:
+        The attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
 
-from .ai_web_search import ai_web_search  # noqa: E402
-from .calendar_search import calendar_search  # noqa: E402
-from .code_search import code_search  # noqa: E402
-from .employee_search import employee_search  # noqa: E402
-from .glean_search import glean_search  # noqa: E402
-from .gmail_search import gmail_search  # noqa: E402
-from .outlook_search import outlook_search  # noqa: E402
-from .web_search import web_search  # noqa: E402
 
 __all__: list[str] = [
     "glean_search",
@@ -40,4 +102,12 @@ __all__: list[str] = [
     "code_search",
     "gmail_search",
     "outlook_search",
+    "glean_search_async",
+    "web_search_async",
+    "ai_web_search_async",
+    "calendar_search_async",
+    "employee_search_async",
+    "code_search_async",
+    "gmail_search_async",
+    "outlook_search_async",
 ]
@@ -2,35 +2,713 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import os
-from typing import Any
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
+import httpx
+
+from glean.agent_toolkit.runtime.breaker import CircuitBreaker, get_circuit_breakers
+from glean.agent_toolkit.runtime.cache import get_result_cache
+from glean.agent_toolkit.runtime.concurrency import get_concurrency_limiter
+from glean.agent_toolkit.runtime.credentials import (
+    Credentials,
+    current_credentials,
+    use_credentials,
+)
+from glean.agent_toolkit.runtime.deadline import DeadlineExceededError, remaining
+from glean.agent_toolkit.runtime.hedge import get_hedger
+from glean.agent_toolkit.runtime.keys import credential_scope, tool_call_key
+from glean.agent_toolkit.runtime.metrics import get_metrics_recorder
+from glean.agent_toolkit.runtime.pool import get_client_pool
+from glean.agent_toolkit.runtime.ratelimit import RateLimitExceededError, get_rate_limiter
+from glean.agent_toolkit.runtime.retry import get_retrier
+from glean.agent_toolkit.runtime.singleflight import get_single_flight
+from glean.agent_toolkit.runtime.tracing import ToolCallTrace, ToolTracer, get_tool_tracer
 from glean.api_client import Glean, models
+from glean.api_client.errors import GleanBaseError
 
+T = TypeVar("T")
+
+DEFAULT_BATCH_CONCURRENCY = 8
+
+REFRESH_MAX_WORKERS = 4
+
+_refresh_executor: ThreadPoolExecutor | None = None
+_refresh_lock = threading.Lock()
+_refresh_tasks: set[asyncio.Task[Any]] = set()
+
+ToolCall = tuple[str, dict[str, models.ToolsCallParameter]]
+
+
+@dataclass(frozen=True)
+class ToolCallResult:
+    """Outcome of one call in a batch.
+
+    Attributes:
+        tool_display_name: The Glean tool display name that was called
+        response: The response in the same shape ``run_tool`` returns
+        latency: Wall-clock seconds spent executing the call
+    """
+
+    tool_display_name: str
+    response: dict[str, Any]
+    latency: float
+
+    @property
+    def result(self) -> Any:
+        """The tool result, or None if the call failed."""
+        return self.response.get("result")
+
+    @property
+    def error(self) -> str | None:
+        """The error message, or None if the call succeeded."""
+        return self.response.get("error")
+
+
+def _credentials() -> tuple[str, str]:
+    """Get the Glean instance and API token for the current context.
+
+    Credentials set with :func:`~glean.agent_toolkit.runtime.credentials.use_credentials`
+    take precedence over the environment.
+    """
+    scoped = current_credentials()
+    if scoped is not None:
+        return scoped.instance, scoped.api_token
 
-def api_client() -> Glean:
-    """Get the Glean API client."""
     instance = os.getenv("GLEAN_INSTANCE")
     api_token = os.getenv("GLEAN_API_TOKEN")
 
     if not api_token or not instance:
         raise ValueError("GLEAN_API_TOKEN and GLEAN_INSTANCE environment variables are required")
 
-    return Glean(api_token=api_token, instance=instance)
+    return instance, api_token
 
 
-def run_tool(
+def api_client() -> Glean:
+    """Get a new, unpooled Glean API client.
+
+    The client uses the server URL and pre-configured HTTP clients of the
+    pool's :class:`~glean.agent_toolkit.runtime.pool.TransportConfig`, if set.
+    """
+    instance, api_token = _credentials()
+
+    return Glean(
+        api_token=api_token,
+        instance=instance,
+        **get_client_pool().transport.client_options(),
+    )
+
+
+def pooled_client() -> Glean:
+    """Get the shared Glean API client for the current instance and token."""
+    instance, api_token = _credentials()
+
+    return get_client_pool().get(instance, api_token)
+
+
+def pooled_async_client() -> Glean:
+    """Get the shared Glean API client for async calls on the running event loop."""
+    instance, api_token = _credentials()
+
+    return get_client_pool().get_async(instance, api_token)
+
+
+def _call_key(
     tool_display_name: str,
     parameters: dict[str, models.ToolsCallParameter],
+) -> str:
+    """Build the key identifying a call, scoped to the configured credentials."""
+    instance, api_token = _credentials()
+
+    return tool_call_key(tool_display_name, parameters, credential_scope(instance, api_token))
+
+
+def _error(exc: Exception, trace: ToolCallTrace | None = None) -> dict[str, Any]:
+    """Wrap an exception in the tool response shape."""
+    if trace is not None:
+        trace.error_type = type(exc).__qualname__
+    return {"error": str(exc), "result": None}
+
+
+def _timeout_error(tool_display_name: str, trace: ToolCallTrace | None = None) -> dict[str, Any]:
+    """Build the tool response for a call that ran out of time."""
+    if trace is not None and trace.error_type is None:
+        trace.error_type = DeadlineExceededError.__qualname__
+    return {"error": f"Tool call '{tool_display_name}' timed out", "result": None}
+
+
+def _observe(
+    tracer: ToolTracer,
+    tool_display_name: str,
+    parameters: dict[str, models.ToolsCallParameter],
+) -> AbstractContextManager[ToolCallTrace]:
+    """Open the span of a tool call if tracing is enabled, else an unrecorded trace for metrics."""
+    if tracer.enabled:
+        return tracer.tool_call(tool_display_name, parameters)
+    return nullcontext(ToolCallTrace(None))
+
+
+def _trace_cache_hit(trace: ToolCallTrace | None, stale: bool = False) -> None:
+    """Record on a call's trace that it was answered from the result cache."""
+    if trace is not None:
+        trace.cache_hit = True
+        trace.stale = stale
+
+
+def _unavailable_error(tool_display_name: str, retry_in: float) -> dict[str, Any]:
+    """Build the tool response for a call rejected by an open circuit breaker."""
+    return {
+        "error": (
+            f"Tool '{tool_display_name}' is temporarily unavailable after repeated failures; "
+            f"try again in {retry_in:.0f}s"
+        ),
+        "result": None,
+    }
+
+
+def _request_options(headers: dict[str, str] | None = None) -> dict[str, Any]:
+    """Build per-request options that bound the HTTP call by the current deadline.
+
+    ``headers`` are sent with the request, e.g. to propagate the trace context.
+    """
+    options: dict[str, Any] = {} if headers is None else {"http_headers": headers}
+    left = remaining()
+    if left is None:
+        return options
+    if left <= 0:
+        raise DeadlineExceededError
+    options["timeout_ms"] = max(1, int(left * 1000))
+    return options
+
+
+def _rate_limited(tool_display_name: str) -> RateLimitExceededError:
+    """Build the error for a call that couldn't get a rate limit token."""
+    return RateLimitExceededError(f"Client-side rate limit for '{tool_display_name}' exceeded")
+
+
+def _acquire_rate_limit(scope: str, tool_display_name: str) -> None:
+    """Take a rate limit token, waiting at most until the current deadline if blocking."""
+    limiter = get_rate_limiter()
+    if limiter.policy.blocking:
+        acquired = limiter.acquire(scope, tool_display_name, timeout=remaining())
+    else:
+        acquired = limiter.try_acquire(scope, tool_display_name)
+    if not acquired:
+        raise _rate_limited(tool_display_name)
+
+
+async def _acquire_rate_limit_async(scope: str, tool_display_name: str) -> None:
+    """Take a rate limit token without blocking the event loop."""
+    limiter = get_rate_limiter()
+    if limiter.policy.blocking:
+        acquired = await limiter.acquire_async(scope, tool_display_name, timeout=remaining())
+    else:
+        acquired = limiter.try_acquire(scope, tool_display_name)
+    if not acquired:
+        raise _rate_limited(tool_display_name)
+
+
+def _limited(send: Callable[[], T]) -> T:
+    """Make one request while holding a concurrency permit.
+
+    The permit is taken per request rather than per tool call, so the limiter
+    sees the latency and outcome of every attempt, including retried 429s.
+
+    Raises:
+        DeadlineExceededError: If no permit was free before the current deadline
+    """
+    limiter = get_concurrency_limiter()
+    if not limiter.acquire(timeout=remaining()):
+        raise DeadlineExceededError
+    start = time.perf_counter()
+    try:
+        result = send()
+    except BaseException as exc:
+        limiter.release(time.perf_counter() - start, exc)
+        raise
+    limiter.release(time.perf_counter() - start)
+    return result
+
+
+async def _limited_async(send: Callable[[], Awaitable[T]]) -> T:
+    """Await one request while holding a concurrency permit."""
+    limiter = get_concurrency_limiter()
+    if not await limiter.acquire_async(timeout=remaining()):
+        raise DeadlineExceededError
+    start = time.perf_counter()
+    try:
+        result = await send()
+    except BaseException as exc:
+        limiter.release(time.perf_counter() - start, exc)
+        raise
+    limiter.release(time.perf_counter() - start)
+    return result
+
+
+def _failed(
+    exc: BaseException,
+    tool_display_name: str,
+    breaker: CircuitBreaker,
+) -> dict[str, Any]:
+    """Record a failed backend call and build its tool response.
+
+    Exceptions that aren't ``Exception`` subclasses, such as cancellation, are re-raised.
+    """
+    breaker.record(exc)
+    if isinstance(exc, TimeoutError | asyncio.TimeoutError | httpx.TimeoutException):
+        return _timeout_error(tool_display_name)
+    if not isinstance(exc, Exception):
+        raise exc
+    return _error(exc)
+
+
+def _is_deterministic(exc: BaseException) -> bool:
+    """Whether repeating a failed call unchanged is bound to fail the same way.
+
+    Client errors such as a bad request or a permission denied qualify, unless
+    the retry policy treats their status as transient (e.g. 429).
+    """
+    return (
+        isinstance(exc, GleanBaseError)
+        and 400 <= exc.status_code < 500
+        and not get_retrier().policy.is_retryable(exc)
+    )
+
+
+def _trace_attempts(
+    trace: ToolCallTrace | None,
+    tries: int,
+    exc: BaseException | None = None,
+) -> None:
+    """Record the retries and the error class of a backend call on its trace."""
+    if trace is None:
+        return
+    trace.retry_count = max(0, tries - 1)
+    if exc is not None:
+        trace.error_type = type(exc).__qualname__
+
+
+def _fetch(
+    key: str,
+    tool_display_name: str,
+    parameters: dict[str, models.ToolsCallParameter],
+    trace: ToolCallTrace | None = None,
 ) -> dict[str, Any]:
-    """Execute a Glean stub tool and wrap the response."""
+    """Call the Glean tools endpoint and cache a successful result.
+
+    When the call is traced, the trace context is sent to the backend and the
+    retries and error class are recorded in ``trace``.
+    """
+    breaker = get_circuit_breakers().get(tool_display_name)
+    if not breaker.allow():
+        return _unavailable_error(tool_display_name, breaker.retry_in())
+
+    headers = get_tool_tracer().headers() if trace is not None else None
+    tries = 0
+
+    def attempt() -> Any:
+        _acquire_rate_limit(scope, tool_display_name)
+        return _limited(
+            lambda: g_client.client.tools.run(
+                name=tool_display_name,
+                parameters=parameters,
+                **_request_options(headers),
+            )
+        )
+
+    def send() -> Any:
+        nonlocal tries
+        tries += 1
+        return get_hedger().call(tool_display_name, attempt)
+
     try:
-        with api_client() as g_client:
-            result = g_client.client.tools.run(
+        scope = credential_scope(*_credentials())
+        with get_client_pool().lease(*_credentials()):
+            g_client = pooled_client()
+            result = get_retrier().call(send)
+    except BaseException as exc:
+        _trace_attempts(trace, tries, exc)
+        response = _failed(exc, tool_display_name, breaker)
+        if _is_deterministic(exc):
+            get_result_cache().put_error(key, response)
+        return response
+
+    _trace_attempts(trace, tries)
+
+    breaker.record()
+    get_result_cache().put(key, tool_display_name, result)
+    return {"result": result}
+
+
+async def _fetch_async(
+    key: str,
+    tool_display_name: str,
+    parameters: dict[str, models.ToolsCallParameter],
+    trace: ToolCallTrace | None = None,
+) -> dict[str, Any]:
+    """Call the Glean tools endpoint asynchronously and cache a successful result."""
+    breaker = get_circuit_breakers().get(tool_display_name)
+    if not breaker.allow():
+        return _unavailable_error(tool_display_name, breaker.retry_in())
+
+    headers = get_tool_tracer().headers() if trace is not None else None
+    tries = 0
+
+    async def attempt() -> Any:
+        await _acquire_rate_limit_async(scope, tool_display_name)
+        return await _limited_async(
+            lambda: g_client.client.tools.run_async(
                 name=tool_display_name,
                 parameters=parameters,
+                **_request_options(headers),
+            )
+        )
+
+    def send() -> Awaitable[Any]:
+        nonlocal tries
+        tries += 1
+        return get_hedger().call_async(tool_display_name, attempt)
+
+    try:
+        scope = credential_scope(*_credentials())
+        with get_client_pool().lease(*_credentials()):
+            g_client = pooled_async_client()
+            result = await asyncio.wait_for(get_retrier().call_async(send), remaining())
+    except BaseException as exc:
+        _trace_attempts(trace, tries, exc)
+        response = _failed(exc, tool_display_name, breaker)
+        if _is_deterministic(exc):
+            get_result_cache().put_error(key, response)
+        return response
+
+    _trace_attempts(trace, tries)
+
+    breaker.record()
+    await get_result_cache().put_async(key, tool_display_name, result)
+    return {"result": result}
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    """Get the thread pool for background refreshes, creating it on first use."""
+    global _refresh_executor
+    if _refresh_executor is None:
+        with _refresh_lock:
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(
+                    max_workers=REFRESH_MAX_WORKERS, thread_name_prefix="glean-refresh"
+                )
+    return _refresh_executor
+
+
+def _refresh(
+    key: str,
+    tool_display_name: str,
+    parameters: dict[str, models.ToolsCallParameter],
+) -> None:
+    """Refetch a stale cached result; the cache keeps the old one if this fails."""
+    try:
+        tracer = get_tool_tracer()
+        if not tracer.enabled:
+            get_single_flight().do(key, lambda: _fetch(key, tool_display_name, parameters))
+            return
+        with tracer.tool_call(tool_display_name, parameters, refresh=True) as trace:
+            response = get_single_flight().do(
+                key, lambda: _fetch(key, tool_display_name, parameters, trace)
+            )
+            tracer.finish_tool_call(trace, response)
+    finally:
+        get_result_cache().release_refresh(key)
+
+
+async def _refresh_async(
+    key: str,
+    tool_display_name: str,
+    parameters: dict[str, models.ToolsCallParameter],
+) -> None:
+    """Refetch a stale cached result asynchronously."""
+    try:
+        tracer = get_tool_tracer()
+        if not tracer.enabled:
+            await get_single_flight().do_async(
+                key, lambda: _fetch_async(key, tool_display_name, parameters)
+            )
+            return
+        with tracer.tool_call(tool_display_name, parameters, refresh=True) as trace:
+            response = await get_single_flight().do_async(
+                key, lambda: _fetch_async(key, tool_display_name, parameters, trace)
             )
+            tracer.finish_tool_call(trace, response)
+    finally:
+        get_result_cache().release_refresh(key)
+
+
+def run_tool(
+    tool_display_name: str,
+    parameters: dict[str, models.ToolsCallParameter],
+    credentials: Credentials | None = None,
+) -> dict[str, Any]:
+    """Execute a Glean stub tool and wrap the response.
+
+    Results are served from the result cache when the tool has a TTL configured,
+    and concurrent identical calls share a single request to the backend. Stale
+    results of tools with a stale TTL are served immediately and refreshed in
+    the background, within the caller's deadline. Deterministic errors, such as
+    an invalid parameter, are answered from the cache for the policy's error TTL.
+
+    Backend calls wait for a permit from the adaptive concurrency limiter, are
+    short-circuited by a per-tool circuit breaker while the tool keeps failing,
+    and take a client-side rate limit token for every request. Slow requests to
+    opted-in tools are hedged, transient failures are retried, and the whole
+    call is bounded by the current
+    :func:`~glean.agent_toolkit.runtime.deadline.deadline`. Each call gets an
+    OpenTelemetry span while tracing is enabled, and is measured while metrics
+    are enabled.
+
+    Args:
+        tool_display_name: The Glean tool display name
+        parameters: Tool call parameters
+        credentials: Credentials for this call; defaults to the ones set for
+            the current context, then to the environment
+    """
+    if credentials is not None:
+        with use_credentials(credentials):
+            return run_tool(tool_display_name, parameters)
+
+    tracer = get_tool_tracer()
+    recorder = get_metrics_recorder()
+    if not (tracer.enabled or recorder.enabled):
+        return _run_tool(tool_display_name, parameters, None)
+
+    call = recorder.start(tool_display_name)
+    with _observe(tracer, tool_display_name, parameters) as trace:
+        try:
+            response = _run_tool(tool_display_name, parameters, trace)
+        except BaseException as exc:
+            recorder.finish(call, None, type(exc).__qualname__)
+            raise
+        trace.result_size = recorder.finish(call, response, trace.error_type)
+        if trace.span is not None:
+            tracer.finish_tool_call(trace, response)
+        return response
+
+
+def _run_tool(
+    tool_display_name: str,
+    parameters: dict[str, models.ToolsCallParameter],
+    trace: ToolCallTrace | None,
+) -> dict[str, Any]:
+    """Execute a tool call for :func:`run_tool`, recording what happened in ``trace``."""
+    try:
+        key = _call_key(tool_display_name, parameters)
+    except Exception as exc:
+        return _error(exc, trace)
+
+    cache = get_result_cache()
+    if cache.caches(tool_display_name):
+        found = cache.lookup(key, tool_display_name)
+        if found is not None:
+            cached, stale = found
+            if stale and cache.claim_refresh(key):
+                _get_refresh_executor().submit(
+                    contextvars.copy_context().run, _refresh, key, tool_display_name, parameters
+                )
+            _trace_cache_hit(trace, stale)
+            return {"result": cached}
+    if cache.caches_errors:
+        cached_error = cache.get_error(key)
+        if cached_error is not None:
+            _trace_cache_hit(trace)
+            return cached_error
 
-            return {"result": result}
+    left = remaining()
+    if left is not None and left <= 0:
+        return _timeout_error(tool_display_name, trace)
+
+    try:
+        response = get_single_flight().do(
+            key, lambda: _fetch(key, tool_display_name, parameters, trace), timeout=left
+        )
+    except TimeoutError:
+        return _timeout_error(tool_display_name, trace)
+    return dict(response)
+
+
+async def run_tool_async(
+    tool_display_name: str,
+    parameters: dict[str, models.ToolsCallParameter],
+    credentials: Credentials | None = None,
+) -> dict[str, Any]:
+    """Execute a Glean stub tool without blocking the event loop and wrap the response.
+
+    Results are served from the result cache when the tool has a TTL configured,
+    and concurrent identical calls share a single request to the backend. Stale
+    results of tools with a stale TTL are served immediately and refreshed in
+    the background, within the caller's deadline. Deterministic errors, such as
+    an invalid parameter, are answered from the cache for the policy's error TTL.
+
+    Backend calls wait for a permit from the adaptive concurrency limiter, are
+    short-circuited by a per-tool circuit breaker while the tool keeps failing,
+    and take a client-side rate limit token for every request. Slow requests to
+    opted-in tools are hedged, transient failures are retried, and the whole
+    call is bounded by the current
+    :func:`~glean.agent_toolkit.runtime.deadline.deadline`. Each call gets an
+    OpenTelemetry span while tracing is enabled, and is measured while metrics
+    are enabled.
+
+    Args:
+        tool_display_name: The Glean tool display name
+        parameters: Tool call parameters
+        credentials: Credentials for this call; defaults to the ones set for
+            the current context, then to the environment
+    """
+    if credentials is not None:
+        with use_credentials(credentials):
+            return await run_tool_async(tool_display_name, parameters)
+
+    tracer = get_tool_tracer()
+    recorder = get_metrics_recorder()
+    if not (tracer.enabled or recorder.enabled):
+        return await _run_tool_async(tool_display_name, parameters, None)
+
+    call = recorder.start(tool_display_name)
+    with _observe(tracer, tool_display_name, parameters) as trace:
+        try:
+            response = await _run_tool_async(tool_display_name, parameters, trace)
+        except BaseException as exc:
+            recorder.finish(call, None, type(exc).__qualname__)
+            raise
+        trace.result_size = recorder.finish(call, response, trace.error_type)
+        if trace.span is not None:
+            tracer.finish_tool_call(trace, response)
+        return response
+
+
+async def _run_tool_async(
+    tool_display_name: str,
+    parameters: dict[str, models.ToolsCallParameter],
+    trace: ToolCallTrace | None,
+) -> dict[str, Any]:
+    """Execute a tool call for :func:`run_tool_async`, recording what happened in ``trace``."""
+    try:
+        key = _call_key(tool_display_name, parameters)
+    except Exception as exc:
+        return _error(exc, trace)
+
+    cache = get_result_cache()
+    if cache.caches(tool_display_name):
+        found = await cache.lookup_async(key, tool_display_name)
+        if found is not None:
+            cached, stale = found
+            if stale and cache.claim_refresh(key):
+                task = asyncio.ensure_future(_refresh_async(key, tool_display_name, parameters))
+                _refresh_tasks.add(task)
+                task.add_done_callback(_refresh_tasks.discard)
+            _trace_cache_hit(trace, stale)
+            return {"result": cached}
+    if cache.caches_errors:
+        cached_error = cache.get_error(key)
+        if cached_error is not None:
+            _trace_cache_hit(trace)
+            return cached_error
+
+    left = remaining()
+    if left is not None and left <= 0:
+        return _timeout_error(tool_display_name, trace)
+
+    try:
+        response = await get_single_flight().do_async(
+            key, lambda: _fetch_async(key, tool_display_name, parameters, trace), timeout=left
+        )
+    except (TimeoutError, asyncio.TimeoutError):
+        return _timeout_error(tool_display_name, trace)
+    return dict(response)
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    """Validate a batch concurrency cap."""
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+
+def _timed_run_tool(
+    tool_display_name: str,
+    parameters: dict[str, models.ToolsCallParameter],
+) -> ToolCallResult:
+    """Run one batch call and measure its latency."""
+    start = time.perf_counter()
+    try:
+        response = run_tool(tool_display_name, parameters)
     except Exception as exc:
-        return {"error": str(exc), "result": None}
+        response = _error(exc)
+    return ToolCallResult(tool_display_name, response, time.perf_counter() - start)
+
+
+def run_tools(
+    calls: Iterable[ToolCall],
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> list[ToolCallResult]:
+    """Execute several Glean stub tools concurrently.
+
+    Calls run on a bounded thread pool and share pooled connections. A failing
+    call is reported in its own result and doesn't affect the others.
+
+    Args:
+        calls: ``(tool_display_name, parameters)`` pairs
+        max_concurrency: Maximum number of calls in flight at once
+
+    Returns:
+        One result per call, in input order
+    """
+    _check_concurrency(max_concurrency)
+    calls = list(calls)
+    if not calls:
+        return []
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, len(calls)),
+        thread_name_prefix="glean-run-tools",
+    ) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, _timed_run_tool, name, parameters)
+            for name, parameters in calls
+        ]
+        return [future.result() for future in futures]
+
+
+async def run_tools_async(
+    calls: Iterable[ToolCall],
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> list[ToolCallResult]:
+    """Execute several Glean stub tools concurrently on the running event loop.
+
+    Args:
+        calls: ``(tool_display_name, parameters)`` pairs
+        max_concurrency: Maximum number of calls in flight at once
+
+    Returns:
+        One result per call, in input order
+    """
+    _check_concurrency(max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def timed_run_tool(
+        tool_display_name: str,
+        parameters: dict[str, models.ToolsCallParameter],
+    ) -> ToolCallResult:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await run_tool_async(tool_display_name, parameters)
+            except Exception as exc:
+                response = _error(exc)
+            return ToolCallResult(tool_display_name, response, time.perf_counter() - start)
+
+    return list(await asyncio.gather(*(timed_run_tool(name, params) for name, params in calls)))
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from glean.agent_toolkit.decorators import tool_spec
-from glean.agent_toolkit.tools._common import run_tool
+from glean.agent_toolkit.tools._common import run_tool, run_tool_async
 from glean.api_client import models
 
 
@@ -21,9 +21,18 @@ from glean.api_client import models
         "- The results returned are not exhaustive; we only return the top few most relevant "
         "results to a query."
     ),
+    timeout=30.0,
 )
 def code_search(
     parameters: dict[str, models.ToolsCallParameter],
 ) -> dict[str, Any]:
     """Search code repositories based on the query."""
     return run_tool("Code Search", parameters)
+
+
+@code_search.async_variant
+async def code_search_async(
+    parameters: dict[str, models.ToolsCallParameter],
+) -> dict[str, Any]:
+    """Search code repositories based on the query."""
+    return await run_tool_async("Code Search", parameters)
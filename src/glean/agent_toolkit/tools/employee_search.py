@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from glean.agent_toolkit.decorators import tool_spec
-from glean.agent_toolkit.tools._common import run_tool
+from glean.agent_toolkit.tools._common import run_tool, run_tool_async
 from glean.api_client import models
 
 
@@ -27,7 +27,16 @@ from glean.api_client import models
         '- For analytics questions such as "how many people..." use the "statistics" field '
         "in the output."
     ),
+    timeout=30.0,
 )
 def employee_search(parameters: dict[str, models.ToolsCallParameter]) -> dict[str, Any]:
     """Search for employees based on the query."""
     return run_tool("Employee Search", parameters)
+
+
+@employee_search.async_variant
+async def employee_search_async(
+    parameters: dict[str, models.ToolsCallParameter],
+) -> dict[str, Any]:
+    """Search for employees based on the query."""
+    return await run_tool_async("Employee Search", parameters)
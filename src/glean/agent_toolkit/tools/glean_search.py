@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from glean.agent_toolkit.decorators import tool_spec
-from glean.agent_toolkit.tools._common import run_tool
+from glean.agent_toolkit.tools._common import run_tool, run_tool_async
 from glean.api_client import models
 
 
@@ -20,7 +20,16 @@ from glean.api_client import models
         '- For analytics questions such as "how many documents..." use the "statistics" '
         "field in the output."
     ),
+    timeout=30.0,
 )
 def glean_search(parameters: dict[str, models.ToolsCallParameter]) -> dict[str, Any]:
     """Search Glean for relevant documents using the query."""
     return run_tool("Glean Search", parameters)
+
+
+@glean_search.async_variant
+async def glean_search_async(
+    parameters: dict[str, models.ToolsCallParameter],
+) -> dict[str, Any]:
+    """Search Glean for relevant documents using the query."""
+    return await run_tool_async("Glean Search", parameters)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from glean.agent_toolkit.decorators import tool_spec
-from glean.agent_toolkit.tools._common import run_tool
+from glean.agent_toolkit.tools._common import run_tool, run_tool_async
 from glean.api_client import models
 
 
@@ -17,7 +17,16 @@ from glean.api_client import models
         "- Results returned are not exhaustive; we can only return the top 10 emails sorted by "
         "recency (most recent first)."
     ),
+    timeout=30.0,
 )
 def gmail_search(parameters: dict[str, models.ToolsCallParameter]) -> dict[str, Any]:
     """Search Gmail messages based on the query."""
     return run_tool("Gmail Search", parameters)
+
+
+@gmail_search.async_variant
+async def gmail_search_async(
+    parameters: dict[str, models.ToolsCallParameter],
+) -> dict[str, Any]:
+    """Search Gmail messages based on the query."""
+    return await run_tool_async("Gmail Search", parameters)
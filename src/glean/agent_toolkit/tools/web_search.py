@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from glean.agent_toolkit.decorators import tool_spec
-from glean.agent_toolkit.tools._common import run_tool
+from glean.agent_toolkit.tools._common import run_tool, run_tool_async
 from glean.api_client import models
 
 
@@ -32,7 +32,16 @@ from glean.api_client import models
         "- Do NOT use this tool for queries seeking general ideas, which may not benefit from "
         "specific information."
     ),
+    timeout=30.0,
 )
 def web_search(parameters: dict[str, models.ToolsCallParameter]) -> dict[str, Any]:
     """Search the web for up-to-date external information."""
     return run_tool("Web Browser", parameters)
+
+
+@web_search.async_variant
+async def web_search_async(
+    parameters: dict[str, models.ToolsCallParameter],
+) -> dict[str, Any]:
+    """Search the web for up-to-date external information."""
+    return await run_tool_async("Web Browser", parameters)
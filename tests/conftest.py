@@ -144,6 +144,35 @@ def mock_glean_env_vars() -> Generator[None, None, None]:
         yield
 
 
+@pytest.fixture(autouse=True)
+def reset_runtime_state() -> Generator[None, None, None]:
+    """Reset process-wide runtime state after each test so tests don't leak into each other."""
+    from glean.agent_toolkit.runtime.breaker import BreakerPolicy, get_circuit_breakers
+    from glean.agent_toolkit.runtime.cache import CachePolicy, get_result_cache
+    from glean.agent_toolkit.runtime.concurrency import (
+        ConcurrencyPolicy,
+        get_concurrency_limiter,
+    )
+    from glean.agent_toolkit.runtime.hedge import HedgePolicy, get_hedger
+    from glean.agent_toolkit.runtime.metrics import MetricsPolicy, get_metrics_recorder
+    from glean.agent_toolkit.runtime.pool import PoolLimits, get_client_pool
+    from glean.agent_toolkit.runtime.ratelimit import RateLimitPolicy, get_rate_limiter
+    from glean.agent_toolkit.runtime.retry import RetryPolicy, get_retrier
+    from glean.agent_toolkit.runtime.tracing import TracingPolicy, get_tool_tracer
+
+    yield
+    get_client_pool().configure(PoolLimits())
+    get_retrier().configure(RetryPolicy())
+    get_circuit_breakers().configure(BreakerPolicy())
+    get_rate_limiter().configure(RateLimitPolicy())
+    get_concurrency_limiter().configure(ConcurrencyPolicy())
+    get_hedger().configure(HedgePolicy())
+    get_result_cache().configure(CachePolicy())
+    get_result_cache().clear()
+    get_tool_tracer().configure(TracingPolicy())
+    get_metrics_recorder().configure(MetricsPolicy())
+
+
 def should_regenerate_cassettes() -> bool:
     """Check if cassettes should be regenerated from environment variables."""
     return os.getenv("VCR_REGENERATE", "").lower() in ("1", "true", "yes")
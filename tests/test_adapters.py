@@ -1,5 +1,13 @@
 """Tests for the adapters."""
 
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from glean.agent_toolkit.spec import ToolSpec
@@ -26,6 +34,36 @@ except ImportError:
     HAS_CREWAI = False
 
 
+def test_importing_toolkit_does_not_load_adapter_modules() -> None:
+    """Test that adapter modules and their frameworks are imported lazily."""
+    code = (
+        "import sys, glean.agent_toolkit\n"
+        "loaded = [m for m in sys.modules if m.startswith('glean.agent_toolkit.adapters.')]\n"
+        "frameworks = [m for m in ('agents', 'crewai', 'langchain', 'google.adk') if m in sys.modules]\n"
+        "print(loaded, frameworks)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    assert output == "[] []"
+
+
+def test_adapters_package_resolves_names_lazily() -> None:
+    """Test that public adapter names still resolve from the package."""
+    from glean.agent_toolkit import adapters
+    from glean.agent_toolkit.adapters.base import BaseAdapter
+    from glean.agent_toolkit.adapters.openai import OpenAIAdapter
+
+    assert adapters.BaseAdapter is BaseAdapter
+    assert adapters.OpenAIAdapter is OpenAIAdapter
+    assert adapters.openai.OpenAIAdapter is OpenAIAdapter
+    assert set(adapters.__all__) <= set(dir(adapters))
+
+    with pytest.raises(AttributeError):
+        adapters.MissingAdapter  # noqa: B018
+
+
 def create_mock_tool_spec() -> ToolSpec:
     """Create a mock tool spec for testing."""
 
@@ -202,3 +240,107 @@ def test_crewai_adapter_integration() -> None:
     if hasattr(tool, "_run"):
         result = tool._run(a=3, b=5)
         assert result == 8
+
+
+class _RecordingFunctionTool:
+    """Stand-in for agents.tool.FunctionTool that keeps constructor arguments."""
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+@pytest.fixture
+def agents_function_tool(monkeypatch):
+    """Make OpenAIAdapter build agents-style tools without the Agents SDK installed."""
+    from glean.agent_toolkit.adapters import openai as openai_adapter
+
+    monkeypatch.setattr(openai_adapter, "HAS_OPENAI", True)
+    monkeypatch.setattr(openai_adapter, "_RuntimeOpenAIFunctionTool", _RecordingFunctionTool)
+    return openai_adapter
+
+
+async def test_openai_agents_tool_offloads_sync_tools(agents_function_tool) -> None:
+    """Test that sync tools run on the executor and overlap instead of blocking the loop."""
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def slow_add(a: int, b: int) -> int:
+        threads.append(threading.get_ident())
+        time.sleep(0.2)
+        return a + b
+
+    tool_spec = create_mock_tool_spec()
+    tool_spec.function = slow_add
+    tool = agents_function_tool.OpenAIAdapter(tool_spec).to_agents_tool()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        tool.on_invoke_tool(None, json.dumps({"a": 1, "b": 2})),
+        tool.on_invoke_tool(None, json.dumps({"a": 3, "b": 4})),
+    )
+    elapsed = time.perf_counter() - start
+
+    assert results == [3, 7]
+    assert loop_thread not in threads
+    assert elapsed < 0.35
+
+
+async def test_openai_agents_tool_awaits_async_variant(agents_function_tool) -> None:
+    """Test that a registered coroutine variant is awaited directly."""
+    async def add_async(a: int, b: int) -> int:
+        return a + b
+
+    tool_spec = create_mock_tool_spec()
+    tool_spec.async_function = add_async
+    tool = agents_function_tool.OpenAIAdapter(tool_spec).to_agents_tool()
+
+    assert await tool.on_invoke_tool(None, json.dumps({"a": 3, "b": 5})) == 8
+
+
+async def test_openai_agents_tool_uses_custom_executor(agents_function_tool) -> None:
+    """Test that an adapter-specific executor is used for sync tools."""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="custom-tool")
+    names = []
+
+    def add(a: int, b: int) -> int:
+    
+        names.append(threading.current_thread().name)
+        return a + b
+
+    tool_spec = create_mock_tool_spec()
+    tool_spec.function = add
+    try:
+        adapter = agents_function_tool.OpenAIAdapter(tool_spec, executor=executor)
+        tool = adapter.to_agents_tool()
+        assert await tool.on_invoke_tool(None, json.dumps({"a": 1, "b": 1})) == 2
+    finally:
+        executor.shutdown()
+
+    assert names[0].startswith("custom-tool")
+
+
+async def test_openai_agents_tool_reports_errors(agents_function_tool) -> None:
+    """Test that tool exceptions are returned as error strings."""
+
+    def broken(a: int, b: int) -> int:
+        raise RuntimeError("boom")
+
+    tool_spec = create_mock_tool_spec()
+    tool_spec.function = broken
+    tool = agents_function_tool.OpenAIAdapter(tool_spec).to_agents_tool()
+
+    assert await tool.on_invoke_tool(None, '{"a": 1, "b": 2}') == "Error executing tool: boom"
+
+
+def test_openai_configure_executor(agents_function_tool) -> None:
+    """Test resizing the shared executor."""
+    agents_function_tool.configure_executor(max_workers=2)
+    try:
+        executor = agents_function_tool.get_executor()
+        assert executor._max_workers == 2
+        assert agents_function_tool.get_executor() is executor
+    finally:
+        agents_function_tool.configure_executor(agents_function_tool.DEFAULT_MAX_WORKERS)
+
+    with pytest.raises(ValueError):
+        agents_function_tool.configure_executor(max_workers=0)
@@ -0,0 +1,160 @@
+"""Tests for per-tool circuit breakers."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from glean.agent_toolkit.runtime.breaker import (
+    BreakerPolicy,
+    CircuitBreaker,
+    CircuitBreakers,
+    CircuitState,
+    get_circuit_breakers,
+    is_failure,
+)
+from glean.agent_toolkit.runtime.deadline import DeadlineExceededError
+from glean.api_client.errors import GleanError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def http_error(status_code: int) -> GleanError:
+    """Build an SDK error for an HTTP response."""
+    request = httpx.Request("POST", "https://test-instance-be.glean.com/rest/api/v1/tools/call")
+    return GleanError(f"HTTP {status_code}", httpx.Response(status_code, request=request))
+
+
+def trip(breaker: CircuitBreaker, failures: int) -> None:
+    """Record a number of failed calls."""
+    for _ in range(failures):
+        assert breaker.allow()
+        breaker.record(http_error(503))
+
+
+@pytest.mark.parametrize(
+    ("exc", "failure"),
+    [
+        (http_error(500), True),
+        (http_error(503), True),
+        (http_error(429), True),
+        (http_error(400), False),
+        (http_error(404), False),
+        (TimeoutError(), True),
+        (httpx.ConnectError("refused"), True),
+        (DeadlineExceededError(), False),
+        (ValueError("bad"), False),
+    ],
+)
+def test_is_failure(exc: Exception, failure: bool) -> None:
+    """Test which errors count against the circuit."""
+    assert is_failure(exc) is failure
+
+
+def test_opens_after_consecutive_failures() -> None:
+    """Test that the circuit opens at the threshold and rejects calls."""
+    breaker = CircuitBreaker(BreakerPolicy(failure_threshold=3), FakeClock())
+
+    trip(breaker, 2)
+    assert breaker.state is CircuitState.CLOSED
+    trip(breaker, 1)
+
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
+    assert breaker.rejected == 1
+
+
+def test_success_resets_failure_count() -> None:
+    """Test that only consecutive failures open the circuit."""
+    breaker = CircuitBreaker(BreakerPolicy(failure_threshold=2), FakeClock())
+
+    trip(breaker, 1)
+    assert breaker.allow()
+    breaker.record(http_error(400))
+    trip(breaker, 1)
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_probe_closes_on_success() -> None:
+    """Test recovery through a single half-open probe."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(BreakerPolicy(failure_threshold=1, recovery_timeout=10), clock)
+    trip(breaker, 1)
+
+    clock.now = 4
+    assert breaker.retry_in() == 6
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record()
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow()
+
+
+def test_half_open_probe_reopens_on_failure() -> None:
+    """Test that a failed probe reopens the circuit for another recovery period."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(BreakerPolicy(failure_threshold=1, recovery_timeout=10), clock)
+    trip(breaker, 1)
+
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record(TimeoutError())
+
+    assert breaker.state is CircuitState.OPEN
+    clock.now = 15
+    assert not breaker.allow()
+
+
+def test_neutral_outcome_releases_probe() -> None:
+    """Test that a probe abandoned by its caller frees the probe slot without closing."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(BreakerPolicy(failure_threshold=1, recovery_timeout=10), clock)
+    trip(breaker, 1)
+
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record(asyncio.CancelledError())
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow()
+
+
+def test_zero_threshold_disables_breaker() -> None:
+    """Test that a zero threshold never opens the circuit."""
+    breaker = CircuitBreaker(BreakerPolicy(failure_threshold=0))
+    for _ in range(10):
+        assert breaker.allow()
+        breaker.record(http_error(503))
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_breakers_are_per_tool() -> None:
+    """Test that breakers are keyed by tool display name and reset by configure."""
+    breakers = CircuitBreakers(BreakerPolicy(failure_threshold=1), FakeClock())
+    trip(breakers.get("Gemini Web Search"), 1)
+
+    assert breakers.get("Gemini Web Search") is breakers.get("Gemini Web Search")
+    assert breakers.states() == {"Gemini Web Search": CircuitState.OPEN}
+    assert breakers.get("Glean Search").allow()
+
+    breakers.configure(BreakerPolicy())
+    assert breakers.states() == {}
+
+
+def test_global_breakers() -> None:
+    """Test that the global breakers are a singleton."""
+    assert get_circuit_breakers() is get_circuit_breakers()
@@ -0,0 +1,150 @@
+"""Tests for the result cache."""
+
+from glean.agent_toolkit.runtime.cache import CachePolicy, ResultCache, get_result_cache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_default_policy_caches_nothing() -> None:
+    """Test that nothing is cached without a TTL."""
+    cache = ResultCache()
+
+    assert not cache.caches("Glean Search")
+    assert cache.put("key", "Glean Search", {"documents": []}) is False
+    assert cache.get("key") is None
+
+
+def test_per_tool_ttls() -> None:
+    """Test that per-tool TTLs override the default TTL."""
+    policy = CachePolicy(ttls={"Glean Search": 60, "Gemini Web Search": 0}, default_ttl=10)
+
+    assert policy.ttl_for("Glean Search") == 60
+    assert policy.ttl_for("Gemini Web Search") is None
+    assert policy.ttl_for("Code Search") == 10
+
+
+def test_get_returns_cached_value_until_expiry() -> None:
+    """Test TTL expiry."""
+    clock = FakeClock()
+    cache = ResultCache(CachePolicy(ttls={"Glean Search": 60}), clock=clock)
+    value = {"documents": ["a"]}
+
+    assert cache.put("key", "Glean Search", value)
+    clock.now = 59
+    assert cache.get("key") is value
+
+    clock.now = 60
+    assert cache.get("key") is None
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.expirations, stats.entries) == (1, 1, 1, 0)
+
+
+def test_lru_eviction_by_entries() -> None:
+    """Test that the least recently used entry is evicted first."""
+    cache = ResultCache(CachePolicy(default_ttl=60, max_entries=2))
+    cache.put("a", "Glean Search", "A")
+    cache.put("b", "Glean Search", "B")
+    assert cache.get("a") == "A"
+
+    cache.put("c", "Glean Search", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert cache.stats.evictions == 1
+
+
+def test_eviction_by_bytes() -> None:
+    """Test that entries are evicted to stay within max_bytes."""
+    cache = ResultCache(CachePolicy(default_ttl=60, max_bytes=10))
+    cache.put("a", "Glean Search", "x" * 6)
+    cache.put("b", "Glean Search", "y" * 6)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "y" * 6
+    assert cache.stats.bytes == 6
+    assert cache.put("c", "Glean Search", "z" * 11) is False
+
+
+def test_put_replaces_existing_entry() -> None:
+    """Test that re-caching a key replaces the entry and its size."""
+    cache = ResultCache(CachePolicy(default_ttl=60))
+    cache.put("a", "Glean Search", "xx")
+    cache.put("a", "Glean Search", "yyy")
+
+    assert cache.get("a") == "yyy"
+    assert cache.stats.bytes == 3
+    assert len(cache) == 1
+
+
+def test_invalidate_and_clear() -> None:
+    """Test dropping entries."""
+    cache = ResultCache(CachePolicy(default_ttl=60))
+    cache.put("a", "Glean Search", "A")
+    cache.put("b", "Glean Search", "B")
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == "B"
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats == type(cache.stats)()
+
+
+def test_configure_replaces_policy_and_drops_entries() -> None:
+    """Test reconfiguring the cache."""
+    cache = ResultCache(CachePolicy(default_ttl=60))
+    cache.put("a", "Glean Search", "A")
+
+    cache.configure(CachePolicy(ttls={"Code Search": 5}))
+
+    assert cache.get("a") is None
+    assert not cache.caches("Glean Search")
+    assert cache.caches("Code Search")
+
+
+def test_get_result_cache_returns_singleton() -> None:
+    """Test that get_result_cache returns the global cache."""
+    assert get_result_cache() is get_result_cache()
+
+
+def test_stale_results_are_served_until_hard_ttl() -> None:
+    """Test that results past their TTL are served as stale until the stale TTL runs out."""
+    clock = FakeClock()
+    cache = ResultCache(
+        CachePolicy(ttls={"Glean Search": 60}, stale_ttls={"Glean Search": 30}), clock=clock
+    )
+    cache.put("key", "Glean Search", "value")
+
+    assert cache.lookup("key") == ("value", False)
+    clock.now = 60
+    assert cache.lookup("key") == ("value", True)
+    assert cache.claim_refresh("key")
+    assert not cache.claim_refresh("key")
+    cache.release_refresh("key")
+
+    clock.now = 90
+    assert cache.lookup("key") is None
+    assert cache.stats.stale_hits == 1
+
+
+def test_error_responses_expire_after_error_ttl() -> None:
+    """Test negative caching."""
+    clock = FakeClock()
+    cache = ResultCache(CachePolicy(error_ttl=5), clock=clock)
+    response = {"error": "Invalid parameter", "result": None}
+
+    assert cache.put_error("key", response)
+    assert cache.get_error("key") == response
+    clock.now = 5
+    assert cache.get_error("key") is None
+    assert ResultCache().put_error("key", response) is False
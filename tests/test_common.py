@@ -1,11 +1,35 @@
+import asyncio
+import inspect
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 from unittest.mock import patch
 
+import httpx
 import pytest
 
-from glean.agent_toolkit.tools._common import api_client, run_tool
+from glean.agent_toolkit.runtime.breaker import BreakerPolicy, get_circuit_breakers
+from glean.agent_toolkit.runtime.cache import CachePolicy, get_result_cache
+from glean.agent_toolkit.runtime.concurrency import ConcurrencyPolicy, get_concurrency_limiter
+from glean.agent_toolkit.runtime.credentials import Credentials, use_credentials
+from glean.agent_toolkit.runtime.deadline import deadline
+from glean.agent_toolkit.runtime.hedge import HedgePolicy, get_hedger
+from glean.agent_toolkit.runtime.pool import get_client_pool
+from glean.agent_toolkit.runtime.ratelimit import RateLimit, RateLimitPolicy, get_rate_limiter
+from glean.agent_toolkit.runtime.retry import RetryPolicy, get_retrier
+from glean.agent_toolkit.tools._common import (
+    api_client,
+    pooled_async_client,
+    pooled_client,
+    run_tool,
+    run_tool_async,
+    run_tools,
+    run_tools_async,
+)
 from glean.api_client import models
+from glean.api_client.errors import GleanError
 
 
 class TestApiClient:
@@ -61,6 +85,90 @@ class TestApiClient:
                 api_client()
 
 
+class TestPooledClient:
+    """Test pooled_client function."""
+
+    def test_pooled_client_reuses_client(self) -> None:
+        """Test that repeated calls share one client per instance and token."""
+        with patch.dict(os.environ, {
+            "GLEAN_API_TOKEN": "test-token",
+            "GLEAN_INSTANCE": "test-instance"
+        }):
+            assert pooled_client() is pooled_client()
+
+    def test_pooled_client_keyed_by_credentials(self) -> None:
+        """Test that different tokens get different clients."""
+        with patch.dict(os.environ, {
+            "GLEAN_API_TOKEN": "token-a",
+            "GLEAN_INSTANCE": "test-instance"
+        }):
+            client_a = pooled_client()
+        with patch.dict(os.environ, {
+            "GLEAN_API_TOKEN": "token-b",
+            "GLEAN_INSTANCE": "test-instance"
+        }):
+            client_b = pooled_client()
+
+        assert client_a is not client_b
+
+    def test_pooled_client_missing_credentials(self) -> None:
+        """Test pooled client with missing credentials."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError, match="GLEAN_API_TOKEN and GLEAN_INSTANCE"):
+                pooled_client()
+
+
+class TestCredentials:
+    """Test credentials passed per call or per context."""
+
+    def test_context_credentials_override_environment(self) -> None:
+        """Test that use_credentials selects the tenant's pooled client."""
+        with patch.dict(os.environ, {}, clear=True):
+            with use_credentials(Credentials("tenant-instance", "tenant-token")):
+                g_client = pooled_client()
+
+        assert g_client is get_client_pool().get("tenant-instance", "tenant-token")
+
+    def test_credentials_repr_hides_token(self) -> None:
+        """Test that the API token doesn't leak into logs."""
+        assert "secret" not in repr(Credentials("instance", "secret"))
+        with pytest.raises(ValueError, match="instance and an API token"):
+            Credentials("instance", "")
+
+    def test_run_tool_with_per_call_credentials(self) -> None:
+        """Test that each tenant's call goes through its own client and cache entry."""
+        get_result_cache().configure(CachePolicy(ttls={"Test Tool": 60}))
+        tenants = {}
+
+        def client_for(instance: str, api_token: str) -> mock.MagicMock:
+            g_client = tenants.setdefault(api_token, mock.MagicMock())
+            g_client.client.tools.run.return_value = {"tenant": api_token}
+            return g_client
+
+        with patch.object(get_client_pool(), "get", side_effect=client_for):
+            first = run_tool("Test Tool", {}, credentials=Credentials("instance", "token-a"))
+            second = run_tool("Test Tool", {}, credentials=Credentials("instance", "token-b"))
+            again = run_tool("Test Tool", {}, credentials=Credentials("instance", "token-a"))
+
+        assert first == again == {"result": {"tenant": "token-a"}}
+        assert second == {"result": {"tenant": "token-b"}}
+        tenants["token-a"].client.tools.run.assert_called_once()
+
+    async def test_run_tool_async_with_per_call_credentials(self) -> None:
+        """Test per-call credentials on the async path."""
+        with patch.object(get_client_pool(), "get_async") as mock_get_async:
+            mock_get_async.return_value.client.tools.run_async = mock.AsyncMock(
+                return_value={"ok": True}
+            )
+
+            result = await run_tool_async(
+                "Test Tool", {}, credentials=Credentials("tenant-instance", "tenant-token")
+            )
+
+        assert result == {"result": {"ok": True}}
+        mock_get_async.assert_called_once_with("tenant-instance", "tenant-token")
+
+
 class TestRunTool:
     """Test run_tool function."""
 
@@ -71,10 +179,10 @@ class TestRunTool:
             "query": models.ToolsCallParameter(name="query", value="test query")
         }
 
-        with patch("glean.agent_toolkit.tools._common.api_client") as mock_api_client:
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
             mock_client = mock.MagicMock()
             mock_client.client.tools.run.return_value = mock_result
-            mock_api_client.return_value.__enter__.return_value = mock_client
+            mock_pooled_client.return_value = mock_client
 
             result = run_tool("Test Tool", parameters)
 
@@ -90,10 +198,10 @@ class TestRunTool:
             "query": models.ToolsCallParameter(name="query", value="test query")
         }
 
-        with patch("glean.agent_toolkit.tools._common.api_client") as mock_api_client:
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
             mock_client = mock.MagicMock()
             mock_client.client.tools.run.side_effect = Exception("API Error")
-            mock_api_client.return_value.__enter__.return_value = mock_client
+            mock_pooled_client.return_value = mock_client
 
             result = run_tool("Test Tool", parameters)
 
@@ -105,10 +213,10 @@ class TestRunTool:
             "query": models.ToolsCallParameter(name="query", value="test query")
         }
 
-        with patch("glean.agent_toolkit.tools._common.api_client") as mock_api_client:
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
             mock_client = mock.MagicMock()
             mock_client.client.tools.run.side_effect = ConnectionError("Network error")
-            mock_api_client.return_value.__enter__.return_value = mock_client
+            mock_pooled_client.return_value = mock_client
 
             result = run_tool("Test Tool", parameters)
 
@@ -119,10 +227,10 @@ class TestRunTool:
         mock_result = {"status": "success"}
         parameters = {}
 
-        with patch("glean.agent_toolkit.tools._common.api_client") as mock_api_client:
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
             mock_client = mock.MagicMock()
             mock_client.client.tools.run.return_value = mock_result
-            mock_api_client.return_value.__enter__.return_value = mock_client
+            mock_pooled_client.return_value = mock_client
 
             result = run_tool("Test Tool", parameters)
 
@@ -138,10 +246,700 @@ class TestRunTool:
             "query": models.ToolsCallParameter(name="query", value="test query")
         }
 
-        with patch("glean.agent_toolkit.tools._common.api_client") as mock_api_client:
-            mock_api_client.side_effect = ValueError("Missing credentials")
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_pooled_client.side_effect = ValueError("Missing credentials")
 
             # The run_tool function should catch the ValueError and return an error dict
             result = run_tool("Test Tool", parameters)
 
-            assert result == {"error": "Missing credentials", "result": None} 
\ No newline at end of file
+            assert result == {"error": "Missing credentials", "result": None} 
+
+
+class TestRunToolRetry:
+    """Test retries of transient failures."""
+
+    @staticmethod
+    def _error(status_code: int) -> GleanError:
+        request = httpx.Request("POST", "https://test-instance-be.glean.com/rest/api/v1/tools/call")
+        return GleanError("Backend unavailable", httpx.Response(status_code, request=request))
+
+    def test_run_tool_retries_transient_errors(self) -> None:
+        """Test that a 503 followed by a success returns the result."""
+        get_retrier().configure(RetryPolicy(base_delay=0))
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = [self._error(503), {"ok": True}]
+            mock_pooled_client.return_value = mock_client
+
+            result = run_tool("Test Tool", {})
+
+        assert result == {"result": {"ok": True}}
+        assert mock_client.client.tools.run.call_count == 2
+
+    def test_run_tool_reports_permanent_errors(self) -> None:
+        """Test that non-retryable errors are returned after one attempt."""
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = self._error(400)
+            mock_pooled_client.return_value = mock_client
+
+            result = run_tool("Test Tool", {})
+
+        assert result["result"] is None
+        assert result["error"].startswith("Backend unavailable")
+        mock_client.client.tools.run.assert_called_once()
+
+    async def test_run_tool_async_retries_transient_errors(self) -> None:
+        """Test that async calls retry transient errors too."""
+        get_retrier().configure(RetryPolicy(base_delay=0))
+
+        with patch("glean.agent_toolkit.tools._common.pooled_async_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run_async = mock.AsyncMock(
+                side_effect=[self._error(429), {"ok": True}]
+            )
+            mock_pooled_client.return_value = mock_client
+
+            result = await run_tool_async("Test Tool", {})
+
+        assert result == {"result": {"ok": True}}
+        assert mock_client.client.tools.run_async.await_count == 2
+
+
+class TestRunToolCircuitBreaker:
+    """Test fast failure of unhealthy tools."""
+
+    def test_open_circuit_fails_fast_for_that_tool_only(self) -> None:
+        """Test that a tripped tool is rejected without a request while others still run."""
+        get_retrier().configure(RetryPolicy(max_attempts=1))
+        get_circuit_breakers().configure(BreakerPolicy(failure_threshold=2))
+        request = httpx.Request("POST", "https://test-instance-be.glean.com/rest/api/v1/tools/call")
+        unavailable = GleanError("Unavailable", httpx.Response(503, request=request))
+
+        def run(name, parameters):
+            if name == "Gemini Web Search":
+                raise unavailable
+            return {"tool": name}
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = run
+            mock_pooled_client.return_value = mock_client
+
+            run_tool("Gemini Web Search", {})
+            run_tool("Gemini Web Search", {})
+            rejected = run_tool("Gemini Web Search", {})
+            healthy = run_tool("Glean Search", {})
+
+        assert rejected["result"] is None
+        assert "temporarily unavailable" in rejected["error"]
+        assert healthy == {"result": {"tool": "Glean Search"}}
+        assert mock_client.client.tools.run.call_count == 3
+
+
+class TestRunToolRateLimit:
+    """Test client-side rate limiting of tool calls."""
+
+    def test_non_blocking_limit_rejects_excess_calls(self) -> None:
+        """Test that calls over the limit fail fast without a request."""
+        get_rate_limiter().configure(
+            RateLimitPolicy(default=RateLimit(rate=0.001, burst=2), blocking=False)
+        )
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.return_value = {}
+            mock_pooled_client.return_value = mock_client
+
+            results = [
+                run_tool("Test Tool", {"n": models.ToolsCallParameter(name="n", value=str(i))})
+                for i in range(3)
+            ]
+
+        assert [r.get("error") for r in results[:2]] == [None, None]
+        assert results[2] == {
+            "error": "Client-side rate limit for 'Test Tool' exceeded",
+            "result": None,
+        }
+        assert mock_client.client.tools.run.call_count == 2
+
+    def test_blocking_limit_gives_up_at_deadline(self) -> None:
+        """Test that a blocking caller doesn't wait past its deadline."""
+        get_rate_limiter().configure(RateLimitPolicy(default=RateLimit(rate=0.001, burst=1)))
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.return_value = {}
+            mock_pooled_client.return_value = mock_client
+
+            first = {"n": models.ToolsCallParameter(name="n", value="1")}
+            second = {"n": models.ToolsCallParameter(name="n", value="2")}
+            assert run_tool("Test Tool", first) == {"result": {}}
+            with deadline(0.05):
+                limited = run_tool("Test Tool", second)
+
+        assert "rate limit" in limited["error"]
+
+    async def test_async_calls_wait_for_tokens(self) -> None:
+        """Test that async calls are smoothed to the configured rate."""
+        get_rate_limiter().configure(RateLimitPolicy(default=RateLimit(rate=20, burst=1)))
+
+        with patch("glean.agent_toolkit.tools._common.pooled_async_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run_async = mock.AsyncMock(return_value={})
+            mock_pooled_client.return_value = mock_client
+
+            start = time.monotonic()
+            results = await asyncio.gather(
+                *(
+                    run_tool_async(
+                        "Test Tool", {"n": models.ToolsCallParameter(name="n", value=str(i))}
+                    )
+                    for i in range(3)
+                )
+            )
+
+        assert results == [{"result": {}}] * 3
+        assert time.monotonic() - start >= 0.09
+
+
+class TestRunToolConcurrencyLimit:
+    """Test adaptive concurrency limiting of tool calls."""
+
+    def test_run_tool_respects_limit_and_releases_permits(self) -> None:
+        """Test that in-flight calls never exceed the limit and permits are returned."""
+        limiter = get_concurrency_limiter()
+        limiter.configure(ConcurrencyPolicy(enabled=True, initial_limit=2, max_limit=2))
+        lock = threading.Lock()
+        active = peak = 0
+
+        def run(name, parameters):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {}
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = run
+            mock_pooled_client.return_value = mock_client
+
+            calls = [("Test Tool", {"n": models.ToolsCallParameter(name="n", value=str(i))})
+                     for i in range(6)]
+            results = run_tools(calls)
+
+        assert all(r.error is None for r in results)
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    def test_run_tool_backs_off_on_rate_limiting(self) -> None:
+        """Test that a 429 shrinks the limit."""
+        get_retrier().configure(RetryPolicy(max_attempts=1))
+        limiter = get_concurrency_limiter()
+        limiter.configure(ConcurrencyPolicy(enabled=True, initial_limit=8, backoff_ratio=0.5))
+        request = httpx.Request("POST", "https://test-instance-be.glean.com/rest/api/v1/tools/call")
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = GleanError(
+                "Too many requests", httpx.Response(429, request=request)
+            )
+            mock_pooled_client.return_value = mock_client
+
+            run_tool("Test Tool", {})
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_retried_rate_limiting_backs_off(self) -> None:
+        """Test that a 429 shrinks the limit even when the retry succeeds."""
+        get_retrier().configure(RetryPolicy(max_attempts=2, base_delay=0))
+        limiter = get_concurrency_limiter()
+        limiter.configure(ConcurrencyPolicy(enabled=True, initial_limit=8, backoff_ratio=0.5))
+        request = httpx.Request("POST", "https://test-instance-be.glean.com/rest/api/v1/tools/call")
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = [
+                GleanError("Too many requests", httpx.Response(429, request=request)),
+                {},
+            ]
+            mock_pooled_client.return_value = mock_client
+
+            assert run_tool("Test Tool", {}) == {"result": {}}
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+
+class TestRunToolHedging:
+    """Test hedged requests for opted-in tools."""
+
+    def test_run_tool_hedges_slow_search(self) -> None:
+        """Test that a slow request to an opted-in tool is answered by the hedge."""
+        get_hedger().configure(
+            HedgePolicy(tools=frozenset({"Glean Search"}), delay=0.02, max_hedge_ratio=1.0)
+        )
+        calls = []
+
+        def run(**kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.5)
+            return {"request": len(calls)}
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = run
+            mock_pooled_client.return_value = mock_client
+
+            start = time.monotonic()
+            result = run_tool("Glean Search", {})
+
+        assert result == {"result": {"request": 2}}
+        assert time.monotonic() - start < 0.4
+        assert get_hedger().stats.hedge_wins == 1
+
+
+class TestRunToolCache:
+    """Test run_tool with the result cache enabled."""
+
+    def test_run_tool_serves_repeated_calls_from_cache(self) -> None:
+        """Test that identical calls only reach the backend once."""
+        get_result_cache().configure(CachePolicy(ttls={"Test Tool": 60}))
+        mock_result = {"documents": [{"title": "Test Document"}]}
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.return_value = mock_result
+            mock_pooled_client.return_value = mock_client
+
+            query = models.ToolsCallParameter(name="query", value="q")
+            first = run_tool("Test Tool", {"query": query})
+            second = run_tool("Test Tool", {"query": query.model_copy()})
+
+        assert first == second == {"result": mock_result}
+        mock_client.client.tools.run.assert_called_once()
+        assert get_result_cache().stats.hits == 1
+
+    def test_run_tool_serves_stale_result_while_refreshing(self) -> None:
+        """Test that a stale result is returned at once and refreshed in the background."""
+        get_result_cache().configure(
+            CachePolicy(ttls={"Test Tool": 0.05}, stale_ttls={"Test Tool": 60})
+        )
+        refreshed = threading.Event()
+
+        def run(**kwargs):
+            if mock_client.client.tools.run.call_count > 1:
+                refreshed.wait(1)
+                return {"version": 2}
+            return {"version": 1}
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = run
+            mock_pooled_client.return_value = mock_client
+
+            assert run_tool("Test Tool", {}) == {"result": {"version": 1}}
+            time.sleep(0.1)
+            assert run_tool("Test Tool", {}) == {"result": {"version": 1}}
+            assert run_tool("Test Tool", {}) == {"result": {"version": 1}}
+            refreshed.set()
+            for _ in range(100):
+                if run_tool("Test Tool", {}) == {"result": {"version": 2}}:
+                    break
+                time.sleep(0.01)
+
+        assert run_tool("Test Tool", {}) == {"result": {"version": 2}}
+        assert mock_client.client.tools.run.call_count == 2
+
+    async def test_run_tool_async_serves_stale_result_while_refreshing(self) -> None:
+        """Test stale-while-revalidate on the async path."""
+        get_result_cache().configure(
+            CachePolicy(ttls={"Test Tool": 0.05}, stale_ttls={"Test Tool": 60})
+        )
+        versions = iter([{"version": 1}, {"version": 2}])
+
+        async def run_async(**kwargs):
+            return next(versions)
+
+        with patch("glean.agent_toolkit.tools._common.pooled_async_client") as mock_pooled:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run_async.side_effect = run_async
+            mock_pooled.return_value = mock_client
+
+            assert await run_tool_async("Test Tool", {}) == {"result": {"version": 1}}
+            await asyncio.sleep(0.1)
+            assert await run_tool_async("Test Tool", {}) == {"result": {"version": 1}}
+            await asyncio.sleep(0.01)
+            assert await run_tool_async("Test Tool", {}) == {"result": {"version": 2}}
+
+        assert get_result_cache().stats.stale_hits == 1
+
+    def test_run_tool_caches_deterministic_errors(self) -> None:
+        """Test that a repeated invalid call is answered from the cache."""
+        get_result_cache().configure(CachePolicy(error_ttl=60))
+        request = httpx.Request("POST", "https://test-instance-be.glean.com/rest/api/v1/tools/call")
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = GleanError(
+                "Invalid parameter", httpx.Response(400, request=request)
+            )
+            mock_pooled_client.return_value = mock_client
+
+            invalid = {"query": models.ToolsCallParameter(name="query", value="q")}
+            first = run_tool("Test Tool", invalid)
+            second = run_tool("Test Tool", invalid)
+            run_tool("Test Tool", {"query": models.ToolsCallParameter(name="query", value="other")})
+
+        assert first == second
+        assert first["error"].startswith("Invalid parameter")
+        assert mock_client.client.tools.run.call_count == 2
+        assert get_result_cache().stats.negative_hits == 1
+
+    def test_run_tool_does_not_cache_transient_errors(self) -> None:
+        """Test that rate limiting and server errors are never negatively cached."""
+        get_retrier().configure(RetryPolicy(max_attempts=1))
+        get_result_cache().configure(CachePolicy(error_ttl=60))
+        request = httpx.Request("POST", "https://test-instance-be.glean.com/rest/api/v1/tools/call")
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = [
+                GleanError("Too many requests", httpx.Response(429, request=request)),
+                GleanError("Unavailable", httpx.Response(503, request=request)),
+                {"ok": True},
+            ]
+            mock_pooled_client.return_value = mock_client
+
+            run_tool("Test Tool", {})
+            run_tool("Test Tool", {})
+            assert run_tool("Test Tool", {}) == {"result": {"ok": True}}
+
+    def test_run_tool_does_not_cache_errors(self) -> None:
+        """Test that failed calls are retried against the backend."""
+        get_result_cache().configure(CachePolicy(ttls={"Test Tool": 60}))
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = [Exception("API Error"), {"ok": True}]
+            mock_pooled_client.return_value = mock_client
+
+            assert run_tool("Test Tool", {}) == {"error": "API Error", "result": None}
+            assert run_tool("Test Tool", {}) == {"result": {"ok": True}}
+
+    def test_run_tool_cache_is_scoped_to_credentials(self) -> None:
+        """Test that cached results aren't shared between API tokens."""
+        get_result_cache().configure(CachePolicy(ttls={"Test Tool": 60}))
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = [{"user": "a"}, {"user": "b"}]
+            mock_pooled_client.return_value = mock_client
+
+            with patch.dict(os.environ, {"GLEAN_API_TOKEN": "token-a"}):
+                first = run_tool("Test Tool", {})
+            with patch.dict(os.environ, {"GLEAN_API_TOKEN": "token-b"}):
+                second = run_tool("Test Tool", {})
+
+        assert first == {"result": {"user": "a"}}
+        assert second == {"result": {"user": "b"}}
+
+    def test_run_tool_uncached_tool_always_calls_backend(self) -> None:
+        """Test that tools without a TTL bypass the cache."""
+        get_result_cache().configure(CachePolicy(ttls={"Other Tool": 60}))
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.return_value = {"ok": True}
+            mock_pooled_client.return_value = mock_client
+
+            run_tool("Test Tool", {})
+            run_tool("Test Tool", {})
+
+        assert mock_client.client.tools.run.call_count == 2
+
+    async def test_run_tool_async_uses_cache(self) -> None:
+        """Test that the async path shares the result cache."""
+        get_result_cache().configure(CachePolicy(ttls={"Test Tool": 60}))
+
+        with patch("glean.agent_toolkit.tools._common.pooled_async_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run_async = mock.AsyncMock(return_value={"ok": True})
+            mock_pooled_client.return_value = mock_client
+
+            assert await run_tool_async("Test Tool", {}) == {"result": {"ok": True}}
+            assert await run_tool_async("Test Tool", {}) == {"result": {"ok": True}}
+
+        mock_client.client.tools.run_async.assert_awaited_once()
+
+
+class TestRunToolSingleFlight:
+    """Test coalescing of identical in-flight calls."""
+
+    def test_run_tool_coalesces_concurrent_identical_calls(self) -> None:
+        """Test that concurrent identical calls share one backend request."""
+        release = threading.Event()
+        entered = threading.Event()
+
+        def slow_run(**kwargs):
+            entered.set()
+            release.wait(timeout=5)
+            return {"ok": True}
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = slow_run
+            mock_pooled_client.return_value = mock_client
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [executor.submit(run_tool, "Test Tool", {}) for _ in range(3)]
+                entered.wait(timeout=5)
+                time.sleep(0.05)
+                release.set()
+                results = [f.result() for f in futures]
+
+        assert results == [{"result": {"ok": True}}] * 3
+        mock_client.client.tools.run.assert_called_once()
+
+    async def test_run_tool_async_coalesces_concurrent_identical_calls(self) -> None:
+        """Test that concurrent identical async calls share one backend request."""
+        async def slow_run(**kwargs):
+            await asyncio.sleep(0.05)
+            return {"ok": True}
+
+        with patch("glean.agent_toolkit.tools._common.pooled_async_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run_async = mock.AsyncMock(side_effect=slow_run)
+            mock_pooled_client.return_value = mock_client
+
+            query = models.ToolsCallParameter(name="query", value="q")
+            other = models.ToolsCallParameter(name="query", value="other")
+            results = await asyncio.gather(
+                run_tool_async("Test Tool", {"query": query}),
+                run_tool_async("Test Tool", {"query": query.model_copy()}),
+                run_tool_async("Test Tool", {"query": other}),
+            )
+
+        assert all(r == {"result": {"ok": True}} for r in results)
+        assert mock_client.client.tools.run_async.await_count == 2
+
+
+class TestRunToolDeadline:
+    """Test timeouts and deadline propagation."""
+
+    def test_deadline_bounds_http_call(self) -> None:
+        """Test that the remaining time is passed to the SDK as the request timeout."""
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.return_value = {}
+            mock_pooled_client.return_value = mock_client
+
+            with deadline(2.0):
+                run_tool("Test Tool", {})
+
+        timeout_ms = mock_client.client.tools.run.call_args.kwargs["timeout_ms"]
+        assert 1500 < timeout_ms <= 2000
+
+    def test_expired_deadline_skips_call(self) -> None:
+        """Test that no request is made once the deadline has passed."""
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            with deadline(0):
+                result = run_tool("Test Tool", {})
+
+        assert result == {"error": "Tool call 'Test Tool' timed out", "result": None}
+        mock_pooled_client.return_value.client.tools.run.assert_not_called()
+
+    def test_http_timeout_is_reported_as_timeout(self) -> None:
+        """Test that transport timeouts produce the timeout result."""
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = httpx.ReadTimeout("read timed out")
+            mock_pooled_client.return_value = mock_client
+
+            result = run_tool("Test Tool", {})
+
+        assert result == {"error": "Tool call 'Test Tool' timed out", "result": None}
+
+    async def test_deadline_bounds_async_call(self) -> None:
+        """Test that a slow async call is abandoned when the deadline passes."""
+        async def slow_run(**kwargs):
+            await asyncio.sleep(5)
+
+        with patch("glean.agent_toolkit.tools._common.pooled_async_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run_async = mock.AsyncMock(side_effect=slow_run)
+            mock_pooled_client.return_value = mock_client
+
+            start = time.monotonic()
+            with deadline(0.05):
+                result = await run_tool_async("Test Tool", {})
+
+        assert result == {"error": "Tool call 'Test Tool' timed out", "result": None}
+        assert time.monotonic() - start < 1
+
+    def test_builtin_tools_have_timeouts(self) -> None:
+        """Test that every built-in tool declares a default timeout."""
+        from glean.agent_toolkit import tools
+
+        for name in tools.__all__:
+            if not name.endswith("_async"):
+                assert getattr(tools, name).tool_spec.timeout is not None
+
+
+class TestRunTools:
+    """Test the batch APIs."""
+
+    def test_run_tools_preserves_order_and_isolates_errors(self) -> None:
+        """Test that results follow input order and one failure doesn't fail the batch."""
+        def run(name, parameters):
+            if name == "Broken":
+                raise Exception("boom")
+            time.sleep(0.05 if name == "Slow" else 0)
+            return {"tool": name}
+
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = run
+            mock_pooled_client.return_value = mock_client
+
+            results = run_tools([("Slow", {}), ("Broken", {}), ("Fast", {})])
+
+        assert [r.tool_display_name for r in results] == ["Slow", "Broken", "Fast"]
+        assert results[0].result == {"tool": "Slow"}
+        assert results[0].error is None
+        assert results[0].latency >= 0.05
+        assert results[1].response == {"error": "boom", "result": None}
+        assert results[1].error == "boom"
+        assert results[2].result == {"tool": "Fast"}
+
+    def test_run_tools_respects_concurrency_cap(self) -> None:
+        """Test that no more than max_concurrency calls run at once."""
+        lock = threading.Lock()
+        active = peak = 0
+
+        def run(name, parameters):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {}
+
+        calls = [("Test Tool", {"n": models.ToolsCallParameter(name="n", value=str(i))})
+                 for i in range(8)]
+        with patch("glean.agent_toolkit.tools._common.pooled_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run.side_effect = run
+            mock_pooled_client.return_value = mock_client
+
+            results = run_tools(calls, max_concurrency=2)
+
+        assert len(results) == 8
+        assert peak == 2
+
+    def test_run_tools_empty_and_invalid(self) -> None:
+        """Test empty batches and invalid concurrency caps."""
+        assert run_tools([]) == []
+        with pytest.raises(ValueError, match="max_concurrency"):
+            run_tools([("Test Tool", {})], max_concurrency=0)
+
+    async def test_run_tools_async_preserves_order_and_isolates_errors(self) -> None:
+        """Test the async batch API."""
+        active = peak = 0
+
+        async def run(name, parameters):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02 if name == "Slow" else 0)
+            active -= 1
+            if name == "Broken":
+                raise Exception("boom")
+            return {"tool": name}
+
+        with patch("glean.agent_toolkit.tools._common.pooled_async_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run_async = mock.AsyncMock(side_effect=run)
+            mock_pooled_client.return_value = mock_client
+
+            results = await run_tools_async(
+                [("Slow", {}), ("Broken", {}), ("Fast", {})], max_concurrency=2
+            )
+
+        assert [r.tool_display_name for r in results] == ["Slow", "Broken", "Fast"]
+        assert results[0].result == {"tool": "Slow"}
+        assert results[1].error == "boom"
+        assert results[2].result == {"tool": "Fast"}
+        assert peak == 2
+
+
+class TestRunToolAsync:
+    """Test run_tool_async function."""
+
+    async def test_run_tool_async_success(self) -> None:
+        """Test successful async tool execution."""
+        mock_result = {"documents": [{"title": "Test Document"}]}
+        parameters = {
+            "query": models.ToolsCallParameter(name="query", value="test query")
+        }
+
+        with patch("glean.agent_toolkit.tools._common.pooled_async_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run_async = mock.AsyncMock(return_value=mock_result)
+            mock_pooled_client.return_value = mock_client
+
+            result = await run_tool_async("Test Tool", parameters)
+
+            assert result == {"result": mock_result}
+            mock_client.client.tools.run_async.assert_awaited_once_with(
+                name="Test Tool",
+                parameters=parameters
+            )
+
+    async def test_run_tool_async_api_error(self) -> None:
+        """Test async tool execution with API error."""
+        parameters = {
+            "query": models.ToolsCallParameter(name="query", value="test query")
+        }
+
+        with patch("glean.agent_toolkit.tools._common.pooled_async_client") as mock_pooled_client:
+            mock_client = mock.MagicMock()
+            mock_client.client.tools.run_async = mock.AsyncMock(side_effect=Exception("API Error"))
+            mock_pooled_client.return_value = mock_client
+
+            result = await run_tool_async("Test Tool", parameters)
+
+            assert result == {"error": "API Error", "result": None}
+
+    async def test_run_tool_async_missing_credentials(self) -> None:
+        """Test async tool execution without credentials."""
+        with patch.dict(os.environ, {}, clear=True):
+            result = await run_tool_async("Test Tool", {})
+
+        assert result["result"] is None
+        assert "GLEAN_API_TOKEN and GLEAN_INSTANCE" in result["error"]
+
+    async def test_pooled_async_client_reuses_client(self) -> None:
+        """Test that async calls on one event loop share a client."""
+        assert pooled_async_client() is pooled_async_client()
+
+    def test_builtin_tools_have_async_variants(self) -> None:
+        """Test that every built-in tool registers a native coroutine variant."""
+        from glean.agent_toolkit import tools
+
+        for name in tools.__all__:
+            if name.endswith("_async"):
+                continue
+            tool = getattr(tools, name)
+            async_tool = getattr(tools, f"{name}_async")
+            assert tool.tool_spec.async_function is async_tool
+            assert inspect.iscoroutinefunction(async_tool)
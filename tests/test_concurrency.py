@@ -0,0 +1,171 @@
+"""Tests for adaptive concurrency limiting."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from glean.agent_toolkit.runtime.concurrency import (
+    AdaptiveLimiter,
+    ConcurrencyPolicy,
+    get_concurrency_limiter,
+    is_overload,
+)
+from glean.api_client.errors import GleanError
+
+
+def http_error(status_code: int) -> GleanError:
+    """Build an SDK error for an HTTP response."""
+    request = httpx.Request("POST", "https://test-instance-be.glean.com/rest/api/v1/tools/call")
+    return GleanError(f"HTTP {status_code}", httpx.Response(status_code, request=request))
+
+
+@pytest.mark.parametrize(
+    ("exc", "overload"),
+    [
+        (None, False),
+        (http_error(429), True),
+        (http_error(503), False),
+        (TimeoutError(), True),
+        (httpx.ReadTimeout("slow"), True),
+        (ValueError(), False),
+    ],
+)
+def test_is_overload(exc: BaseException | None, overload: bool) -> None:
+    """Test which outcomes shrink the limit."""
+    assert is_overload(exc) is overload
+
+
+def test_disabled_by_default() -> None:
+    """Test that the default policy never makes callers wait."""
+    limiter = AdaptiveLimiter()
+    assert all(limiter.acquire(timeout=0) for _ in range(1000))
+    assert limiter.in_flight == 0
+
+
+def test_limit_caps_in_flight_calls() -> None:
+    """Test that callers over the limit wait and time out."""
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(enabled=True, initial_limit=2))
+
+    assert limiter.acquire()
+    assert limiter.acquire()
+    assert not limiter.acquire(timeout=0.01)
+
+    stats = limiter.stats
+    assert (stats.limit, stats.in_flight, stats.queue_depth, stats.rejected) == (2, 2, 0, 1)
+
+
+def test_release_hands_permit_to_waiter_in_order() -> None:
+    """Test that queued callers are served first-in, first-out."""
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(enabled=True, initial_limit=1))
+    assert limiter.acquire()
+    order = []
+
+    def wait(n: int) -> None:
+        assert limiter.acquire(timeout=5)
+        order.append(n)
+        limiter.release()
+
+    threads = []
+    for n in range(3):
+        thread = threading.Thread(target=wait, args=(n,))
+        thread.start()
+        threads.append(thread)
+        while limiter.queue_depth < n + 1:
+            time.sleep(0.001)
+
+    limiter.release()
+    for thread in threads:
+        thread.join()
+
+    assert order == [0, 1, 2]
+    assert limiter.in_flight == 0
+
+
+def test_limit_grows_additively_when_latency_is_stable() -> None:
+    """Test that successful, busy calls grow the limit by about one per window."""
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(enabled=True, initial_limit=4, max_limit=5))
+
+    for _ in range(4):
+        assert limiter.acquire()
+    for _ in range(4):
+        limiter.release(latency=0.1)
+    assert limiter.limit == 4
+
+    for _ in range(10):
+        for _ in range(4):
+            limiter.acquire()
+        for _ in range(4):
+            limiter.release(latency=0.1)
+    assert limiter.limit == 5
+
+
+
+def test_limit_holds_when_latency_rises() -> None:
+    """Test that the limit stops growing when latency exceeds the tolerance."""
+    limiter = AdaptiveLimiter(
+        ConcurrencyPolicy(enabled=True, initial_limit=2, latency_tolerance=2.0)
+    )
+    limiter.acquire()
+    limiter.release(latency=0.1)
+    before = limiter._limit
+
+    limiter.acquire()
+    limiter.release(latency=1.0)
+
+    assert limiter._limit == before
+
+
+def test_limit_backs_off_multiplicatively() -> None:
+    """Test that overload signals shrink the limit down to the minimum."""
+    limiter = AdaptiveLimiter(
+        ConcurrencyPolicy(enabled=True, initial_limit=16, min_limit=3, backoff_ratio=0.5)
+    )
+
+    limiter.acquire()
+    limiter.release(latency=0.1, exc=http_error(429))
+    assert limiter.limit == 8
+    limiter.acquire()
+    limiter.release(latency=5.0, exc=TimeoutError())
+    assert limiter.limit == 4
+    limiter.acquire()
+    limiter.release(exc=TimeoutError())
+    assert limiter.limit == 3
+
+
+async def test_acquire_async_waits_on_event_loop() -> None:
+    """Test async waiting, timeouts and hand-off from another task."""
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(enabled=True, initial_limit=1))
+    assert await limiter.acquire_async()
+    assert not await limiter.acquire_async(timeout=0.01)
+
+    waiter = asyncio.create_task(limiter.acquire_async(timeout=5))
+    await asyncio.sleep(0.01)
+    assert limiter.queue_depth == 1
+    limiter.release()
+
+    assert await waiter
+    assert limiter.in_flight == 1
+
+
+async def test_cancelled_waiter_leaves_queue() -> None:
+    """Test that a cancelled async waiter doesn't leak a permit."""
+    limiter = AdaptiveLimiter(ConcurrencyPolicy(enabled=True, initial_limit=1))
+    assert await limiter.acquire_async()
+
+    waiter = asyncio.create_task(limiter.acquire_async())
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.queue_depth == 0
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+def test_global_concurrency_limiter() -> None:
+    """Test that the global limiter is a singleton."""
+    assert get_concurrency_limiter() is get_concurrency_limiter()
@@ -0,0 +1,72 @@
+"""Tests for deadline propagation."""
+
+import asyncio
+import contextvars
+import threading
+
+from glean.agent_toolkit.runtime.deadline import deadline, remaining
+
+
+def test_remaining_without_deadline() -> None:
+    """Test that no deadline is set by default."""
+    assert remaining() is None
+
+
+def test_deadline_sets_remaining_time() -> None:
+    """Test that a deadline bounds the remaining time and is reset on exit."""
+    with deadline(5.0):
+        left = remaining()
+        assert left is not None
+        assert 4.5 < left <= 5.0
+    assert remaining() is None
+
+
+def test_nested_deadline_only_shortens() -> None:
+    """Test that an inner deadline can't extend an outer one."""
+    with deadline(1.0):
+        with deadline(10.0):
+            left = remaining()
+            assert left is not None
+            assert left <= 1.0
+        with deadline(0.5):
+            left = remaining()
+            assert left is not None
+            assert left <= 0.5
+        left = remaining()
+        assert left is not None
+        assert 0.5 < left <= 1.0
+
+
+def test_deadline_none_keeps_current() -> None:
+    """Test that a None deadline leaves the current deadline unchanged."""
+    with deadline(None):
+        assert remaining() is None
+    with deadline(2.0):
+        with deadline(None):
+            left = remaining()
+            assert left is not None
+            assert 1.5 < left <= 2.0
+
+
+def test_deadline_follows_copied_context_into_threads() -> None:
+    """Test that threads started with a copied context see the deadline."""
+    seen = []
+    with deadline(3.0):
+        ctx = contextvars.copy_context()
+    thread = threading.Thread(target=ctx.run, args=(lambda: seen.append(remaining()),))
+    thread.start()
+    thread.join()
+
+    assert seen[0] is not None and seen[0] <= 3.0
+
+
+async def test_deadline_follows_tasks() -> None:
+    """Test that tasks created inside a deadline inherit it."""
+    async def left() -> float | None:
+        return remaining()
+
+    with deadline(3.0):
+        task = asyncio.create_task(left())
+    result = await task
+    assert result is not None
+    assert result <= 3.0
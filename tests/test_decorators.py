@@ -1,9 +1,11 @@
 from unittest import mock
 
+import pytest
 from pydantic import BaseModel
 
 from glean.agent_toolkit.decorators import tool_spec
 from glean.agent_toolkit.registry import get_registry
+from glean.agent_toolkit.runtime.deadline import deadline, remaining
 
 
 class OutputModel(BaseModel):
@@ -95,3 +97,83 @@ def test_helper_methods() -> None:
     with mock.patch("glean.agent_toolkit.adapters.crewai.CrewAIAdapter") as mock_adapter:
         mock_adapter.return_value.to_tool.return_value = "crewai_tool"
         assert add.as_crewai_tool() == "crewai_tool"
+
+
+async def test_async_variant() -> None:
+    """Test registering a native coroutine variant."""
+
+    @tool_spec(name="add", description="Add two integers")
+    def add(a: int, b: int) -> int:
+        """Add two integers."""
+        return a + b
+
+    @add.async_variant
+    async def add_async(a: int, b: int) -> int:
+        """Add two integers."""
+        return a + b
+
+    assert add.tool_spec.async_function is add_async
+    assert await add_async(3, 4) == 7
+    assert add(3, 4) == 7
+
+
+def test_async_variant_requires_coroutine_function() -> None:
+    """Test that async variants must be coroutine functions."""
+    @tool_spec(name="add", description="Add two integers")
+    def add(a: int, b: int) -> int:
+        """Add two integers."""
+        return a + b
+
+    with pytest.raises(TypeError, match="coroutine function"):
+        add.async_variant(lambda a, b: a + b)
+
+
+async def test_timeout_bounds_each_invocation() -> None:
+    """Test that a tool timeout sets a deadline for the sync and async implementations."""
+
+    @tool_spec(name="probe", description="Report the remaining time", timeout=2.0)
+    def probe() -> float | None:
+        """Report the remaining time."""
+        return remaining()
+
+    @probe.async_variant
+    async def probe_async() -> float | None:
+        """Report the remaining time."""
+        return remaining()
+
+    assert probe.tool_spec.timeout == 2.0
+    assert 1.5 < probe() <= 2.0
+    assert 1.5 < probe.tool_spec.function() <= 2.0
+    assert probe.tool_spec.async_function is not None
+    assert 1.5 < await probe.tool_spec.async_function() <= 2.0
+    assert probe.tool_spec.async_function is probe_async
+
+    with deadline(0.5):
+        assert probe() <= 0.5
+
+    probe.tool_spec.timeout = None
+    assert probe() is None
+
+
+async def test_timeout_set_after_decoration() -> None:
+    """Test that a timeout set on a tool declared without one takes effect."""
+
+    @tool_spec(name="probe", description="Report the remaining time")
+    def probe() -> float | None:
+        """Report the remaining time."""
+        return remaining()
+
+    @probe.async_variant
+    async def probe_async() -> float | None:
+        """Report the remaining time."""
+        return remaining()
+
+    assert probe.tool_spec.timeout is None
+    assert probe() is None
+    assert await probe_async() is None
+
+    probe.tool_spec.timeout = 2.0
+    assert 1.5 < probe() <= 2.0
+    left = await probe_async()
+    assert left is not None
+    assert 1.5 < left <= 2.0
@@ -0,0 +1,255 @@
+"""Tests for the shared SQLite result cache."""
+
+import json
+import os
+import pathlib
+import sqlite3
+import subprocess
+import sys
+import threading
+import zlib
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from glean.agent_toolkit.runtime.cache import CachePolicy, ResultCache
+from glean.agent_toolkit.runtime.diskcache import SQLiteCache, decode, encode
+from glean.api_client.models.toolscallresponse import ToolsCallResponse
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_encode_round_trips_models_and_json() -> None:
+    """Test that pydantic models and plain JSON values survive a round trip."""
+    response = ToolsCallResponse(raw_response={"documents": [{"title": "Doc"}]})
+
+    assert decode(encode(response)) == response
+    assert decode(encode({"a": [1, 2]})) == {"a": [1, 2]}
+
+
+def test_decode_refuses_untrusted_models() -> None:
+    """Test that payloads naming models outside the glean package aren't loaded."""
+    payload = zlib.compress(json.dumps({"model": "os:system", "data": {}}).encode())
+
+    with pytest.raises(ValueError, match="untrusted"):
+        decode(payload)
+
+
+def test_get_returns_value_and_remaining_ttl(tmp_path: pathlib.Path) -> None:
+    """Test TTL expiry."""
+    clock = FakeClock()
+    cache = SQLiteCache(tmp_path / "cache.db", clock=clock)
+
+    assert cache.put("key", {"documents": ["a"]}, ttl=60)
+    clock.now += 20
+    assert cache.get("key") == ({"documents": ["a"]}, 40)
+
+    clock.now += 40
+    assert cache.get("key") is None
+    assert cache.purge_expired() == 1
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 0)
+
+
+def test_evicts_least_recently_used_past_max_bytes(tmp_path: pathlib.Path) -> None:
+    """Test size-based LRU eviction."""
+    clock = FakeClock()
+    size = len(encode("x" * 100))
+    cache = SQLiteCache(tmp_path / "cache.db", max_bytes=2 * size, clock=clock, touch_interval=1)
+    cache.put("a", "x" * 100, ttl=60)
+    clock.now += 1
+    cache.put("b", "y" * 100, ttl=60)
+    clock.now += 1
+    assert cache.get("a") is not None
+
+    clock.now += 1
+    cache.put("c", "z" * 100, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats.evictions == 1
+
+
+def test_reads_touch_entries_once_per_interval(tmp_path: pathlib.Path) -> None:
+    """Test that hits only write their access time once it is touch_interval old."""
+    clock = FakeClock()
+    cache = SQLiteCache(tmp_path / "cache.db", clock=clock, touch_interval=10)
+    cache.put("key", "value", ttl=60)
+
+    def accessed_at() -> float:
+        with cache._connection() as conn:
+            return conn.execute("SELECT accessed_at FROM results").fetchone()[0]
+
+    clock.now += 5
+    cache.get("key")
+    assert accessed_at() == 1000.0
+    clock.now += 5
+    cache.get("key")
+    assert accessed_at() == 1010.0
+
+
+def test_total_size_is_tracked(tmp_path: pathlib.Path) -> None:
+    """Test that the tracked size follows inserts, replacements and deletions."""
+    path = tmp_path / "cache.db"
+    cache = SQLiteCache(path)
+    cache.put("a", "x" * 100, ttl=60)
+    cache.put("b", "y", ttl=60)
+    cache.put("a", "x", ttl=60)
+    cache.invalidate("b")
+
+    assert cache.stats.bytes == len(encode("x"))
+    assert SQLiteCache(path).stats.bytes == len(encode("x"))
+
+
+def test_reopens_connections_after_fork(tmp_path: pathlib.Path) -> None:
+    """Test that a forked child doesn't use the connection it inherited."""
+    cache = SQLiteCache(tmp_path / "cache.db")
+    inherited = cache._connection()
+
+    with patch("os.getpid", return_value=os.getpid() + 1):
+        assert cache._connection() is not inherited
+        assert cache.put("key", "value", ttl=60)
+    assert cache.get("key") is not None
+
+
+def test_corrupt_entries_are_dropped(tmp_path: pathlib.Path) -> None:
+    """Test that an undecodable payload is treated as a miss and removed."""
+    cache = SQLiteCache(tmp_path / "cache.db")
+    cache.put("key", "value", ttl=60)
+    with cache._connection() as conn:
+        conn.execute("UPDATE results SET value = ?", (b"not zlib",))
+
+    assert cache.get("key") is None
+    assert cache.stats.entries == 0
+
+
+def test_corrupt_entry_in_locked_database_is_a_miss(tmp_path: pathlib.Path) -> None:
+    """Test that failing to drop a corrupt entry doesn't raise."""
+    cache = SQLiteCache(tmp_path / "cache.db")
+    cache.put("key", "value", ttl=60)
+    with cache._connection() as conn:
+        conn.execute("UPDATE results SET value = ?", (b"not zlib",))
+
+    with patch.object(cache, "invalidate", side_effect=sqlite3.OperationalError("locked")):
+        assert cache.get("key") is None
+    assert cache.stats.misses == 1
+
+
+def test_unserializable_values_are_skipped(tmp_path: pathlib.Path) -> None:
+    """Test that values that can't be stored as JSON aren't cached."""
+    cache = SQLiteCache(tmp_path / "cache.db")
+
+    assert cache.put("key", object(), ttl=60) is False
+    assert cache.get("key") is None
+
+
+def test_shared_between_processes(tmp_path: pathlib.Path) -> None:
+    """Test that a result written by another process is visible."""
+    path = tmp_path / "cache.db"
+    script = (
+        "from glean.agent_toolkit.runtime.diskcache import SQLiteCache\n"
+        f"SQLiteCache({str(path)!r}).put('key', {{'documents': ['a']}}, ttl=60)\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+    cache = SQLiteCache(path)
+    found = cache.get("key")
+    assert found is not None
+    assert found[0] == {"documents": ["a"]}
+    with cache._connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+async def test_result_cache_reads_shared_off_the_event_loop(tmp_path: pathlib.Path) -> None:
+    """Test that async lookups read the shared cache in a worker thread."""
+    policy = CachePolicy(ttls={"Glean Search": 60})
+    shared = SQLiteCache(tmp_path / "cache.db")
+    shared.put("key", {"documents": ["a"]}, ttl=60)
+    cache = ResultCache(policy, shared=shared)
+    threads = []
+    get = shared.get
+
+    def record(key: str) -> tuple[Any, float] | None:
+        threads.append(threading.current_thread())
+        return get(key)
+
+    with patch.object(shared, "get", side_effect=record):
+        assert await cache.lookup_async("key", "Glean Search") == ({"documents": ["a"]}, False)
+        assert await cache.lookup_async("key", "Glean Search") == ({"documents": ["a"]}, False)
+
+    assert threads != [] and threads[0] is not threading.current_thread()
+    assert len(threads) == 1
+    assert cache.stats.shared_hits == 1
+
+
+async def test_result_cache_writes_shared_off_the_event_loop(tmp_path: pathlib.Path) -> None:
+    """Test that async puts write the shared cache in a worker thread."""
+    shared = SQLiteCache(tmp_path / "cache.db")
+    cache = ResultCache(CachePolicy(ttls={"Glean Search": 60}), shared=shared)
+    threads = []
+    put = shared.put
+
+    def record(key: str, value: Any, ttl: float) -> bool:
+        threads.append(threading.current_thread())
+        return put(key, value, ttl)
+
+    with patch.object(shared, "put", side_effect=record):
+        assert await cache.put_async("key", "Glean Search", {"documents": ["a"]})
+        assert not await cache.put_async("other", "Unknown Tool", {"documents": ["b"]})
+
+    assert len(threads) == 1 and threads[0] is not threading.current_thread()
+    assert cache.get("key") == {"documents": ["a"]}
+    assert shared.get("key") is not None
+
+
+def test_locked_shared_cache_fails_invalidation(tmp_path: pathlib.Path) -> None:
+    """Test that a shared cache locked by another process can't be invalidated or cleared."""
+    path = tmp_path / "cache.db"
+    shared = SQLiteCache(path, busy_timeout=0.01)
+    cache = ResultCache(CachePolicy(ttls={"Glean Search": 60}), shared=shared)
+    cache.put("key", "Glean Search", {"documents": ["a"]})
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            shared.invalidate("key")
+        with pytest.raises(sqlite3.OperationalError):
+            shared.purge_expired()
+
+        assert cache.invalidate("key") is False
+        assert len(cache) == 0
+        assert cache.clear() is False
+    finally:
+        other.rollback()
+        other.close()
+
+    assert cache.get("key") == {"documents": ["a"]}
+    assert cache.invalidate("key") is True
+    assert cache.clear() is True
+    assert shared.get("key") is None
+
+
+def test_result_cache_falls_through_to_shared(tmp_path: pathlib.Path) -> None:
+    """Test that local misses are answered from, and writes go to, the shared cache."""
+    policy = CachePolicy(ttls={"Glean Search": 60})
+    writer = ResultCache(policy, shared=SQLiteCache(tmp_path / "cache.db"))
+    reader = ResultCache(policy, shared=SQLiteCache(tmp_path / "cache.db"))
+
+    assert writer.put("key", "Glean Search", {"documents": ["a"]})
+    assert reader.get("key") == {"documents": ["a"]}
+    assert reader.get("key") == {"documents": ["a"]}
+    stats = reader.stats
+    assert (stats.hits, stats.shared_hits, stats.entries) == (2, 1, 1)
+
+    writer.invalidate("key")
+    reader.configure(policy, shared=reader.shared)
+    assert reader.get("key") is None
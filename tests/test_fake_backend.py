@@ -0,0 +1,156 @@
+"""Tests for the in-process fake Glean backend."""
+
+import asyncio
+import pathlib
+import time
+
+import httpx
+import pytest
+
+from glean.agent_toolkit.runtime.credentials import Credentials
+from glean.agent_toolkit.runtime.pool import PoolLimits, get_client_pool
+from glean.agent_toolkit.runtime.retry import RetryPolicy, get_retrier
+from glean.agent_toolkit.testing import FakeGleanBackend, ToolProfile
+from glean.agent_toolkit.tools._common import run_tool, run_tool_async
+from glean.api_client import models
+
+CASSETTES_DIR = pathlib.Path(__file__).parent / "cassettes"
+
+CREDENTIALS = Credentials("test-instance", "test-token")
+
+
+def _install(backend: FakeGleanBackend) -> None:
+    get_client_pool().configure(PoolLimits(), backend.transport_config())
+
+
+def test_run_tool_against_fake_backend() -> None:
+    """Test that run_tool gets the canned response for the tool."""
+    backend = FakeGleanBackend(
+        {"Glean Search": lambda parameters: {"query": parameters["query"]["value"]}}
+    )
+    _install(backend)
+
+    response = run_tool(
+        "Glean Search",
+        {"query": models.ToolsCallParameter(name="query", value="holidays")},
+        CREDENTIALS,
+    )
+
+    assert response["result"].raw_response == {"query": "holidays"}
+    assert backend.stats.requests == {"Glean Search": 1}
+
+
+def test_unknown_tool_is_rejected() -> None:
+    """Test that tools without a canned response get a client error."""
+    backend = FakeGleanBackend()
+    _install(backend)
+
+    response = run_tool("Glean Search", {}, CREDENTIALS)
+
+    assert response["result"] is None
+    assert backend.stats.rejected == 1
+
+
+def test_injected_errors_and_throttling() -> None:
+    """Test that error and throttle rates produce 500s and 429s with Retry-After."""
+    backend = FakeGleanBackend(
+        {"Glean Search": {}},
+        profiles={"Glean Search": ToolProfile(throttle_rate=1.0, retry_after=3)},
+        default_profile=ToolProfile(error_rate=1.0),
+    )
+    backend.set_response("Code Search", {})
+    client = httpx.Client(transport=backend, base_url="http://fake")
+
+    throttled = client.post("/rest/api/v1/tools/call", json={"name": "Glean Search"})
+    failed = client.post("/rest/api/v1/tools/call", json={"name": "Code Search"})
+
+    assert (throttled.status_code, throttled.headers["Retry-After"]) == (429, "3")
+    assert failed.status_code == 500
+    stats = backend.stats
+    assert (stats.throttled, stats.errors) == (1, 1)
+
+
+def test_retries_recover_from_injected_errors() -> None:
+    """Test that the toolkit's retries ride out a backend that throttles half its calls."""
+    get_retrier().configure(RetryPolicy(max_attempts=10, base_delay=0))
+    backend = FakeGleanBackend(
+        {"Glean Search": {"ok": True}},
+        default_profile=ToolProfile(throttle_rate=0.5),
+        seed=7,
+    )
+    _install(backend)
+
+    response = run_tool("Glean Search", {}, CREDENTIALS)
+
+    assert response["result"].raw_response == {"ok": True}
+
+
+async def test_latency_overlaps_for_concurrent_async_calls() -> None:
+    """Test that async calls wait on the event loop, so they overlap."""
+    backend = FakeGleanBackend(
+        {"Glean Search": {"ok": True}}, default_profile=ToolProfile(latency=0.1)
+    )
+    _install(backend)
+
+    start = time.perf_counter()
+    responses = await asyncio.gather(
+        *(
+            run_tool_async(
+                "Glean Search",
+                {"n": models.ToolsCallParameter(name="n", value=str(i))},
+                CREDENTIALS,
+            )
+            for i in range(10)
+        )
+    )
+
+    assert time.perf_counter() - start < 0.5
+    assert all(response["result"] is not None for response in responses)
+    assert backend.stats.peak_in_flight == 10
+    await get_client_pool().aclose()
+
+
+async def test_max_concurrency_throttles_excess_calls() -> None:
+    """Test that calls beyond the backend's capacity get 429s."""
+    backend = FakeGleanBackend(
+        {"Glean Search": {}}, default_profile=ToolProfile(latency=0.05), max_concurrency=2
+    )
+    async with httpx.AsyncClient(transport=backend, base_url="http://fake") as client:
+        responses = await asyncio.gather(
+            *(
+                client.post("/rest/api/v1/tools/call", json={"name": "Glean Search"})
+                for _ in range(4)
+            )
+        )
+
+    assert sorted(response.status_code for response in responses) == [200, 200, 429, 429]
+
+
+def test_latency_sampling_is_reproducible() -> None:
+    """Test that a seed makes the latency distribution deterministic."""
+    profile = ToolProfile(latency=0.2, jitter=0.5)
+    samples = [[FakeGleanBackend(seed=1)._latency(profile) for _ in range(3)] for _ in range(2)]
+
+    assert samples[0] == samples[1]
+    with pytest.raises(ValueError):
+        ToolProfile(error_rate=0.6, throttle_rate=0.6)
+
+
+def test_from_cassettes_serves_recorded_responses() -> None:
+    """Test that recorded successful responses are served per tool."""
+    backend = FakeGleanBackend.from_cassettes([CASSETTES_DIR])
+    _install(backend)
+
+    parameters = {"query": models.ToolsCallParameter(name="query", value="x")}
+    response = run_tool("Glean Search", parameters, CREDENTIALS)
+
+    assert response["result"].raw_response is not None
+
+
+def test_default_response_answers_any_tool() -> None:
+    """Test that tools without a canned response get the default response."""
+    backend = FakeGleanBackend({"Glean Search": {"tool": "search"}}, default_response={})
+    _install(backend)
+
+    assert run_tool("Code Search", {}, CREDENTIALS)["result"].raw_response == {}
+    assert run_tool("Glean Search", {}, CREDENTIALS)["result"].raw_response == {"tool": "search"}
@@ -0,0 +1,226 @@
+"""Tests for hedged requests."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from glean.agent_toolkit.runtime.deadline import deadline, remaining
+from glean.agent_toolkit.runtime.hedge import (
+    DEFAULT_MAX_WORKERS,
+    READ_ONLY_SEARCH_TOOLS,
+    Hedger,
+    HedgePolicy,
+    get_hedger,
+)
+
+
+def hedger(**kwargs) -> Hedger:
+    """Build a hedger for Glean Search that can always afford a hedge."""
+    kwargs.setdefault("tools", frozenset({"Glean Search"}))
+    kwargs.setdefault("max_hedge_ratio", 1.0)
+    return Hedger(HedgePolicy(**kwargs))
+
+
+class SlowThenFast:
+    """Request function whose first call is slow and later calls are fast."""
+
+    def __init__(self, slow: float = 0.5) -> None:
+        self.slow = slow
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self) -> str:
+        with self.lock:
+            self.calls += 1
+            n = self.calls
+        time.sleep(self.slow if n == 1 else 0)
+        return f"request {n}"
+
+
+def test_tools_not_opted_in_call_directly() -> None:
+    """Test that tools outside the policy are called inline without hedging."""
+    h = hedger()
+    thread_name = h.call("Gemini Web Search", lambda: threading.current_thread().name)
+    assert thread_name == threading.current_thread().name
+    assert h.stats.calls == 0
+
+
+def test_fast_call_is_not_hedged() -> None:
+    """Test that no hedge is sent when the first request returns in time."""
+    h = hedger(delay=0.5)
+    fn = SlowThenFast(slow=0)
+
+    assert h.call("Glean Search", fn) == "request 1"
+    assert fn.calls == 1
+    assert h.stats.hedges == 0
+
+
+def test_slow_call_is_hedged_and_hedge_wins() -> None:
+    """Test that a slow first request is hedged and the faster hedge is used."""
+    h = hedger(delay=0.02)
+    fn = SlowThenFast(slow=0.5)
+
+    start = time.monotonic()
+    assert h.call("Glean Search", fn) == "request 2"
+    assert time.monotonic() - start < 0.4
+    stats = h.stats
+    assert (stats.calls, stats.hedges, stats.hedge_wins) == (1, 1, 1)
+
+
+def test_hedge_win_records_primary_latency() -> None:
+    """Test that the delay samples the first request, not the winning hedge."""
+    h = hedger(delay=0.02)
+
+    assert h.call("Glean Search", SlowThenFast(slow=0.2)) == "request 2"
+    time.sleep(0.3)
+
+    (sample,) = h._latencies["Glean Search"]
+    assert sample >= 0.2
+
+
+def test_primary_does_not_queue_behind_hedges() -> None:
+    """Test that a saturated hedge pool doesn't delay first requests."""
+    h = hedger(delay=5)
+    release = threading.Event()
+    executor = h._get_executor()
+    blockers = [executor.submit(release.wait, 5) for _ in range(DEFAULT_MAX_WORKERS)]
+    try:
+        start = time.monotonic()
+        assert h.call("Glean Search", lambda: "ok") == "ok"
+        assert time.monotonic() - start < 1
+    finally:
+        release.set()
+        for blocker in blockers:
+            blocker.result()
+
+
+def test_calls_over_thread_cap_run_unhedged() -> None:
+    """Test that sync calls beyond max_sync_calls run directly on the caller's thread."""
+    h = hedger(delay=5, max_sync_calls=1)
+    started, release = threading.Event(), threading.Event()
+
+    def blocked() -> str:
+        started.set()
+        release.wait(5)
+        return "blocked"
+
+    caller = threading.Thread(target=h.call, args=("Glean Search", blocked))
+    caller.start()
+    try:
+        assert started.wait(5)
+        thread_name = h.call("Glean Search", lambda: threading.current_thread().name)
+        assert thread_name == threading.current_thread().name
+    finally:
+        release.set()
+        caller.join()
+    assert h.stats.calls == 1
+
+    assert h.call("Glean Search", lambda: threading.current_thread().name) == "glean-hedge-primary"
+    assert h.stats.calls == 2
+
+
+def test_hedge_falls_back_when_one_request_fails() -> None:
+    """Test that a failed request doesn't fail the call while the other may succeed."""
+    h = hedger(delay=0.01)
+    calls = []
+
+    def fn() -> str:
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(0.05)
+            return "slow success"
+        raise RuntimeError("hedge failed")
+
+    assert h.call("Glean Search", fn) == "slow success"
+
+
+def test_both_requests_failing_raises_primary_error() -> None:
+    """Test that the first request's error is raised when both fail."""
+    h = hedger(delay=0.01)
+    calls = []
+
+    def fn() -> str:
+        calls.append(1)
+        n = len(calls)
+        time.sleep(0.05 if n == 1 else 0)
+        raise RuntimeError(f"request {n} failed")
+
+    with pytest.raises(RuntimeError, match="request 1 failed"):
+        h.call("Glean Search", fn)
+
+
+def test_hedge_rate_is_capped() -> None:
+    """Test that at most max_hedge_ratio of calls send a hedge."""
+    h = hedger(delay=0, max_hedge_ratio=0.25)
+
+    for _ in range(8):
+        h.call("Glean Search", SlowThenFast(slow=0.01))
+
+    stats = h.stats
+    assert stats.hedges == 2
+    assert stats.throttled == 6
+
+
+def test_hedge_delay_tracks_observed_quantile() -> None:
+    """Test the fallback delay and the observed-quantile delay."""
+    h = hedger(min_samples=10, fallback_delay=2.0, quantile=0.9)
+    assert h.hedge_delay("Glean Search") == 2.0
+
+    for latency in range(1, 11):
+        h._record_latency("Glean Search", latency / 100)
+
+    assert h.hedge_delay("Glean Search") == pytest.approx(0.1)
+    assert hedger(delay=0.3).hedge_delay("Glean Search") == 0.3
+
+
+def test_requests_run_in_callers_context() -> None:
+    """Test that hedged requests see the caller's deadline."""
+    h = hedger(delay=1)
+    with deadline(5.0):
+        left = h.call("Glean Search", remaining)
+    assert left is not None and left <= 5.0
+
+
+async def test_async_hedge_cancels_loser() -> None:
+    """Test that the slower async request is cancelled once the hedge wins."""
+    h = hedger(delay=0.02)
+    cancelled = asyncio.Event()
+    calls = 0
+
+    async def fn() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "request 1"
+        return "request 2"
+
+    assert await h.call_async("Glean Search", fn) == "request 2"
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert h.stats.hedge_wins == 1
+
+
+async def test_async_fast_call_is_not_hedged() -> None:
+    """Test that a fast async request isn't hedged."""
+    h = hedger(delay=0.5)
+    calls = 0
+
+    async def fn() -> str:
+        nonlocal calls
+        calls += 1
+        return "ok"
+
+    assert await h.call_async("Glean Search", fn) == "ok"
+    assert calls == 1
+
+
+def test_default_policy_hedges_nothing() -> None:
+    """Test that hedging is opt-in."""
+    assert not any(get_hedger().hedges(name) for name in READ_ONLY_SEARCH_TOOLS)
+    assert get_hedger() is get_hedger()
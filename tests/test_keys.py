@@ -0,0 +1,71 @@
+"""Tests for tool call keys."""
+
+from glean.agent_toolkit.runtime.keys import (
+    canonical_parameters,
+    credential_scope,
+    payload_size,
+    tool_call_key,
+)
+from glean.api_client import models
+
+
+def test_canonical_parameters_orders_keys_and_drops_unset_fields() -> None:
+    """Test that equivalent parameter sets canonicalize identically."""
+    first = {
+        "query": models.ToolsCallParameter(name="query", value="holidays"),
+        "limit": models.ToolsCallParameter(name="limit", value="5"),
+    }
+    second = {
+        "limit": {"name": "limit", "value": "5"},
+        "query": {"value": "holidays", "name": "query"},
+    }
+
+    assert canonical_parameters(first) == canonical_parameters(second)
+    assert canonical_parameters(first) == {
+        "limit": {"name": "limit", "value": "5"},
+        "query": {"name": "query", "value": "holidays"},
+    }
+
+
+def test_canonical_parameters_handles_nested_items() -> None:
+    """Test canonicalization of nested parameter values."""
+    parameter = models.ToolsCallParameter(
+        name="filters",
+        value="",
+        items=[models.ToolsCallParameter(name="type", value="doc")],
+    )
+
+    assert canonical_parameters({"filters": parameter}) == {
+        "filters": {"name": "filters", "value": "", "items": [{"name": "type", "value": "doc"}]}
+    }
+
+
+def test_tool_call_key_is_stable() -> None:
+    """Test that keys depend on tool, canonical parameters and scope."""
+    params = {"query": models.ToolsCallParameter(name="query", value="holidays")}
+    same = {"query": {"name": "query", "value": "holidays"}}
+    other = {"query": models.ToolsCallParameter(name="query", value="benefits")}
+
+    key = tool_call_key("Glean Search", params, "scope")
+    assert key == tool_call_key("Glean Search", same, "scope")
+    assert key != tool_call_key("Code Search", params, "scope")
+    assert key != tool_call_key("Glean Search", other, "scope")
+    assert key != tool_call_key("Glean Search", params, "other-scope")
+
+
+def test_credential_scope_hides_token() -> None:
+    """Test that the scope differs per credentials and doesn't contain the token."""
+    scope = credential_scope("instance", "secret-token")
+
+    assert scope == credential_scope("instance", "secret-token")
+    assert scope != credential_scope("instance", "other-token")
+    assert scope != credential_scope("other-instance", "secret-token")
+    assert "secret-token" not in scope
+
+
+def test_payload_size() -> None:
+    """Test payload size estimates."""
+    assert payload_size("abc") == 3
+    assert payload_size(b"abcd") == 4
+    assert payload_size({"a": 1}) == len('{"a": 1}')
+    assert payload_size(models.ToolsCallParameter(name="q", value="v")) > 0
@@ -0,0 +1,93 @@
+"""Tests for the load generator."""
+
+import json
+
+import pytest
+
+from glean.agent_toolkit.registry import get_registry
+from glean.agent_toolkit.runtime.credentials import Credentials, use_credentials
+from glean.agent_toolkit.runtime.pool import PoolLimits, TransportConfig, get_client_pool
+from glean.agent_toolkit.runtime.singleflight import get_single_flight
+from glean.agent_toolkit.testing import FakeGleanBackend
+from glean.agent_toolkit.testing.loadgen import TimedTransport, main, percentile, run_load
+from glean.agent_toolkit.tools import glean_search  # noqa: F401  (registers the tool)
+
+PARAMETERS = {"query": {"name": "query", "value": "holidays"}}
+
+
+@pytest.fixture
+def timer() -> TimedTransport:
+    """Point the pooled clients at a timed fake backend."""
+    backend = FakeGleanBackend(default_response={"documents": []})
+    timer = TimedTransport(backend, backend)
+    get_client_pool().configure(
+        PoolLimits(),
+        TransportConfig(
+            server_url="http://fake-glean.local", transport=timer, async_transport=timer
+        ),
+    )
+    return timer
+
+
+@pytest.mark.parametrize("mode", ["sync", "threaded", "async"])
+def test_run_load_makes_the_requested_calls(timer: TimedTransport, mode: str) -> None:
+    """Test that every mode makes exactly the requested number of calls."""
+    tool_spec = get_registry().get("glean_search")
+    assert tool_spec is not None
+
+    with use_credentials(Credentials("test-instance", "test-token")):
+        report = run_load(tool_spec, PARAMETERS, mode=mode, concurrency=4, requests=20, timer=timer)
+
+    assert (report.calls, report.failures) == (20, 0)
+    assert timer.requests == 20
+    assert report.p50 <= report.p95 <= report.p99 <= report.max
+    assert report.overhead_mean is not None and report.transport_mean is not None
+
+
+def test_run_load_counts_errors_by_message() -> None:
+    """Test that failed calls are counted by their error message."""
+    get_client_pool().configure(PoolLimits(), FakeGleanBackend().transport_config())
+    tool_spec = get_registry().get("glean_search")
+    assert tool_spec is not None
+
+    with use_credentials(Credentials("test-instance", "test-token")):
+        report = run_load(tool_spec, PARAMETERS, mode="sync", requests=3)
+
+    assert report.failures == 3
+    assert len(report.errors) == 1
+    assert report.transport_mean is None
+
+
+def test_run_load_rejects_bad_arguments() -> None:
+    """Test that unknown modes and non-positive concurrency are rejected."""
+    tool_spec = get_registry().get("glean_search")
+    assert tool_spec is not None
+
+    with pytest.raises(ValueError):
+        run_load(tool_spec, PARAMETERS, mode="processes")
+    with pytest.raises(ValueError):
+        run_load(tool_spec, PARAMETERS, concurrency=0)
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    """Test the nearest-rank percentile."""
+    samples = [float(n) for n in range(1, 101)]
+
+    assert percentile(samples, 0.5) == 50.0
+    assert percentile(samples, 0.99) == 99.0
+    assert percentile(samples, 1.0) == 100.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_main_prints_json_report() -> None:
+    """Test the command line against the fake backend."""
+    lines: list[str] = []
+
+    code = main(
+        ["glean_search", "--query", "q", "--fake", "--requests", "5", "--json"], out=lines.append
+    )
+
+    report = json.loads(lines[0])
+    assert code == 0
+    assert (report["calls"], report["failures"], report["mode"]) == (5, 0, "threaded")
+    assert get_single_flight().enabled
@@ -0,0 +1,196 @@
+"""Tests for tool call metrics."""
+
+import asyncio
+import socket
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from glean.agent_toolkit.runtime.credentials import Credentials
+from glean.agent_toolkit.runtime.metrics import (
+    InMemorySink,
+    MetricsPolicy,
+    StatsDSink,
+    get_metrics_recorder,
+    measured,
+)
+from glean.agent_toolkit.runtime.pool import PoolLimits, TransportConfig, get_client_pool
+from glean.agent_toolkit.runtime.tracing import TracingPolicy, get_tool_tracer
+from glean.agent_toolkit.testing import FakeGleanBackend, ToolProfile
+from glean.agent_toolkit.tools._common import run_tool, run_tool_async
+from glean.api_client import models
+
+CREDENTIALS = Credentials("test-instance", "test-token")
+
+
+@pytest.fixture
+def sink() -> InMemorySink:
+    """Record metrics, including response sizes, into an in-memory sink."""
+    sink = InMemorySink()
+    get_metrics_recorder().configure(MetricsPolicy(sink=sink, record_sizes=True))
+    return sink
+
+
+def _install(backend: FakeGleanBackend) -> None:
+    get_client_pool().configure(PoolLimits(), backend.transport_config())
+
+
+def test_run_tool_records_latency_and_size(sink: InMemorySink) -> None:
+    """Test that successful calls are timed and their result sizes recorded."""
+    _install(FakeGleanBackend({"Glean Search": {"documents": ["a" * 300]}}))
+
+    run_tool("Glean Search", {}, CREDENTIALS)
+    parameters = {"query": models.ToolsCallParameter(name="query", value="x")}
+    run_tool("Glean Search", parameters, CREDENTIALS)
+
+    metrics = sink.snapshot("Glean Search")
+    assert metrics.calls == 2
+    assert metrics.errors == {}
+    assert metrics.in_flight == 0
+    assert metrics.latency.count == 2
+    assert metrics.size.count == 2
+    assert metrics.size.quantile(0.5) == 1024
+
+
+def test_errors_are_counted_by_class(sink: InMemorySink) -> None:
+    """Test that failures are counted by the class of their error."""
+    _install(FakeGleanBackend())
+
+    run_tool("Glean Search", {}, CREDENTIALS)
+    run_tool("Glean Search", {}, CREDENTIALS)
+
+    metrics = sink.snapshot("Glean Search")
+    assert sum(metrics.errors.values()) == 2
+    assert len(metrics.errors) == 1
+    assert metrics.size.count == 0
+
+
+async def test_in_flight_gauge_tracks_concurrent_calls(sink: InMemorySink) -> None:
+    """Test that concurrent async calls show up in the in-flight gauge."""
+    _install(FakeGleanBackend({"Glean Search": {}}, default_profile=ToolProfile(latency=0.05)))
+
+    await asyncio.gather(
+        *(
+            run_tool_async(
+                "Glean Search",
+                {"n": models.ToolsCallParameter(name="n", value=str(i))},
+                CREDENTIALS,
+            )
+            for i in range(5)
+        )
+    )
+
+    metrics = sink.snapshot("Glean Search")
+    assert (metrics.calls, metrics.in_flight, metrics.peak_in_flight) == (5, 0, 5)
+    assert metrics.latency.quantile(0.5) == 0.1
+    await get_client_pool().aclose()
+
+
+def test_sizes_are_not_recorded_by_default(sink: InMemorySink) -> None:
+    """Test that sizes aren't measured unless the policy asks for them."""
+    get_metrics_recorder().configure(MetricsPolicy(sink=sink))
+    _install(FakeGleanBackend({"Glean Search": {}}))
+
+    run_tool("Glean Search", {}, CREDENTIALS)
+
+    assert sink.snapshot("Glean Search").size.count == 0
+
+
+def test_traced_call_measures_size_once(sink: InMemorySink) -> None:
+    """Test that a traced call's span reuses the size measured for metrics."""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+
+    get_tool_tracer().configure(TracingPolicy(enabled=True, tracer_provider=TracerProvider()))
+    _install(FakeGleanBackend({"Glean Search": {"documents": ["a"]}}))
+
+    with (
+        patch("glean.agent_toolkit.runtime.metrics.payload_size", return_value=7) as metrics,
+        patch("glean.agent_toolkit.runtime.tracing.payload_size", return_value=7) as tracing,
+    ):
+        run_tool("Glean Search", {}, CREDENTIALS)
+
+    assert metrics.call_count == 1
+    # Tracing only measures the call's parameters.
+    assert tracing.call_count == 1
+    assert sink.snapshot("Glean Search").size.sum == 7
+
+
+def test_measured_adapter_function(sink: InMemorySink) -> None:
+    """Test that adapter invocations are labeled with the adapter and tool name."""
+
+    def search(query: str) -> list[str]:
+        if not query:
+            raise ValueError("empty query")
+        return [query]
+
+    wrapped = measured(search, "langchain", "search")
+
+    assert wrapped("x") == ["x"]
+    with pytest.raises(ValueError):
+        wrapped("")
+    metrics = sink.snapshot("search", "langchain")
+    assert metrics.calls == 2
+    assert metrics.errors == {"ValueError": 1}
+    assert sink.tools() == [("search", "langchain")]
+
+
+def test_nothing_is_recorded_without_a_sink() -> None:
+    """Test that metrics are disabled by default."""
+    recorder = get_metrics_recorder()
+
+    assert not recorder.enabled
+    assert recorder.start("Glean Search") is None
+
+
+def test_statsd_sink_sends_tagged_metrics() -> None:
+    """Test the StatsD line protocol."""
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(("127.0.0.1", 0))
+    server.settimeout(1)
+    sink = StatsDSink(*server.getsockname(), prefix="test")
+    try:
+        sink.call_started("Glean Search", "run_tool")
+        sink.call_finished("Glean Search", "run_tool", 0.25, 512, "GleanError")
+        started = server.recv(4096).decode()
+        finished = server.recv(4096).decode().splitlines()
+    finally:
+        sink.close()
+        server.close()
+
+    tags = "|#tool:glean_search,source:run_tool"
+    assert started == f"test.tool.in_flight:+1|g{tags}"
+    assert finished == [
+        f"test.tool.in_flight:-1|g{tags}",
+        f"test.tool.duration:250.000|ms{tags}",
+        f"test.tool.response_size:512|h{tags}",
+        f"test.tool.errors:1|c{tags},error_type:gleanerror",
+    ]
+
+
+def test_prometheus_sink_exports_metrics() -> None:
+    """Test that calls are exported to a Prometheus registry."""
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from glean.agent_toolkit.runtime.metrics import PrometheusSink
+
+    registry = prometheus_client.CollectorRegistry()
+    get_metrics_recorder().configure(MetricsPolicy(sink=PrometheusSink(registry=registry)))
+    transport = httpx.MockTransport(lambda request: httpx.Response(403, json={}))
+    get_client_pool().configure(
+        PoolLimits(), TransportConfig(server_url="http://stub.local", transport=transport)
+    )
+
+    run_tool("Glean Search", {}, CREDENTIALS)
+
+    labels = {"tool": "Glean Search", "source": "run_tool"}
+    assert registry.get_sample_value("glean_tool_call_duration_seconds_count", labels) == 1
+    assert registry.get_sample_value("glean_tool_calls_in_flight", labels) == 0
+    errors = [
+        sample
+        for metric in registry.collect()
+        if metric.name == "glean_tool_call_errors"
+        for sample in metric.samples
+        if sample.name == "glean_tool_call_errors_total"
+    ]
+    assert [sample.value for sample in errors] == [1]
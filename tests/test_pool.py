@@ -0,0 +1,372 @@
+"""Tests for the client pool."""
+
+import asyncio
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from glean.agent_toolkit.runtime.credentials import Credentials, use_credentials
+from glean.agent_toolkit.runtime.pool import (
+    ClientPool,
+    PoolLimits,
+    TransportConfig,
+    get_client_pool,
+)
+from glean.agent_toolkit.tools._common import run_tool
+from glean.api_client import Glean
+
+
+def _http_client(g_client: Glean) -> httpx.Client:
+    """Return the httpx client under a pooled Glean client."""
+    http_client = g_client.sdk_configuration.client
+    assert isinstance(http_client, httpx.Client)
+    return http_client
+
+
+def _async_http_client(g_client: Glean) -> httpx.AsyncClient:
+    """Return the httpx async client under a pooled Glean client."""
+    async_http_client = g_client.sdk_configuration.async_client
+    assert isinstance(async_http_client, httpx.AsyncClient)
+    return async_http_client
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_pool_reuses_client_for_same_key() -> None:
+    """Test that the same instance and token share a client."""
+    pool = ClientPool()
+    try:
+        assert pool.get("instance", "token") is pool.get("instance", "token")
+        assert len(pool) == 1
+    finally:
+        pool.close()
+
+
+def test_pool_separates_instances_and_tokens() -> None:
+    """Test that each instance and token gets its own client."""
+    pool = ClientPool()
+    try:
+        client = pool.get("instance", "token")
+        assert pool.get("other-instance", "token") is not client
+        assert pool.get("instance", "other-token") is not client
+        assert len(pool) == 3
+    finally:
+        pool.close()
+
+
+def test_pool_close_closes_http_clients() -> None:
+    """Test that close() closes the underlying HTTP clients."""
+    pool = ClientPool()
+    g_client = pool.get("instance", "token")
+    http_client = g_client.sdk_configuration.client
+
+    pool.close()
+
+    assert len(pool) == 0
+    assert isinstance(http_client, httpx.Client)
+    assert http_client.is_closed
+    assert pool.get("instance", "token") is not g_client
+    pool.close()
+
+
+def test_pool_applies_limits() -> None:
+    """Test that configured limits are passed to the HTTP client."""
+    limits = PoolLimits(max_connections=5, max_keepalive_connections=2, keepalive_expiry=1.0)
+    pool = ClientPool(limits)
+    try:
+        with patch("glean.agent_toolkit.runtime.pool.httpx.Client", wraps=httpx.Client) as mock_client:
+            pool.get("instance", "token")
+
+        _, kwargs = mock_client.call_args
+        assert kwargs["limits"] == limits.to_httpx()
+    finally:
+        pool.close()
+
+
+def test_pool_configure_replaces_clients() -> None:
+    """Test that reconfiguring limits drops existing clients."""
+    pool = ClientPool()
+    try:
+        g_client = pool.get("instance", "token")
+        pool.configure(PoolLimits(max_connections=1))
+
+        assert pool.limits.max_connections == 1
+        assert pool.get("instance", "token") is not g_client
+    finally:
+        pool.close()
+
+
+async def test_pool_get_async_reuses_client_on_loop() -> None:
+    """Test that async clients are pooled for the running event loop."""
+    pool = ClientPool()
+    try:
+        g_client = pool.get_async("instance", "token")
+        assert pool.get_async("instance", "token") is g_client
+        assert isinstance(g_client.sdk_configuration.async_client, httpx.AsyncClient)
+        assert g_client.sdk_configuration.client is pool.get("instance", "token").sdk_configuration.client
+    finally:
+        await pool.aclose()
+        pool.close()
+
+
+async def test_pool_aclose_closes_async_clients() -> None:
+    """Test that aclose() closes the async clients for the running loop."""
+    pool = ClientPool()
+    g_client = pool.get_async("instance", "token")
+    async_http_client = _async_http_client(g_client)
+
+    await pool.aclose()
+
+    assert async_http_client.is_closed
+    assert pool.get_async("instance", "token") is not g_client
+    await pool.aclose()
+    pool.close()
+
+
+def test_pool_get_async_requires_running_loop() -> None:
+    """Test that async clients can only be requested from an event loop."""
+    pool = ClientPool()
+    with pytest.raises(RuntimeError):
+        pool.get_async("instance", "token")
+
+
+def test_get_client_pool_returns_singleton() -> None:
+    """Test that get_client_pool returns the global pool."""
+    assert get_client_pool() is get_client_pool()
+
+
+def test_pool_evicts_least_recently_used_client() -> None:
+    """Test that the pool stays within max_clients by closing the LRU client."""
+    clock = FakeClock()
+    pool = ClientPool(PoolLimits(max_clients=2), clock=clock)
+    try:
+        first = pool.get("instance", "token-a")
+        clock.now += 1
+        pool.get("instance", "token-b")
+        clock.now += 1
+        assert pool.get("instance", "token-a") is first
+        clock.now += 1
+
+        pool.get("instance", "token-c")
+
+        assert len(pool) == 2
+        assert pool.get("instance", "token-a") is first
+        assert not _http_client(first).is_closed
+    finally:
+        pool.close()
+
+
+def test_pool_closes_idle_clients() -> None:
+    """Test that clients unused for longer than idle_timeout are closed."""
+    clock = FakeClock()
+    pool = ClientPool(PoolLimits(idle_timeout=60), clock=clock)
+    try:
+        idle = pool.get("instance", "token-a")
+        clock.now += 30
+        pool.get("instance", "token-b")
+        clock.now += 30
+
+        assert pool.evict_idle() == 1
+        assert len(pool) == 1
+        assert _http_client(idle).is_closed
+    finally:
+        pool.close()
+
+
+def test_pool_prefers_evicting_clients_without_leases() -> None:
+    """Test that an idle client is evicted before a busier, less recently used one."""
+    clock = FakeClock()
+    pool = ClientPool(PoolLimits(max_clients=2), clock=clock)
+    try:
+        with pool.lease("instance", "token-a"):
+            busy = pool.get("instance", "token-a")
+            clock.now += 1
+            idle = pool.get("instance", "token-b")
+            clock.now += 1
+            pool.get("instance", "token-c")
+
+            assert _http_client(idle).is_closed
+            assert not _http_client(busy).is_closed
+    finally:
+        pool.close()
+
+
+def test_pool_eviction_waits_for_in_flight_requests() -> None:
+    """Test that a tenant's request in flight survives eviction of its client."""
+    started, release = threading.Event(), threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers["authorization"] == "Bearer token-a":
+            started.set()
+            release.wait(5)
+        return httpx.Response(200, json={"rawResponse": {"ok": True}})
+
+    pool = get_client_pool()
+    pool.configure(
+        PoolLimits(max_clients=1),
+        TransportConfig(server_url="http://stub.local", transport=httpx.MockTransport(handler)),
+    )
+
+    def call(token: str) -> object:
+        with use_credentials(Credentials("instance", token)):
+            response = run_tool("Glean Search", {})
+        return response["result"].raw_response
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        in_flight = executor.submit(call, "token-a")
+        assert started.wait(5)
+        evicted = pool.get("instance", "token-a")
+        assert call("token-b") == {"ok": True}
+        assert not _http_client(evicted).is_closed
+
+        release.set()
+        assert in_flight.result() == {"ok": True}
+    assert _http_client(evicted).is_closed
+    assert len(pool) == 1
+
+
+@pytest.mark.parametrize("reset", ["configure", "close"])
+def test_pool_reset_waits_for_in_flight_requests(reset: str) -> None:
+    """Test that reconfiguring or closing the pool doesn't close a client mid-request."""
+    started, release = threading.Event(), threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        started.set()
+        release.wait(5)
+        return httpx.Response(200, json={"rawResponse": {"ok": True}})
+
+    pool = get_client_pool()
+    transport = TransportConfig(
+        server_url="http://stub.local", transport=httpx.MockTransport(handler)
+    )
+    pool.configure(PoolLimits(), transport)
+
+    def call() -> object:
+        with use_credentials(Credentials("instance", "token")):
+            response = run_tool("Glean Search", {})
+        return response["result"].raw_response
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        in_flight = executor.submit(call)
+        assert started.wait(5)
+        leased = pool.get("instance", "token")
+        if reset == "configure":
+            pool.configure(PoolLimits(max_clients=4), transport)
+        else:
+            pool.close()
+        assert len(pool) == 0
+        assert not _http_client(leased).is_closed
+
+        release.set()
+        assert in_flight.result() == {"ok": True}
+    assert _http_client(leased).is_closed
+    assert pool.get("instance", "token") is not leased
+
+
+async def test_pool_eviction_closes_async_clients() -> None:
+    """Test that evicting a tenant closes its async client on the running loop."""
+    pool = ClientPool(PoolLimits(max_clients=1))
+    try:
+        evicted = _async_http_client(pool.get_async("instance", "token-a"))
+        pool.get_async("instance", "token-b")
+        await asyncio.sleep(0)
+
+        assert evicted.is_closed
+    finally:
+        await pool.aclose()
+        pool.close()
+
+
+def _stub_handler(seen: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"rawResponse": {"ok": True}})
+
+    return handler
+
+
+def test_pool_uses_configured_server_url_and_transport() -> None:
+    """Test that calls go to the configured server through the injected transport."""
+    seen: list[httpx.Request] = []
+    pool = ClientPool(
+        transport=TransportConfig(
+            server_url="http://stub.local", transport=httpx.MockTransport(_stub_handler(seen))
+        )
+    )
+    try:
+        response = pool.get("instance", "token").client.tools.run(name="Glean Search", parameters={})
+    finally:
+        pool.close()
+
+    assert response.raw_response == {"ok": True}
+    assert seen[0].url.host == "stub.local"
+    assert seen[0].headers["authorization"] == "Bearer token"
+
+
+async def test_pool_uses_configured_async_transport() -> None:
+    """Test that async calls use the injected async transport."""
+    seen: list[httpx.Request] = []
+    pool = ClientPool(
+        transport=TransportConfig(
+            server_url="http://stub.local",
+            async_transport=httpx.MockTransport(_stub_handler(seen)),
+        )
+    )
+    try:
+        g_client = pool.get_async("instance", "token")
+        response = await g_client.client.tools.run_async(name="Glean Search", parameters={})
+    finally:
+        await pool.aclose()
+        pool.close()
+
+    assert response.raw_response == {"ok": True}
+    assert len(seen) == 1
+
+
+def test_pool_does_not_close_injected_clients() -> None:
+    """Test that pre-configured clients are shared by tenants and left open."""
+    http_client = httpx.Client()
+    pool = ClientPool(transport=TransportConfig(http_client=http_client))
+    try:
+        assert pool.get("instance", "token-a").sdk_configuration.client is http_client
+        assert pool.get("instance", "token-b").sdk_configuration.client is http_client
+        pool.configure(PoolLimits())
+        pool.close()
+
+        assert not http_client.is_closed
+        assert pool.transport == TransportConfig()
+    finally:
+        http_client.close()
+
+
+@pytest.mark.parametrize(
+    "settings", [{"http2": True}, {"proxy": "http://proxy.local:3128"}, {"verify": False}]
+)
+def test_transport_config_rejects_settings_ignored_by_custom_transports(settings: dict) -> None:
+    """Test that settings httpx would ignore next to a custom transport are refused."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+
+    with pytest.raises(ValueError, match="custom transport"):
+        TransportConfig(transport=transport, **settings)
+    with pytest.raises(ValueError, match="custom transport"):
+        TransportConfig(async_transport=transport, **settings)
+
+
+def test_transport_config_requires_h2_for_http2() -> None:
+    """Test that HTTP/2 without the h2 package fails with an install hint."""
+    if importlib.util.find_spec("h2") is not None:
+        pytest.skip("h2 is installed")
+    with pytest.raises(ImportError, match=r"agent_toolkit\[http2\]"):
+        TransportConfig(http2=True)
@@ -0,0 +1,153 @@
+"""Tests for client-side rate limiting."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from glean.agent_toolkit.runtime.ratelimit import (
+    MIN_SWEEP_SIZE,
+    RateLimit,
+    RateLimiter,
+    RateLimitPolicy,
+    TokenBucket,
+    get_rate_limiter,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rate_limit_validation() -> None:
+    """Test that rates and bursts must be positive."""
+    with pytest.raises(ValueError):
+        RateLimit(rate=0)
+    with pytest.raises(ValueError):
+        RateLimit(rate=1, burst=0)
+
+
+def test_bucket_allows_burst_then_refills() -> None:
+    """Test that a full bucket serves a burst and then refills at the rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(rate=2, burst=3), clock)
+
+    assert [bucket.reserve(0) for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve(0) is None
+
+    clock.now = 0.5
+    assert bucket.reserve(0) == 0
+    assert bucket.reserve(0) is None
+
+
+def test_bucket_reservations_queue_in_order() -> None:
+    """Test that waiting callers reserve successive tokens."""
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit(rate=10, burst=1), clock)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+    assert bucket.reserve(timeout=0.25) is None
+    bucket.refund()
+    assert bucket.reserve(timeout=0.25) == pytest.approx(0.2)
+
+
+def test_default_policy_limits_nothing() -> None:
+    """Test that calls aren't limited without a policy."""
+    limiter = RateLimiter()
+    assert all(limiter.try_acquire("scope", "Glean Search") for _ in range(100))
+
+
+def test_limits_are_per_credentials() -> None:
+    """Test that each credential scope has its own bucket."""
+    limiter = RateLimiter(RateLimitPolicy(default=RateLimit(rate=1, burst=2)), FakeClock())
+
+    assert limiter.try_acquire("a", "Glean Search")
+    assert limiter.try_acquire("a", "Employee Search")
+    assert not limiter.try_acquire("a", "Glean Search")
+    assert limiter.try_acquire("b", "Glean Search")
+
+    stats = limiter.stats
+    assert (stats.acquired, stats.rejected) == (3, 1)
+
+
+def test_per_tool_limits_apply_on_top_of_default() -> None:
+    """Test that tool limits draw from both buckets and refund on rejection."""
+    clock = FakeClock()
+    limiter = RateLimiter(
+        RateLimitPolicy(
+            default=RateLimit(rate=1, burst=2),
+            per_tool={"Gemini Web Search": RateLimit(rate=1, burst=1)},
+        ),
+        clock,
+    )
+
+    assert limiter.try_acquire("a", "Gemini Web Search")
+    assert not limiter.try_acquire("a", "Gemini Web Search")
+    assert limiter.try_acquire("a", "Glean Search")
+    assert not limiter.try_acquire("a", "Glean Search")
+
+
+def test_acquire_sleeps_for_reserved_token() -> None:
+    """Test blocking acquisition and its timeout."""
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitPolicy(default=RateLimit(rate=4, burst=1)), clock)
+
+    with patch("glean.agent_toolkit.runtime.ratelimit.time.sleep") as sleep:
+        assert limiter.acquire("a", "Glean Search")
+        assert limiter.acquire("a", "Glean Search")
+        assert not limiter.acquire("a", "Glean Search", timeout=0.1)
+
+    sleep.assert_called_once_with(pytest.approx(0.25))
+    assert limiter.stats.waited == pytest.approx(0.25)
+
+
+async def test_acquire_async_waits_without_blocking() -> None:
+    """Test async acquisition on the event loop."""
+    limiter = RateLimiter(RateLimitPolicy(default=RateLimit(rate=20, burst=1)))
+
+    start = time.monotonic()
+    assert await limiter.acquire_async("a", "Glean Search")
+    assert await limiter.acquire_async("a", "Glean Search")
+    assert time.monotonic() - start >= 0.04
+    assert not await limiter.acquire_async("a", "Glean Search", timeout=0)
+
+
+def test_configure_resets_buckets() -> None:
+    """Test that reconfiguring refills buckets."""
+    limiter = RateLimiter(RateLimitPolicy(default=RateLimit(rate=1)), FakeClock())
+    assert limiter.try_acquire("a", "Glean Search")
+    assert not limiter.try_acquire("a", "Glean Search")
+
+    limiter.configure(RateLimitPolicy(default=RateLimit(rate=1)))
+    assert limiter.try_acquire("a", "Glean Search")
+
+
+def test_refilled_buckets_are_dropped() -> None:
+    """Test that buckets of callers that went quiet don't accumulate."""
+    clock = FakeClock()
+    limiter = RateLimiter(RateLimitPolicy(default=RateLimit(rate=1, burst=1)), clock)
+    for i in range(MIN_SWEEP_SIZE):
+        assert limiter.try_acquire(f"scope-{i}", "Glean Search")
+    assert len(limiter) == MIN_SWEEP_SIZE
+
+    clock.now += 1
+    assert limiter.try_acquire("busy", "Glean Search")
+    assert len(limiter) == 1
+    assert not limiter.try_acquire("busy", "Glean Search")
+
+    for i in range(MIN_SWEEP_SIZE):
+        assert limiter.try_acquire(f"other-{i}", "Glean Search")
+    assert len(limiter) == MIN_SWEEP_SIZE + 1
+
+
+def test_global_rate_limiter() -> None:
+    """Test that the global rate limiter is a singleton."""
+    assert get_rate_limiter() is get_rate_limiter()
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 from glean.agent_toolkit.registry import Registry, get_registry
 from glean.agent_toolkit.spec import ToolSpec
 
@@ -115,3 +118,84 @@ def test_get_registry() -> None:
     registry1 = get_registry()
     registry2 = get_registry()
     assert registry1 is registry2
+
+
+def _make_spec(name: str) -> ToolSpec:
+    return ToolSpec(
+        name=name,
+        description=f"{name} tool",
+        function=lambda: None,
+        input_schema={"type": "object", "properties": {}},
+        output_schema={"type": "object"},
+    )
+
+
+def test_registry_get_runs_lazy_loader() -> None:
+    """Test that looking up a lazily registered tool runs its loader once."""
+    registry = Registry()
+    calls = []
+    spec = _make_spec("lazy")
+
+    def loader() -> None:
+        calls.append("lazy")
+        registry.register(spec)
+
+    registry.register_lazy("lazy", loader)
+
+    assert calls == []
+    assert registry.get("lazy") is spec
+    assert registry.get("lazy") is spec
+    assert calls == ["lazy"]
+
+
+def test_registry_list_runs_pending_loaders() -> None:
+    """Test that listing tools loads every pending tool."""
+    registry = Registry()
+    registry.register_lazy("first", lambda: registry.register(_make_spec("first")))
+    registry.register_lazy("second", lambda: registry.register(_make_spec("second")))
+
+    assert sorted(spec.name for spec in registry.list()) == ["first", "second"]
+    assert registry._loaders == {}
+
+
+def test_registry_register_lazy_ignores_registered_tools() -> None:
+    """Test that a loader isn't kept for a tool that is already registered."""
+    registry = Registry()
+    spec = _make_spec("eager")
+    registry.register(spec)
+    registry.register_lazy("eager", lambda: None)
+
+    assert registry._loaders == {}
+    assert registry.get("eager") is spec
+
+
+def test_registry_get_missing_lazy_tool() -> None:
+    """Test that a loader that doesn't register its tool yields None."""
+    registry = Registry()
+    registry.register_lazy("missing", lambda: None)
+
+    assert registry.get("missing") is None
+
+
+def test_builtin_tools_load_on_demand() -> None:
+    """Test that built-in tool modules are only imported when used."""
+    code = (
+        "import sys\n"
+        "import glean.agent_toolkit.tools as tools\n"
+        "from glean.agent_toolkit import get_registry\n"
+        "loaded = lambda: sorted(m.rsplit('.', 1)[1] for m in sys.modules\n"
+        "                        if m.startswith('glean.agent_toolkit.tools.'))\n"
+        "print(loaded())\n"
+        "tools.glean_search\n"
+        "print(loaded())\n"
+        "print(get_registry().get('code_search').name, loaded())\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+
+    assert output == [
+        "[]",
+        "['_common', 'glean_search']",
+        "code_search ['_common', 'code_search', 'glean_search']",
+    ]
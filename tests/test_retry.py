@@ -0,0 +1,172 @@
+"""Tests for the retry engine."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from glean.agent_toolkit.runtime.deadline import deadline
+from glean.agent_toolkit.runtime.retry import (
+    Retrier,
+    RetryBudget,
+    RetryPolicy,
+    get_retrier,
+    retry_after,
+)
+from glean.api_client.errors import GleanError
+
+
+def http_error(status_code: int, headers: dict[str, str] | None = None) -> GleanError:
+    """Build an SDK error for an HTTP response."""
+    request = httpx.Request("POST", "https://test-instance-be.glean.com/rest/api/v1/tools/call")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return GleanError(f"HTTP {status_code}", response)
+
+
+class Flaky:
+    """Callable that fails with the given errors before succeeding."""
+
+    def __init__(self, *errors: Exception) -> None:
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.fixture
+def no_sleep():
+    """Record backoff delays instead of sleeping."""
+    with patch("glean.agent_toolkit.runtime.retry.time.sleep") as sleep:
+        yield sleep
+
+
+@pytest.mark.parametrize(
+    ("exc", "retryable"),
+    [
+        (http_error(429), True),
+        (http_error(502), True),
+        (http_error(503), True),
+        (http_error(500), False),
+        (http_error(400), False),
+        (http_error(401), False),
+        (httpx.ConnectError("refused"), True),
+        (httpx.ReadTimeout("slow"), False),
+        (ValueError("bad"), False),
+    ],
+)
+def test_is_retryable(exc: Exception, retryable: bool) -> None:
+    """Test error classification."""
+    assert RetryPolicy().is_retryable(exc) is retryable
+
+
+def test_backoff_is_jittered_and_capped() -> None:
+    """Test that backoff delays stay within the exponential bound."""
+    policy = RetryPolicy(base_delay=0.1, multiplier=2.0, max_delay=0.3)
+    for retry in range(6):
+        bound = min(0.3, 0.1 * 2.0**retry)
+        assert all(0 <= policy.backoff(retry) <= bound for _ in range(50))
+
+
+def test_retry_after_parsing() -> None:
+    """Test Retry-After in seconds and as an HTTP date."""
+    assert retry_after(http_error(429, {"Retry-After": "3"})) == 3.0
+    assert retry_after(http_error(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+    assert retry_after(http_error(429, {"Retry-After": "soon"})) is None
+    assert retry_after(http_error(429)) is None
+    assert retry_after(ValueError()) is None
+
+
+def test_call_retries_transient_errors(no_sleep) -> None:
+    """Test that retryable failures are retried until success."""
+    retrier = Retrier(RetryPolicy(max_attempts=3))
+    fn = Flaky(http_error(503), http_error(502))
+
+    assert retrier.call(fn) == "ok"
+    assert fn.calls == 3
+    assert no_sleep.call_count == 2
+    assert retrier.stats.retries == 2
+
+
+def test_call_does_not_retry_permanent_errors(no_sleep) -> None:
+    """Test that non-retryable failures are raised immediately."""
+    retrier = Retrier()
+    fn = Flaky(http_error(400))
+
+    with pytest.raises(GleanError):
+        retrier.call(fn)
+    assert fn.calls == 1
+    no_sleep.assert_not_called()
+
+
+def test_call_gives_up_after_max_attempts(no_sleep) -> None:
+    """Test that the last error is raised once attempts are exhausted."""
+    retrier = Retrier(RetryPolicy(max_attempts=2))
+    fn = Flaky(http_error(503), http_error(429))
+
+    with pytest.raises(GleanError, match="HTTP 429"):
+        retrier.call(fn)
+    assert fn.calls == 2
+    assert retrier.stats.exhausted == 1
+
+
+def test_call_honors_retry_after(no_sleep) -> None:
+    """Test that Retry-After replaces the backoff delay, up to a cap."""
+    retrier = Retrier(RetryPolicy(max_retry_after=5))
+
+    assert retrier.call(Flaky(http_error(429, {"Retry-After": "2"}))) == "ok"
+    no_sleep.assert_called_once_with(2.0)
+
+    fn = Flaky(http_error(429, {"Retry-After": "60"}))
+    with pytest.raises(GleanError):
+        retrier.call(fn)
+    assert fn.calls == 1
+
+
+def test_call_does_not_retry_past_deadline(no_sleep) -> None:
+    """Test that a retry which would end after the deadline isn't attempted."""
+    retrier = Retrier()
+    fn = Flaky(http_error(429, {"Retry-After": "2"}))
+
+    with deadline(1.0), pytest.raises(GleanError):
+        retrier.call(fn)
+    assert fn.calls == 1
+
+
+def test_budget_stops_retries_during_outage(no_sleep) -> None:
+    """Test that the shared budget throttles retries when most calls fail."""
+    retrier = Retrier(RetryPolicy(max_attempts=2), RetryBudget(max_tokens=4, token_ratio=1))
+
+    outcomes = []
+    for _ in range(4):
+        fn = Flaky(http_error(503), http_error(503))
+        with pytest.raises(GleanError):
+            retrier.call(fn)
+        outcomes.append(fn.calls)
+
+    assert outcomes == [2, 1, 1, 1]
+    assert retrier.stats.throttled == 3
+
+    for _ in range(4):
+        retrier.call(Flaky())
+    assert retrier.call(Flaky(http_error(503))) == "ok"
+
+
+async def test_call_async_retries_transient_errors() -> None:
+    """Test the async retry loop."""
+    retrier = Retrier(RetryPolicy(base_delay=0))
+    fn = Flaky(http_error(503))
+
+    async def attempt() -> str:
+        return fn()
+
+    assert await retrier.call_async(attempt) == "ok"
+    assert fn.calls == 2
+
+
+def test_global_retrier() -> None:
+    """Test that the global retrier is a singleton."""
+    assert get_retrier() is get_retrier()
@@ -0,0 +1,196 @@
+"""Tests for request coalescing."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from glean.agent_toolkit.runtime.singleflight import SingleFlight, get_single_flight
+
+
+def test_do_coalesces_concurrent_calls() -> None:
+    """Test that concurrent calls with one key share a single execution."""
+    group = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fetch() -> str:
+        calls.append(1)
+        release.wait(timeout=5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(group.do, "key", fetch) for _ in range(4)]
+        deadline = time.monotonic() + 5
+        while group.coalesced < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+    assert group.coalesced == 3
+    assert group.in_flight == 0
+
+
+def test_do_shares_exceptions() -> None:
+    """Test that waiting callers receive the leader's exception."""
+    group = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail() -> None:
+        started.set()
+        release.wait(timeout=5)
+        raise RuntimeError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(group.do, "key", fail)
+        started.wait(timeout=5)
+        follower = executor.submit(group.do, "key", fail)
+        while group.coalesced < 1:
+            time.sleep(0.01)
+        release.set()
+
+        with pytest.raises(RuntimeError, match="boom"):
+            leader.result()
+        with pytest.raises(RuntimeError, match="boom"):
+            follower.result()
+
+
+def test_do_runs_sequential_calls_separately() -> None:
+    """Test that calls are only shared while in flight."""
+    group = SingleFlight()
+    calls = []
+
+    assert group.do("key", lambda: calls.append(1) or len(calls)) == 1
+    assert group.do("key", lambda: calls.append(1) or len(calls)) == 2
+    assert group.coalesced == 0
+
+
+def test_do_disabled_runs_every_call() -> None:
+    """Test that a disabled group doesn't coalesce."""
+    group = SingleFlight(enabled=False)
+    calls = []
+
+    group.do("key", lambda: calls.append(1))
+    group.do("key", lambda: calls.append(1))
+
+    assert len(calls) == 2
+
+
+async def test_do_async_coalesces_concurrent_calls() -> None:
+    """Test that concurrent coroutines with one key share a single execution."""
+    group = SingleFlight()
+    calls = []
+
+    async def fetch() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    results = await asyncio.gather(*(group.do_async("key", fetch) for _ in range(5)))
+
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert group.coalesced == 4
+    assert group.in_flight == 0
+
+
+async def test_do_async_shares_exceptions() -> None:
+    """Test that waiting coroutines receive the leader's exception."""
+    group = SingleFlight()
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        group.do_async("key", fail), group.do_async("key", fail), return_exceptions=True
+    )
+
+    assert [str(r) for r in results] == ["boom", "boom"]
+
+
+async def test_do_async_follower_cancellation_does_not_cancel_leader() -> None:
+    """Test that cancelling a waiting coroutine leaves the shared call running."""
+    group = SingleFlight()
+
+    async def fetch() -> str:
+        await asyncio.sleep(0.05)
+        return "result"
+
+    leader = asyncio.create_task(group.do_async("key", fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(group.do_async("key", fetch))
+    await asyncio.sleep(0)
+    follower.cancel()
+
+    assert await leader == "result"
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+
+
+async def test_do_async_leader_cancellation_does_not_cancel_followers() -> None:
+    """Test that a follower takes over the call when the leader is cancelled."""
+    group = SingleFlight()
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return f"result {calls}"
+
+    leader = asyncio.create_task(group.do_async("key", fetch))
+    await asyncio.sleep(0)
+    followers = [asyncio.create_task(group.do_async("key", fetch)) for _ in range(2)]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.gather(*followers) == ["result 2", "result 2"]
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert group.in_flight == 0
+    assert group.coalesced == 1
+
+
+def test_get_single_flight_returns_singleton() -> None:
+    """Test that get_single_flight returns the global group."""
+    assert get_single_flight() is get_single_flight()
+
+
+def test_do_follower_timeout() -> None:
+    """Test that a follower stops waiting after its timeout while the leader continues."""
+    group = SingleFlight()
+    release = threading.Event()
+
+    def fetch() -> str:
+        release.wait(timeout=5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(group.do, "key", fetch)
+        while group.in_flight == 0:
+            time.sleep(0.01)
+        with pytest.raises(TimeoutError):
+            group.do("key", fetch, timeout=0.05)
+        release.set()
+        assert leader.result() == "result"
+
+
+async def test_do_async_follower_timeout() -> None:
+    """Test that an async follower's timeout doesn't cancel the leader."""
+    group = SingleFlight()
+
+    async def fetch() -> str:
+        await asyncio.sleep(0.1)
+        return "result"
+
+    leader = asyncio.create_task(group.do_async("key", fetch))
+    await asyncio.sleep(0)
+    with pytest.raises(asyncio.TimeoutError):
+        await group.do_async("key", fetch, timeout=0.01)
+    assert await leader == "result"
@@ -0,0 +1,191 @@
+"""Tests for OpenTelemetry tracing of tool calls."""
+
+import inspect
+from typing import Any
+
+import httpx
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode  # noqa: E402
+
+from glean.agent_toolkit.runtime.cache import CachePolicy, get_result_cache  # noqa: E402
+from glean.agent_toolkit.runtime.credentials import Credentials  # noqa: E402
+from glean.agent_toolkit.runtime.pool import (  # noqa: E402
+    PoolLimits,
+    TransportConfig,
+    get_client_pool,
+)
+from glean.agent_toolkit.runtime.retry import RetryPolicy, get_retrier  # noqa: E402
+from glean.agent_toolkit.runtime.tracing import (  # noqa: E402
+    TracingPolicy,
+    get_tool_tracer,
+    traced,
+)
+from glean.agent_toolkit.tools._common import run_tool, run_tool_async  # noqa: E402
+from glean.api_client import models  # noqa: E402
+
+CREDENTIALS = Credentials("test-instance", "test-token")
+
+PARAMETERS = {"query": models.ToolsCallParameter(name="query", value="holidays")}
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    """Enable tracing into an in-memory exporter."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    get_tool_tracer().configure(TracingPolicy(enabled=True, tracer_provider=provider))
+    return exporter
+
+
+def _attributes(span: ReadableSpan) -> dict[str, Any]:
+    """Return a finished span's attributes."""
+    assert span.attributes is not None
+    return dict(span.attributes)
+
+
+def _serve(*statuses: int) -> list[httpx.Request]:
+    """Point the pooled clients at a stub answering with ``statuses`` in turn, then 200s."""
+    seen: list[httpx.Request] = []
+    pending = list(statuses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        status = pending.pop(0) if pending else 200
+        if status != 200:
+            return httpx.Response(status, json={"error": "failed"})
+        return httpx.Response(200, json={"rawResponse": {"documents": ["a", "b"]}})
+
+    transport = httpx.MockTransport(handler)
+    get_client_pool().configure(
+        PoolLimits(),
+        TransportConfig(
+            server_url="http://stub.local", transport=transport, async_transport=transport
+        ),
+    )
+    return seen
+
+
+def test_no_spans_or_headers_when_disabled() -> None:
+    """Test that untraced calls send no trace context."""
+    seen = _serve()
+
+    run_tool("Glean Search", PARAMETERS, CREDENTIALS)
+
+    assert not get_tool_tracer().enabled
+    assert "traceparent" not in seen[0].headers
+
+
+def test_span_per_tool_call(exporter: InMemorySpanExporter) -> None:
+    """Test the span's attributes and the propagated trace context."""
+    seen = _serve()
+
+    response = run_tool("Glean Search", PARAMETERS, CREDENTIALS)
+
+    (span,) = exporter.get_finished_spans()
+    attributes = _attributes(span)
+    assert response["result"] is not None
+    assert span.name == "glean.tools.call Glean Search"
+    assert attributes["glean.tool.display_name"] == "Glean Search"
+    assert attributes["glean.tool.parameter_count"] == 1
+    assert attributes["glean.tool.parameter_size"] > 0
+    assert attributes["glean.tool.cache_hit"] is False
+    assert attributes["glean.tool.retry_count"] == 0
+    assert attributes["glean.tool.result_size"] > 0
+    assert span.context is not None
+    trace_id = format(span.context.trace_id, "032x")
+    assert trace_id in seen[0].headers["traceparent"]
+
+
+def test_retries_and_errors_are_recorded(exporter: InMemorySpanExporter) -> None:
+    """Test that retries are counted and failures carry the error class."""
+    get_retrier().configure(RetryPolicy(max_attempts=3, base_delay=0))
+    _serve(503)
+
+    run_tool("Glean Search", PARAMETERS, CREDENTIALS)
+    _serve(400)
+    response = run_tool("Glean Search", PARAMETERS, CREDENTIALS)
+
+    retried, failed = exporter.get_finished_spans()
+    assert _attributes(retried)["glean.tool.retry_count"] == 1
+    assert response["error"]
+    assert failed.status.status_code == StatusCode.ERROR
+    assert _attributes(failed)["error.type"] not in (None, "_OTHER")
+
+
+def test_cache_hits_are_recorded(exporter: InMemorySpanExporter) -> None:
+    """Test that calls answered from the result cache are marked as hits."""
+    get_result_cache().configure(CachePolicy(default_ttl=60))
+    seen = _serve()
+
+    run_tool("Glean Search", PARAMETERS, CREDENTIALS)
+    run_tool("Glean Search", PARAMETERS, CREDENTIALS)
+
+    hits = [_attributes(span)["glean.tool.cache_hit"] for span in exporter.get_finished_spans()]
+    assert hits == [False, True]
+    assert len(seen) == 1
+
+
+async def test_async_tool_call_span(exporter: InMemorySpanExporter) -> None:
+    """Test that async calls are traced and propagate their context too."""
+    seen = _serve()
+
+    await run_tool_async("Glean Search", PARAMETERS, CREDENTIALS)
+
+    (span,) = exporter.get_finished_spans()
+    assert _attributes(span)["glean.tool.result_size"] > 0
+    assert span.context is not None
+    assert format(span.context.trace_id, "032x") in seen[0].headers["traceparent"]
+    await get_client_pool().aclose()
+
+
+def test_adapter_span_parents_tool_call(exporter: InMemorySpanExporter) -> None:
+    """Test that adapter invocations wrap the tool call spans they cause."""
+    _serve()
+
+    def search(query: str) -> dict:
+        """Search."""
+        parameters = {"query": models.ToolsCallParameter(name="query", value=query)}
+        return run_tool("Glean Search", parameters, CREDENTIALS)
+
+    wrapped = traced(search, "langchain", "glean_search")
+    wrapped(query="holidays")
+
+    call, adapter = exporter.get_finished_spans()
+    assert inspect.signature(wrapped) == inspect.signature(search)
+    assert adapter.name == "execute_tool glean_search"
+    assert _attributes(adapter)["glean.adapter"] == "langchain"
+    assert call.parent is not None
+    assert adapter.context is not None
+    assert call.parent.span_id == adapter.context.span_id
+    assert _attributes(call)["gen_ai.tool.name"] == "glean_search"
+
+
+async def test_traced_async_function(exporter: InMemorySpanExporter) -> None:
+    """Test that coroutine tools stay coroutines and get adapter spans."""
+
+    async def search(query: str) -> dict:
+        return {"result": [query], "error": None}
+
+    wrapped = traced(search, "openai", "glean_search")
+
+    assert inspect.iscoroutinefunction(wrapped)
+    assert await wrapped("x") == {"result": ["x"], "error": None}
+    (span,) = exporter.get_finished_spans()
+    assert _attributes(span)["glean.tool.result_size"] > 0
+
+
+def test_traced_function_is_untouched_when_disabled() -> None:
+    """Test that wrapped tools run without spans while tracing is disabled."""
+    wrapped = traced(lambda: 1, "crewai", "tool")
+
+    assert wrapped() == 1
+    assert not get_tool_tracer().enabled